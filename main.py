@@ -1,9 +1,15 @@
 import argparse
 import importlib
+import time
 from datetime import datetime
 from src.config import CHANNELS
 from src.scrapers import discoverScrapers
+from src.scrapers.core.channelorchestrator import ChannelOrchestrator
+from src.scrapers.core.charreplacer import CharReplacer
+from src.scrapers.core.filewriter import FileWriter
+from src.scrapers.core.httpclient import HttpClient
 from src.scrapers.core.logger import Logger
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 from dotenv import load_dotenv
 
 def loadClassFromModulePath(classPath):
@@ -20,7 +26,7 @@ def loadClassFromModulePath(classPath):
     module = importlib.import_module(moduleName)  # Import the module
     return getattr(module, className)  # Retrieve the class from the module
 
-def runScraper(channel, initialDate, daysRange, characterReplacements):
+def runScraper(channel, initialDate, daysRange, characterReplacements, outputFormats=None):
     """
     Runs the scraper for a specific TV channel.
 
@@ -28,10 +34,13 @@ def runScraper(channel, initialDate, daysRange, characterReplacements):
         channel (str): The TV channel to scrape.
         initialDate (str): The start date for scraping in YYYY-MM-DD format.
         daysRange (int): The number of days to scrape before and after the initial date.
-        characterReplacements (dict): Character replacements to apply in the data processing.
+        characterReplacements (CharReplacer): Character replacements to apply in the data processing.
+        outputFormats (list, optional): Output formats for this run, overriding the channel's
+                                        'outputFormats' setting.
 
     Returns:
-        None
+        str or None: Whether the guide files changed (see `ScraperBase.getOutputStatus`),
+                     or None if the channel has no scraper.
     """
     availableScrapers = discoverScrapers()
     scraperClass = availableScrapers.get(channel)
@@ -41,13 +50,18 @@ def runScraper(channel, initialDate, daysRange, characterReplacements):
         return
 
     channelConfiguration = CHANNELS[channel]
+    if outputFormats:
+        channelConfiguration = {**channelConfiguration, "outputFormats": outputFormats}
     urlFormatterClass = loadClassFromModulePath(channelConfiguration["urlformatter"])
     dataFetcherClass = loadClassFromModulePath(channelConfiguration["datafetcher"])
     dataProcessorClass = loadClassFromModulePath(channelConfiguration["dataprocessor"])
 
     urlFormatterInstance = urlFormatterClass()
     dataFetcherInstance = dataFetcherClass(Logger())
-    dataProcessorInstance = dataProcessorClass(channelConfiguration["timezone"])
+    dataProcessorInstance = dataProcessorClass(
+        channelConfiguration["timezone"],
+        channelConfiguration.get("targetTimezone", TimezoneConverter.DEFAULT_TARGET_TIMEZONE)
+    )
 
     scraperInstance = scraperClass(
         channelConfiguration, 
@@ -58,6 +72,66 @@ def runScraper(channel, initialDate, daysRange, characterReplacements):
 
     scraperInstance.scrapeProgramGuide(initialDate, daysRange, characterReplacements)
 
+    responseCache = getattr(dataFetcherInstance, "responseCache", None)
+    if responseCache:
+        responseCache.logStats(channel)
+
+    return scraperInstance.getOutputStatus()
+
+def isBrowserChannel(channel):
+    """
+    Checks whether a channel is fetched with a real browser (Playwright).
+
+    Args:
+        channel (str): The TV channel identifier.
+
+    Returns:
+        bool: True if the configured data fetcher requires a browser, otherwise False.
+    """
+    try:
+        dataFetcherClass = loadClassFromModulePath(CHANNELS[channel]["datafetcher"])
+    except (KeyError, ValueError, ImportError, AttributeError):
+        # Misconfigured channels fail later inside their own run, isolated from the rest
+        return False
+    return getattr(dataFetcherClass, "requiresBrowser", False)
+
+def runAllScrapers(initialDate, daysRange, characterReplacements, workers, executor, browserWorkers, outputFormats=None):
+    """
+    Runs the scrapers of every configured channel concurrently and prints a summary.
+
+    Args:
+        initialDate (str): The start date for scraping in YYYY-MM-DD format.
+        daysRange (int): The number of days to scrape before and after the initial date.
+        characterReplacements (CharReplacer): Character replacements to apply in the data processing.
+        workers (int): Maximum number of regular channels running at once.
+        executor (str): Pool type, either 'thread' or 'process'.
+        browserWorkers (int): Maximum number of browser-based channels running at once.
+        outputFormats (list, optional): Output formats for this run, overriding each channel's setting.
+
+    Returns:
+        list[dict]: The outcome of each channel, as returned by `ChannelOrchestrator.run`.
+    """
+    channels = list(CHANNELS.keys())
+    browserChannels = {channel for channel in channels if isBrowserChannel(channel)}
+    logger = Logger()
+    orchestrator = ChannelOrchestrator(runScraper, workers, executor, browserWorkers, logger)
+
+    rateLimitedChannels = [channel for channel in channels if CHANNELS[channel].get("rateLimit")]
+    if executor == "process" and workers + browserWorkers > 1 and rateLimitedChannels:
+        # Rate limiters live in each worker process, so their budgets are not shared
+        logger.logInfo(
+            f"Warning: with the 'process' executor each worker applies its own rate limit; "
+            f"hosts of {', '.join(rateLimitedChannels)} may receive up to {workers + browserWorkers} times the configured rate"
+        )
+
+    startTime = time.perf_counter()
+    results = orchestrator.run(channels, browserChannels, initialDate, daysRange, characterReplacements, outputFormats)
+    elapsed = time.perf_counter() - startTime
+
+    print(ChannelOrchestrator.formatSummary(results))
+    print(f"Total wall time: {elapsed:.2f}s")
+    return results
+
 
 def main():
     """
@@ -81,6 +155,7 @@ def main():
         "<":" "
         
     }
+    characterReplacements = CharReplacer(characterReplacements)  # Compiled once for every channel
 
     load_dotenv()
     argumentParser = argparse.ArgumentParser(description="TV Program Guide Scraper")
@@ -96,14 +171,49 @@ def main():
         "--channel", type=str, choices=list(CHANNELS.keys()) + ["all"], required=True, 
         help=f"The TV channel to scrape. Options: {', '.join(CHANNELS.keys())}, or 'all' to scrape all channels."
     )
+    argumentParser.add_argument(
+        "--workers", type=int, default=1,
+        help="Number of channels scraped at the same time when using '--channel all'"
+    )
+    argumentParser.add_argument(
+        "--executor", type=str, choices=list(ChannelOrchestrator.EXECUTORS.keys()), default="thread",
+        help="Worker pool type used when scraping all channels. With 'process', rate limits are per worker process, "
+             "so a host shared by several channels may receive up to the configured rate times the number of workers"
+    )
+    argumentParser.add_argument(
+        "--browserWorkers", type=int, default=1,
+        help="Number of browser-based (Playwright) channels scraped at the same time when using '--channel all'"
+    )
+    argumentParser.add_argument(
+        "--httpPoolSize", type=int, default=HttpClient.DEFAULT_POOL_MAX_SIZE,
+        help="Number of keep-alive HTTP connections kept open per host"
+    )
+    argumentParser.add_argument(
+        "--outputFormats", type=str, nargs="+", choices=list(FileWriter.OUTPUT_WRITERS.keys()), default=None,
+        help="Output formats of the guides, overriding the 'outputFormats' setting of each channel (default: txt)"
+    )
     
     parsedArguments = argumentParser.parse_args()
+    HttpClient.configureSession(poolMaxSize=parsedArguments.httpPoolSize)
 
     if parsedArguments.channel == "all":
-        for channel in CHANNELS.keys():
-            runScraper(channel, parsedArguments.initialDate, parsedArguments.daysRange, characterReplacements)
+        runAllScrapers(
+            parsedArguments.initialDate,
+            parsedArguments.daysRange,
+            characterReplacements,
+            parsedArguments.workers,
+            parsedArguments.executor,
+            parsedArguments.browserWorkers,
+            parsedArguments.outputFormats
+        )
     else:
-        runScraper(parsedArguments.channel, parsedArguments.initialDate, parsedArguments.daysRange, characterReplacements)
+        runScraper(
+            parsedArguments.channel,
+            parsedArguments.initialDate,
+            parsedArguments.daysRange,
+            characterReplacements,
+            parsedArguments.outputFormats
+        )
 
 
 if __name__ == "__main__":
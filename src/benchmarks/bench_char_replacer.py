@@ -0,0 +1,88 @@
+"""
+Micro-benchmark of the character replacements applied to each event written by FileWriter.
+
+Compares the previous per-event loop (two `str.replace` calls per dictionary entry and two
+`re.sub` calls) with a `CharReplacer` compiled once.
+
+Usage:
+    python -m src.benchmarks.bench_char_replacer [numberOfEvents]
+"""
+import itertools
+import re
+import sys
+import timeit
+from src.scrapers.core.charreplacer import CharReplacer
+
+CHARACTER_REPLACEMENTS = {
+    '&': 'en',
+    "'": "’",
+    "“": '"',
+    " \r\n": " ",
+    '\n': ' ',
+    '\x92': "’",
+    '\x97': '-',
+    '\x93': '"',
+    '\x94': '"',
+    "|": "-",
+    ">": " ",
+    "<": " ",
+}
+
+def buildEvents(numberOfEvents: int) -> list:
+    """
+    Builds (title, content) pairs shaped like real guide entries: one in four needs
+    several replacements, the others none.
+    """
+    return [
+        (
+            f"Tom & Jerry's Show #{index} -- Special",
+            f"In this episode \r\n Tom chases Jerry <again> | Rated \x93TV-G\x94 -- part {index}\n",
+        )
+        if index % 4 == 0 else
+        (
+            f"Noticias de la mañana {index}",
+            f"Resumen informativo con el equipo de siempre, edición número {index}",
+        )
+        for index in range(numberOfEvents)
+    ]
+
+def cleanWithLoop(events: list, charReplacements: dict):
+    """
+    Previous implementation of FileWriter.writeProgramData.
+    """
+    for title, content in events:
+        for oldChar, newChar in charReplacements.items():
+            title = title.replace(oldChar, newChar)
+            content = content.replace(oldChar, newChar)
+        title = re.sub(r'-{2,}', '-', title).strip("-")
+        content = re.sub(r'-{2,}', '-', content).strip("-")
+
+def cleanWithReplacer(events: list, charReplacer: CharReplacer):
+    """
+    Current implementation, with the replacer compiled once per run.
+    """
+    for title, content in events:
+        charReplacer.clean(title)
+        charReplacer.clean(content)
+
+def main():
+    numberOfEvents = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    events = buildEvents(numberOfEvents)
+    charReplacer = CharReplacer(CHARACTER_REPLACEMENTS)
+
+    for text in itertools.chain.from_iterable(events[:100]):
+        expected = text
+        for oldChar, newChar in CHARACTER_REPLACEMENTS.items():
+            expected = expected.replace(oldChar, newChar)
+        assert charReplacer.clean(text) == re.sub(r'-{2,}', '-', expected).strip("-")
+
+    loopTime = min(timeit.repeat(lambda: cleanWithLoop(events, CHARACTER_REPLACEMENTS), number=1, repeat=5))
+    replacerTime = min(timeit.repeat(lambda: cleanWithReplacer(events, charReplacer), number=1, repeat=5))
+
+    print(f"Events: {numberOfEvents}")
+    print(f"Loop of str.replace + re.sub: {loopTime / numberOfEvents * 1e6:.2f} us/event")
+    print(f"Compiled CharReplacer:        {replacerTime / numberOfEvents * 1e6:.2f} us/event")
+    print(f"Speed-up: {loopTime / replacerTime:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of the duplicate removal done before saving a guide.
+
+Builds a synthetic TitanTV-style input: each date is requested as overlapping windows
+of six hours every three hours, so almost every program is returned twice, and some
+copies only carry the channel's default description. Compares the previous
+`removeDuplicates` with a `DuplicateRemover` using the default settings and using the
+"richer" policy with overlap resolution.
+
+Usage:
+    python -m src.benchmarks.bench_duplicate_remover [numberOfEvents]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+import pytz
+from src.scrapers.core.duplicateremover import DuplicateRemover
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
+
+DEFAULT_DESCRIPTION = "Programación TitanTV"
+WINDOW_HOURS = 6
+WINDOW_STEP_HOURS = 3
+
+def buildData(numberOfEvents: int) -> dict:
+    """
+    Builds the processed events of overlapping TitanTV windows, grouped by date.
+    """
+    targetZone = pytz.timezone(TimezoneConverter.DEFAULT_TARGET_TIMEZONE)
+    converter = TimezoneConverter.forZones("UTC")
+    data = {}
+    count = 0
+    day = datetime(2025, 1, 1)
+    while count < numberOfEvents:
+        dateKey = day.strftime("%Y-%m-%d")
+        for windowStart in range(0, 24, WINDOW_STEP_HOURS):
+            for slot in range(WINDOW_HOURS * 2):
+                start = targetZone.localize(day + timedelta(minutes=windowStart * 60 + slot * 30))
+                eventDate, eventHour = converter.formatDateHour(start)
+                halfHour = windowStart * 2 + slot
+                # Every third program comes without synopsis in the windows starting at 0, 6, 12 and 18 h
+                withoutSynopsis = (windowStart // WINDOW_STEP_HOURS) % 2 == 0 and halfHour % 3 == 0
+                content = DEFAULT_DESCRIPTION if withoutSynopsis else f"Episode synopsis {halfHour}"
+                data.setdefault(dateKey, []).append(ProgramEvent(start, eventDate, eventHour, f"Show {halfHour}", content))
+                count += 1
+        day += timedelta(days=1)
+    return data
+
+def removeDuplicatesPrevious(data: dict) -> dict:
+    """
+    Previous implementation of `DuplicateRemover.removeDuplicates`.
+    """
+    seen = set()
+    filteredData = {}
+    for keyName, programData in data.items():
+        uniqueData = []
+        for program in programData:
+            if isinstance(program, ProgramEvent):
+                uniqueKey = (program.date, program.hour)
+            else:
+                uniqueKey = (program.get("date").strip(), program.get("hour").strip())
+            if uniqueKey not in seen:
+                seen.add(uniqueKey)
+                uniqueData.append(program)
+        if uniqueData:
+            filteredData[keyName] = uniqueData
+    return filteredData
+
+def main():
+    numberOfEvents = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = buildData(numberOfEvents)
+    numberOfEvents = sum(len(events) for events in data.values())
+    defaultRemover = DuplicateRemover()
+    richerRemover = DuplicateRemover(policy=DuplicateRemover.PREFER_RICHER, defaultDescriptions=[DEFAULT_DESCRIPTION], overlapMinutes=5)
+
+    assert defaultRemover.remove(data) == removeDuplicatesPrevious(data)
+    richerData = richerRemover.remove(data)
+    withoutSynopsis = sum(event.content == DEFAULT_DESCRIPTION for events in richerData.values() for event in events)
+
+    previousTime = min(timeit.repeat(lambda: removeDuplicatesPrevious(data), number=1, repeat=5))
+    defaultTime = min(timeit.repeat(lambda: defaultRemover.remove(data), number=1, repeat=5))
+    richerTime = min(timeit.repeat(lambda: richerRemover.remove(data), number=1, repeat=5))
+
+    print(f"Events: {numberOfEvents}, unique: {sum(len(events) for events in richerData.values())}, kept without synopsis: {withoutSynopsis}")
+    print(f"Previous removeDuplicates:          {previousTime / numberOfEvents * 1e9:.0f} ns/event")
+    print(f"DuplicateRemover, first:            {defaultTime / numberOfEvents * 1e9:.0f} ns/event ({previousTime / defaultTime:.2f}x)")
+    print(f"DuplicateRemover, richer + overlap: {richerTime / numberOfEvents * 1e9:.0f} ns/event ({previousTime / richerTime:.2f}x)")
+
+if __name__ == "__main__":
+    main()
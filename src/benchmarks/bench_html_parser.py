@@ -0,0 +1,153 @@
+"""
+Micro-benchmark of the HTML parsing done by the BeautifulSoup-based data processors.
+
+Parses a schedule page of each processor with 'html.parser' (the previous path) and
+with lxml, each with and without the processor's `SCHEDULE_STRAINER`, and checks that
+every installed backend gives the same events. Then times the cleaning of TBN's HTML
+synopses with a BeautifulSoup per row (the previous path) and with
+`HtmlParser.htmlToText`.
+
+The pages are synthetic (a schedule surrounded by navigation, scripts and a footer,
+like the real sites); saved pages can be used instead by passing a directory holding
+'<channel>.html' files (ewtn, tbn, starttv, metv, venevision).
+
+Usage:
+    python -m src.benchmarks.bench_html_parser [fixtureDirectory]
+"""
+import os
+import re
+import sys
+import timeit
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from src.scrapers.core.htmlparser import HtmlParser
+from src.scrapers.ewtn.ewtndataprocessor import EwtnDataProcessor
+from src.scrapers.metv.metvdataprocessor import MeTvDataProcessor
+from src.scrapers.starttv.starttvdataprocessor import StartTvDataProcessor
+from src.scrapers.tbn.tbndataprocessor import TbnDataProcessor
+from src.scrapers.venevision.venevisiondataprocessor import VeneVisionDataProcessor
+
+TARGET_DATE = "2025-03-01"
+NUMBER_OF_ITEMS = 96
+
+def buildPage(scheduleHtml: str) -> str:
+    """
+    Surrounds a schedule with the navigation, scripts and footer of a typical channel site.
+    """
+    navigation = "".join(f'<li class="menu-item"><a href="/section/{index}">Section {index}</a></li>' for index in range(400))
+    script = "<script>var settings = {" + ",".join(f'"key{index}": "{index}"' for index in range(300)) + "};</script>"
+    footer = "".join(f"<p class='footer-note'>Legal note {index} &amp; terms</p>" for index in range(150))
+    return (
+        f"<!DOCTYPE html><html><head><title>Schedule</title>{script}</head><body>"
+        f"<header><nav><ul>{navigation}</ul></nav></header><main>{scheduleHtml}</main>"
+        f"<footer>{footer}</footer></body></html>"
+    )
+
+def buildPages() -> dict:
+    """
+    Builds a synthetic page for each processor, with one program every 15 minutes.
+    """
+    times = [(index // 4, index % 4 * 15) for index in range(NUMBER_OF_ITEMS)]
+    hour12 = lambda hour, minute: f"{(hour % 12) or 12}:{minute:02}{'AM' if hour < 12 else 'PM'}"
+    return {
+        "ewtn": buildPage("".join(
+            f'<div class="schedule__entry"><div class="schedule__time" data-datetime="{TARGET_DATE}T{hour:02}:{minute:02}:00Z">'
+            f'{hour:02}:{minute:02}</div><div class="schedule__title">\n  Holy Mass {index}\n</div>'
+            f'<h3 class="schedule__sub-title">Episode {index}</h3><p class="schedule__description">Live from the chapel, part {index}.</p></div>'
+            for index, (hour, minute) in enumerate(times)
+        )),
+        "tbn": buildPage("<table><tbody>" + "".join(
+            f'<tr class="episode-row" data-timestamp="{TARGET_DATE}T{hour:02}:{minute:02}:00" '
+            f'data-synopsis="&lt;p&gt;Praise &amp; worship {index}&lt;/p&gt;"><td class="time-column">{hour:02}:{minute:02}</td>'
+            f'<td class="title-column"> Praise {index} </td></tr>'
+            for index, (hour, minute) in enumerate(times)
+        ) + "</tbody></table>"),
+        "starttv": buildPage("".join(
+            f'<div class="sched-item clearfix"><div class="sched-show-time">{hour12(hour, minute)}</div>'
+            f'<h1 class="hp-section-header sched-inline">Mystery {index}</h1>'
+            f'<div class="sched-show-desc"><h2>Episode {index}</h2>The detective returns.</div></div>'
+            for index, (hour, minute) in enumerate(times)
+        )),
+        "metv": buildPage("".join(
+            f'<div class="schedule-item-wrap"><span class="schedule-on-now">Now: {hour12(hour, minute)}</span>'
+            f'<div class="content-now-title-schedule">Classic {index}</div>'
+            f'<div class="schedule-entry-episode-title">Episode {index}</div>'
+            f'<div class="schedule-entry-episode-desc">A classic episode.</div></div>'
+            for index, (hour, minute) in enumerate(times)
+        )),
+        "venevision": buildPage("".join(
+            f'<div class="item"><h3 class="ml0">Novela {index}</h3>'
+            f'<p class="subtitle fs13 ptb3">01-03-2025 de {hour12(hour, minute)[:-2]} {hour12(hour, minute)[-2:]} a 11:59 PM</p>'
+            f'<p>Capítulo {index}.</p></div>'
+            for index, (hour, minute) in enumerate(times)
+        )),
+    }
+
+PROCESSORS = {
+    "ewtn": EwtnDataProcessor("UTC"),
+    "tbn": TbnDataProcessor("America/New_York"),
+    "starttv": StartTvDataProcessor("America/New_York"),
+    "metv": MeTvDataProcessor("America/New_York"),
+    "venevision": VeneVisionDataProcessor("America/Caracas"),
+}
+
+def loadPages(fixtureDirectory: str) -> dict:
+    """
+    Reads the saved pages available in a directory, falling back to the synthetic ones.
+    """
+    pages = buildPages()
+    for channel in pages:
+        pagePath = os.path.join(fixtureDirectory, f"{channel}.html")
+        if os.path.exists(pagePath):
+            with open(pagePath, encoding="utf-8") as file:
+                pages[channel] = file.read()
+    return pages
+
+def benchmarkSynopses(numberOfSynopses: int = 7 * NUMBER_OF_ITEMS):
+    """
+    Times the cleaning of a week of TBN synopses.
+    """
+    synopses = [
+        f"<p>Praise &amp; worship from <strong>Nashville</strong>,\n episode {index}.</p><p>Hosted&nbsp;live.</p>"
+        for index in range(numberOfSynopses)
+    ]
+    soupText = lambda synopsis: re.sub(r"\s+", " ", BeautifulSoup(synopsis, "html.parser").get_text(strip=True)).strip()
+    assert [HtmlParser.htmlToText(synopsis) for synopsis in synopses] == [soupText(synopsis) for synopsis in synopses]
+
+    soupTime = min(timeit.repeat(lambda: [soupText(synopsis) for synopsis in synopses], number=1, repeat=5))
+    textTime = min(timeit.repeat(lambda: [HtmlParser.htmlToText(synopsis) for synopsis in synopses], number=1, repeat=5))
+    print(f"TBN synopses ({numberOfSynopses})")
+    print(f"    {'BeautifulSoup per row':<26} {soupTime / numberOfSynopses * 1e6:7.2f} us/synopsis")
+    print(f"    {'HtmlParser.htmlToText':<26} {textTime / numberOfSynopses * 1e6:7.2f} us/synopsis ({soupTime / textTime:.2f}x)")
+
+def main():
+    pages = loadPages(sys.argv[1]) if len(sys.argv) > 1 else buildPages()
+    backends = [backend for backend in HtmlParser.PREFERRED_BACKENDS if builder_registry.lookup(backend) is not None]
+
+    for channel, page in pages.items():
+        processor = PROCESSORS[channel]
+
+        # Every installed backend must produce the same events
+        results = []
+        for backend in backends:
+            HtmlParser.setBackend(backend)
+            results.append(processor.processData(page, "Default description", TARGET_DATE))
+        HtmlParser.setBackend()
+        assert results[0] and all(result == results[0] for result in results), channel
+
+        timings = {}
+        for backend in backends:
+            timings[backend] = min(timeit.repeat(lambda: BeautifulSoup(page, backend), number=1, repeat=5))
+            timings[f"{backend} + strainer"] = min(timeit.repeat(
+                lambda: BeautifulSoup(page, backend, parse_only=processor.SCHEDULE_STRAINER), number=1, repeat=5
+            ))
+
+        previousTime = timings["html.parser"]
+        print(f"{channel} ({len(page) // 1024} KiB, {len(results[0])} events)")
+        for option, optionTime in timings.items():
+            print(f"    {option:<26} {optionTime * 1e3:7.2f} ms ({previousTime / optionTime:.2f}x)")
+
+    benchmarkSynopses()
+
+if __name__ == "__main__":
+    main()
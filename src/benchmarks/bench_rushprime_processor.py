@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of the processing of the Rush Prime CSV attachment.
+
+Builds a synthetic CSV with one program every 15 minutes (crossing both DST changes
+of the source timezone, with some incomplete and invalid rows), parses it with
+`parseRushPrimeCsv` and compares the previous row-by-row processing (`iterrows` +
+`strptime` + timezone conversion) with the vectorized `RushPrimeDataProcessor`.
+
+Usage:
+    python -m src.benchmarks.bench_rushprime_processor [numberOfRows]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.rushprime.parserushprimecsv import parseRushPrimeCsv
+from src.scrapers.rushprime.rushprimedataprocessor import RushPrimeDataProcessor
+
+SOURCE_TIMEZONE = "America/New_York"
+DEFAULT_DESCRIPTION = "Rush Prime"
+
+def buildCsv(numberOfRows: int) -> bytes:
+    """
+    Builds the content of a Rush Prime CSV attachment.
+    """
+    lines = ["Program Start Date,Program Start Time,Program Title,Program Description"]
+    firstStart = datetime(2025, 1, 1)
+    for index in range(numberOfRows):
+        start = firstStart + timedelta(minutes=15 * index)
+        date, hour = f"{start.month}/{start.day}/{start.year}", f"{start.hour}:{start.minute:02}"
+        if index % 1000 == 1:
+            hour = "25:00"  # Invalid time
+        elif index % 1000 == 2:
+            date = ""  # Incomplete row
+        description = "" if index % 5 == 0 else f"Episode {index}"
+        lines.append(f"{date},{hour},Show {index % 40},{description}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def processWithIterrows(processor: RushPrimeDataProcessor, rawData, defaultDescription: str) -> list:
+    """
+    Previous implementation of `RushPrimeDataProcessor.processData`.
+    """
+    processedEvents = []
+    for _, row in rawData.iterrows():
+        try:
+            rawDate = str(row.get("Program Start Date", "")).strip()
+            rawHour = str(row.get("Program Start Time", "")).strip()
+            eventTitle = str(row.get("Program Title", "")).strip()
+            eventContent = str(row.get("Program Description", "")).strip() or defaultDescription
+            if not rawDate or not rawHour or not eventTitle:
+                continue
+            eventStartDatetime = datetime.strptime(f"{rawDate} {rawHour}", "%m/%d/%Y %H:%M")
+            targetEventDatetime = processor.timezoneConverter.convert(eventStartDatetime)
+            eventDate, eventTime = processor.timezoneConverter.formatDateHour(targetEventDatetime)
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, eventTitle, eventContent))
+        except Exception:
+            continue
+    return processedEvents
+
+def main():
+    numberOfRows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # Empty cells are read as empty strings, so both implementations see the same values
+    rawData = parseRushPrimeCsv(buildCsv(numberOfRows)).fillna("")
+    processor = RushPrimeDataProcessor(SOURCE_TIMEZONE)
+
+    previousEvents = processWithIterrows(processor, rawData, DEFAULT_DESCRIPTION)
+    events = processor.processData(rawData, DEFAULT_DESCRIPTION, "")
+    assert events == previousEvents
+    assert [event.start for event in events] == [event.start for event in previousEvents]
+
+    previousTime = min(timeit.repeat(lambda: processWithIterrows(processor, rawData, DEFAULT_DESCRIPTION), number=1, repeat=3))
+    vectorizedTime = min(timeit.repeat(lambda: processor.processData(rawData, DEFAULT_DESCRIPTION, ""), number=1, repeat=3))
+
+    print(f"Rows: {numberOfRows}, events: {len(events)}")
+    print(f"iterrows + strptime:  {previousTime * 1e3:8.1f} ms ({previousTime / numberOfRows * 1e6:.2f} us/row)")
+    print(f"Vectorized pandas:    {vectorizedTime * 1e3:8.1f} ms ({vectorizedTime / numberOfRows * 1e6:.2f} us/row, {previousTime / vectorizedTime:.2f}x)")
+
+if __name__ == "__main__":
+    main()
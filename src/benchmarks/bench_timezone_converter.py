@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of the timezone conversion done by the data processors for each event.
+
+Compares the previous per-event path (`pytz` `localize` + `astimezone` + two `strftime`
+calls) with a `TimezoneConverter`, one event at a time and in batch.
+
+Usage:
+    python -m src.benchmarks.bench_timezone_converter [numberOfEvents]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+import pytz
+from src.scrapers.core.timezoneconverter import TimezoneConverter
+
+SOURCE_TIMEZONE = "America/New_York"
+TARGET_TIMEZONE = "America/Bogota"
+
+def buildStarts(numberOfEvents: int) -> list:
+    """
+    Builds naive start datetimes spaced like a guide: one event every 30 minutes,
+    crossing the March DST change.
+    """
+    firstStart = datetime(2025, 3, 1, 6, 0)
+    return [firstStart + timedelta(minutes=30 * index) for index in range(numberOfEvents)]
+
+def convertWithPytz(starts: list, sourceZone, targetZone) -> list:
+    """
+    Previous implementation, repeated in every data processor.
+    """
+    results = []
+    for start in starts:
+        targetStart = sourceZone.localize(start).astimezone(targetZone)
+        results.append((targetStart.strftime("%Y-%m-%d").strip(), targetStart.strftime("%H:%M").strip()))
+    return results
+
+def convertWithConverter(starts: list, converter: TimezoneConverter) -> list:
+    """
+    Current implementation, one event at a time.
+    """
+    return [converter.formatDateHour(converter.convert(start)) for start in starts]
+
+def convertBatch(starts: list, converter: TimezoneConverter) -> list:
+    """
+    Current implementation, with the batch API.
+    """
+    formatDateHour = converter.formatDateHour
+    return [formatDateHour(targetStart) for targetStart in converter.convertMany(starts)]
+
+def main():
+    numberOfEvents = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    starts = buildStarts(numberOfEvents)
+    sourceZone, targetZone = pytz.timezone(SOURCE_TIMEZONE), pytz.timezone(TARGET_TIMEZONE)
+    converter = TimezoneConverter(SOURCE_TIMEZONE, TARGET_TIMEZONE)
+
+    assert convertWithConverter(starts, converter) == convertWithPytz(starts, sourceZone, targetZone)
+
+    pytzTime = min(timeit.repeat(lambda: convertWithPytz(starts, sourceZone, targetZone), number=1, repeat=5))
+    # A new converter per repetition, so its caches start empty as in a real run
+    converterTime = min(timeit.repeat(
+        lambda: convertWithConverter(starts, TimezoneConverter(SOURCE_TIMEZONE, TARGET_TIMEZONE)), number=1, repeat=5
+    ))
+    batchTime = min(timeit.repeat(
+        lambda: convertBatch(starts, TimezoneConverter(SOURCE_TIMEZONE, TARGET_TIMEZONE)), number=1, repeat=5
+    ))
+
+    print(f"Events: {numberOfEvents}")
+    print(f"pytz localize + astimezone + strftime: {pytzTime / numberOfEvents * 1e6:.2f} us/event")
+    print(f"TimezoneConverter, per event:          {converterTime / numberOfEvents * 1e6:.2f} us/event ({pytzTime / converterTime:.2f}x)")
+    print(f"TimezoneConverter, batch:              {batchTime / numberOfEvents * 1e6:.2f} us/event ({pytzTime / batchTime:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from datetime import datetime
-import pytz
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class BeinSportsDataProcessor(IDataProcessor):
     """
@@ -11,15 +12,17 @@ class BeinSportsDataProcessor(IDataProcessor):
     processed events for a given date.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -31,7 +34,7 @@ class BeinSportsDataProcessor(IDataProcessor):
             targetDate (str): The date to filter events by, in the format 'YYYY-MM-DD'.
 
         Returns:
-            list: A list of processed events for the target date, each containing:
+            list[ProgramEvent]: A list of processed events for the target date, each containing:
                 - 'date': The event date (string in 'YYYY-MM-DD' format).
                 - 'hour': The event start time (string in 'HH:MM' format).
                 - 'title': The event title (string).
@@ -47,15 +50,11 @@ class BeinSportsDataProcessor(IDataProcessor):
             rawEventStartDate = event.get("startDate")
             eventStartDatetime = datetime.strptime(rawEventStartDate, "%Y-%m-%dT%H:%M:%S.%fZ")
 
-            # Localize the event datetime to the source timezone
-            localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-
-            # Convert the localized datetime to the target timezone
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            # Convert the event datetime from the source timezone to the target timezone
+            targetEventDatetime = self.timezoneConverter.convert(eventStartDatetime)
 
             # Get the event date and time in the desired format
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Extract event title and description
             eventTitle = event.get("title").strip()
@@ -66,11 +65,6 @@ class BeinSportsDataProcessor(IDataProcessor):
                 eventContent = eventCategory
 
             # Append the processed event to the list
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": eventTitle,
-                "content": eventContent,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, eventTitle, eventContent))
 
         return processedEvents
\ No newline at end of file
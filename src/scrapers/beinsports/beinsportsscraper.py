@@ -1,4 +1,3 @@
-from src.scrapers.core.duplicateremover import DuplicateRemover
 from src.scrapers.core.scraperbase import ScraperBase
 
 class BeinSportsScraper(ScraperBase):
@@ -22,7 +21,7 @@ class BeinSportsScraper(ScraperBase):
             None
         """
         # Generate URLs based on the provided date range
-        urls = self.urlGenerator.getDateUrls(startDate, numberOfDays)
+        urls = self.getIncrementalUrls(startDate, numberOfDays)
         defaultSynopsis = self.channelConfig['defaultDescription']
         fileName = self.channelConfig['fileName']
         filePath = self.channelConfig['outputPath']
@@ -35,14 +34,18 @@ class BeinSportsScraper(ScraperBase):
         }
 
         # Iterate over each URL and process the data
-        for url in urls:
-            dataFromUrl = self.getDataFromUrl(url)
+        for url, dataFromUrl in self.fetchAll(urls):
             if dataFromUrl:
                 dateKey = url.split("T")[1][-10:]
-                data[dateKey] = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                self.recordEvents(url, programs)
+                data[dateKey] = programs
+
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
 
         # Remove duplicates from the data
-        data = DuplicateRemover.removeDuplicates(data)
+        data = self.removeDuplicates(data)
 
         # Save the processed data
         self.saveData(fileName, data, charReplacements, filePath)
\ No newline at end of file
@@ -1,13 +1,14 @@
-import pytz
 from datetime import datetime
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class BetDataProcessor(IDataProcessor):
     """
     A data processor class that extracts, formats, and filters event details from raw data.
 
     This class processes raw event data, converts event timestamps from the source timezone
-    to the target timezone ("America/Bogota"), and filters events based on a specific target date.
+    to the target timezone ("America/Bogota" by default), and filters events based on a specific target date.
     Each processed event includes details such as date, time, title, and a formatted description.
 
     Attributes:
@@ -15,15 +16,17 @@ class BetDataProcessor(IDataProcessor):
         targetTimezone (pytz.timezone): The target timezone for event time conversion.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the BetDataProcessor with the source timezone.
 
         Args:
             timezone (str): The timezone of the source event data (e.g., "UTC").
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData: dict, defaultDescription: str, targetDate: str) -> list:
         """
@@ -35,7 +38,7 @@ class BetDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events by, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list: A list of dictionaries, each representing a processed event with the following keys:
+            list[ProgramEvent]: A list of processed events, each with the following fields:
                 - 'date' (str): The event date in 'YYYY-MM-DD' format.
                 - 'hour' (str): The event start time in 'HH:MM' format.
                 - 'title' (str): The title of the event.
@@ -52,15 +55,11 @@ class BetDataProcessor(IDataProcessor):
             rawEventStartDate = event.get("airTime")
             eventStartDatetime = datetime.fromisoformat(rawEventStartDate).replace(tzinfo=None)
 
-            # Localize the event datetime to the source timezone
-            localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-
-            # Convert the event time to the target timezone
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            # Convert the event datetime from the source timezone to the target timezone
+            targetEventDatetime = self.timezoneConverter.convert(eventStartDatetime)
 
             # Format the event date and time
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Extract event details
             eventTitle = event.get("seriesTitle", "").strip()
@@ -76,11 +75,6 @@ class BetDataProcessor(IDataProcessor):
                 eventContent = episodeTitle
 
             # Append the processed event to the list
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": eventTitle,
-                "content": eventContent,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, eventTitle, eventContent))
 
         return processedEvents
\ No newline at end of file
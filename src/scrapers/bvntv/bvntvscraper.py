@@ -23,18 +23,25 @@ class BvnTvScraper(ScraperBase):
             None: The processed data is saved to a file instead of being returned.
         """
         # Generate URLs based on the provided date range
-        urls = self.urlGenerator.getDateUrls(startDate, numberOfDays)
+        urls = self.getIncrementalUrls(startDate, numberOfDays)
         defaultSynopsis = self.channelConfig['defaultDescription']
         fileName = self.channelConfig['fileName']
         filePath = self.channelConfig['outputPath']
         data = {}
 
         # Iterate over each URL and process the data
-        for url in urls:
-            dataFromUrl = self.getDataFromUrl(url)
+        for url, dataFromUrl in self.fetchAll(urls):
             if dataFromUrl:
                 dateKey = url.split("/")[-2]  # Extract the date key from the URL
-                data[dateKey] = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                self.recordEvents(url, programs)
+                data[dateKey] = programs
+
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
+
+        # Remove duplicate entries from the collected data
+        data = self.removeDuplicates(data)
 
         # Save the processed data to a file
         self.saveData(fileName, data, charReplacements, filePath)
\ No newline at end of file
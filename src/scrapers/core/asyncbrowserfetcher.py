@@ -0,0 +1,169 @@
+import asyncio
+from abc import abstractmethod
+from playwright.async_api import async_playwright, Error as PlaywrightError
+from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
+from src.scrapers.core.browserpool import BrowserPool
+from src.scrapers.core.ratelimiter import RateLimiter
+from src.scrapers.core.requestpolicy import RequestPolicy
+from src.scrapers.core.waitstrategy import WaitStrategy
+
+class AsyncBrowserFetcher(IDataFetcher):
+    """
+    Base class for fetchers that load several pages at once with the async Playwright API.
+
+    All the URLs given to `fetchMany` share one Chromium instance; each URL is loaded in
+    its own browser context and at most `maxPages` pages are open at the same time.
+    Requests rejected by the channel's `RequestPolicy` are aborted, and pages are loaded
+    and retried according to the channel's `WaitStrategy`. Subclasses set `DEFAULT_WAIT`
+    and implement `fetchPage` to extract the data of one loaded page.
+    """
+
+    requiresBrowser = True
+
+    DEFAULT_MAX_PAGES = 4  # Pages loaded at the same time
+    DEFAULT_WAIT = {}  # WaitStrategy settings used when the channel has no 'wait' section
+    DEFAULT_REQUEST_POLICY = {}  # RequestPolicy settings used when the channel has no 'requestPolicy' section
+
+    def __init__(self, logger, maxPages: int = DEFAULT_MAX_PAGES):
+        """
+        Initializes the fetcher.
+
+        Args:
+            logger: Logger instance to log info and errors.
+            maxPages (int, optional): Maximum number of pages loaded at the same time.
+        """
+        self.logger = logger
+        self.maxPages = maxPages
+        self.waitStrategy = WaitStrategy.fromConfig(logger, {}, **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig(self.DEFAULT_REQUEST_POLICY, self.waitStrategy.responsePattern)
+        self.rateLimit = None
+
+    def configure(self, channelConfig: dict):
+        """
+        Reads the number of parallel pages from the channel setting 'maxPages', the
+        request interception rules from its 'requestPolicy' section, the wait strategy
+        from its 'wait' section and the page load rate limit from its 'rateLimit' section.
+        The response the wait strategy waits for, if any, is always allowed.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        self.maxPages = channelConfig.get("maxPages", self.maxPages)
+        self.waitStrategy = WaitStrategy.fromConfig(self.logger, channelConfig.get("wait", {}), **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig(
+            channelConfig.get("requestPolicy", self.DEFAULT_REQUEST_POLICY), self.waitStrategy.responsePattern
+        )
+        self.rateLimit = channelConfig.get("rateLimit")
+
+    def fetchData(self, url: str):
+        """
+        Loads a single URL.
+
+        Args:
+            url (str): The URL to load.
+
+        Returns:
+            list: The data extracted from the page, or an empty list if it failed.
+        """
+        return self.fetchMany([url])[0]
+
+    def fetchMany(self, urls: list, headers=None) -> list:
+        """
+        Loads several URLs concurrently.
+
+        Args:
+            urls (list[str]): The URLs to load.
+            headers (dict, optional): Ignored; pages are requested by the browser itself.
+
+        Returns:
+            list: One result per URL, in the same order as `urls`.
+        """
+        results = self.fetchPages(urls)
+        return [results[url] for url in urls]
+
+    def fetchPages(self, urls: list) -> dict:
+        """
+        Loads several URLs concurrently and returns their data keyed by URL.
+
+        Args:
+            urls (list[str]): The URLs to load.
+
+        Returns:
+            dict: The data extracted from each URL (an empty list for the failed ones).
+        """
+        if not urls:
+            return {}
+        return asyncio.run(self.fetchPagesAsync(urls))
+
+    async def fetchPagesAsync(self, urls: list) -> dict:
+        """
+        Coroutine behind `fetchPages`, usable directly from code that already runs an event loop.
+
+        Args:
+            urls (list[str]): The URLs to load.
+
+        Returns:
+            dict: The data extracted from each URL.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.maxPages))
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True, slow_mo=BrowserPool.getDefaultSlowMo())
+            try:
+                results = await asyncio.gather(*(self.fetchOne(browser, url, semaphore) for url in urls))
+            finally:
+                await browser.close()
+
+        return dict(zip(urls, results))
+
+    async def fetchOne(self, browser, url: str, semaphore):
+        """
+        Loads one URL in a fresh context once the semaphore allows it, retrying on failure.
+
+        Args:
+            browser (playwright.async_api.Browser): The shared browser.
+            url (str): The URL to load.
+            semaphore (asyncio.Semaphore): Limits the number of pages open at the same time.
+
+        Returns:
+            list: The data extracted from the page, or an empty list if every attempt failed.
+        """
+        maxAttempts = self.waitStrategy.maxAttempts
+
+        async with semaphore:
+            for attempt in range(maxAttempts):
+                rateLimiter = RateLimiter.forUrl(url, self.rateLimit)
+                if rateLimiter:
+                    await asyncio.sleep(rateLimiter.reserve())
+
+                context = await browser.new_context()
+                try:
+                    await context.route("**/*", self.requestPolicy.handleRouteAsync)
+                    self.logger.logInfo(f"Attempt {attempt + 1}/{maxAttempts}: Fetching {url}")
+                    result = await self.fetchPage(await context.new_page(), url)
+                    if result:
+                        return result
+                except PlaywrightError as error:
+                    self.logger.logError(f"Error fetching {url} (Attempt {attempt + 1}/{maxAttempts}): {error}")
+                finally:
+                    await context.close()
+
+                if attempt < maxAttempts - 1:
+                    await asyncio.sleep(self.waitStrategy.backoff.getDelay(attempt))
+
+        self.logger.logError(f"Failed to fetch data from {url} after {maxAttempts} attempts.")
+        return []
+
+    @abstractmethod
+    async def fetchPage(self, page, url: str) -> list:
+        """
+        Loads a URL in the given page (usually through `waitStrategy.loadAsync`) and extracts its data.
+
+        Args:
+            page (playwright.async_api.Page): A new page in its own context.
+            url (str): The URL to load.
+
+        Returns:
+            list: The extracted data; an empty result counts as a failed attempt.
+        """
+        pass
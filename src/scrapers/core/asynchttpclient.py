@@ -0,0 +1,139 @@
+import asyncio
+import json
+import aiohttp
+from urllib.parse import urlparse
+from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
+from src.scrapers.core.ratelimiter import RateLimiter
+
+class AsyncHttpClient(IDataFetcher):
+    """
+    Asynchronous HTTP client for channels that request many URLs per run.
+
+    All the URLs given to `fetchMany` are requested from a single event loop over one
+    `aiohttp` session, which keeps HTTP/1.1 connections alive between requests. The
+    number of requests in flight is bounded both globally and per host, and hosts with a
+    'rateLimit' are paced by their shared `RateLimiter`.
+
+    Unlike `HttpClient`, this client has no response cache, no retries and no circuit
+    breaker: each URL is requested once and a failed request simply returns None.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 16  # Requests in flight across all hosts
+    DEFAULT_MAX_CONCURRENCY_PER_HOST = 4  # Requests in flight against the same host
+    DEFAULT_TIMEOUT = 60  # Total seconds allowed per request
+
+    def __init__(self, logger, maxConcurrency: int = DEFAULT_MAX_CONCURRENCY, maxConcurrencyPerHost: int = DEFAULT_MAX_CONCURRENCY_PER_HOST):
+        """
+        Initializes the client.
+
+        Args:
+            logger: Logger instance to log info and errors.
+            maxConcurrency (int, optional): Maximum number of requests in flight at once.
+            maxConcurrencyPerHost (int, optional): Maximum number of requests in flight per host.
+        """
+        self.logger = logger
+        self.maxConcurrency = maxConcurrency
+        self.maxConcurrencyPerHost = maxConcurrencyPerHost
+        self.rateLimit = None
+
+    def configure(self, channelConfig: dict):
+        """
+        Reads the concurrency limits from the channel settings 'maxConcurrency' and
+        'maxConcurrencyPerHost', keeping the current values when they are not set, and
+        the request rate limit from its 'rateLimit' section.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        self.maxConcurrency = channelConfig.get("maxConcurrency", self.maxConcurrency)
+        self.maxConcurrencyPerHost = channelConfig.get("maxConcurrencyPerHost", self.maxConcurrencyPerHost)
+        self.rateLimit = channelConfig.get("rateLimit")
+
+    def fetchData(self, url, headers=None):
+        """
+        Makes a GET request to the specified URL.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (dict, optional): A dictionary of HTTP headers to include in the request.
+
+        Returns:
+            dict or str: The response content in JSON format if applicable, otherwise text.
+                         None if the request failed.
+        """
+        return self.fetchMany([url], headers)[0]
+
+    def fetchMany(self, urls: list, headers=None) -> list:
+        """
+        Makes a GET request to each of the given URLs concurrently.
+
+        Args:
+            urls (list[str]): The URLs to send the requests to.
+            headers (dict, optional): A dictionary of HTTP headers to include in every request.
+
+        Returns:
+            list: One result per URL, in the same order as `urls`. Each result is the JSON
+                  content if applicable, otherwise text, or None if that request failed.
+        """
+        if not urls:
+            return []
+        return asyncio.run(self.fetchManyAsync(urls, headers))
+
+    async def fetchManyAsync(self, urls: list, headers=None) -> list:
+        """
+        Coroutine behind `fetchMany`, usable directly from code that already runs an event loop.
+
+        Args:
+            urls (list[str]): The URLs to send the requests to.
+            headers (dict, optional): A dictionary of HTTP headers to include in every request.
+
+        Returns:
+            list: One result per URL, in the same order as `urls`.
+        """
+        globalSemaphore = asyncio.Semaphore(max(1, self.maxConcurrency))
+        hostSemaphores = {
+            urlparse(url).netloc: asyncio.Semaphore(max(1, self.maxConcurrencyPerHost))
+            for url in urls
+        }
+
+        connector = aiohttp.TCPConnector(limit=self.maxConcurrency, limit_per_host=self.maxConcurrencyPerHost)
+        timeout = aiohttp.ClientTimeout(total=self.DEFAULT_TIMEOUT)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(
+                self.fetchOne(session, url, headers, globalSemaphore, hostSemaphores[urlparse(url).netloc])
+                for url in urls
+            ))
+
+    async def fetchOne(self, session, url: str, headers, globalSemaphore, hostSemaphore):
+        """
+        Makes a single GET request once both the host and the global semaphores allow it.
+
+        The host slot is taken first, so requests queued behind a busy host never hold
+        one of the global slots that requests to other hosts could use.
+
+        Args:
+            session (aiohttp.ClientSession): The session whose connections are reused.
+            url (str): The URL to send the request to.
+            headers (dict): HTTP headers to include in the request, or None.
+            globalSemaphore (asyncio.Semaphore): Limits the requests in flight across all hosts.
+            hostSemaphore (asyncio.Semaphore): Limits the requests in flight against this URL's host.
+
+        Returns:
+            dict or str: The response content in JSON format if applicable, otherwise text.
+                         None if the request failed.
+        """
+        async with hostSemaphore, globalSemaphore:
+            rateLimiter = RateLimiter.forUrl(url, self.rateLimit)
+            if rateLimiter:
+                await asyncio.sleep(rateLimiter.reserve())
+
+            try:
+                async with session.get(url, headers=headers) as response:
+                    response.raise_for_status()  # Raises an exception for unsuccessful responses
+                    body = await response.text()
+                    self.logger.logInfo(f"Successfully retrieved data from {url}")
+                    return json.loads(body) if 'application/json' in response.headers.get('Content-Type', '') else body
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as requestError:
+                self.logger.logError(f"Error retrieving data from {url}: {requestError}")
+                return None
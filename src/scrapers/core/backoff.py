@@ -0,0 +1,63 @@
+import random
+
+class Backoff:
+    """
+    Exponential backoff with jitter for retrying failed requests.
+
+    The delay before retry number `attempt` grows as `baseDelay * multiplier ** attempt`,
+    capped at `maxDelay`. With jitter enabled, the actual delay is drawn between half and
+    all of that value, so clients that failed together do not retry in lockstep.
+    """
+
+    DEFAULT_BASE_DELAY = 1.0  # Seconds before the first retry
+    DEFAULT_MAX_DELAY = 30.0  # Upper bound of any delay, in seconds
+    DEFAULT_MULTIPLIER = 2.0
+
+    def __init__(self, baseDelay: float = DEFAULT_BASE_DELAY, maxDelay: float = DEFAULT_MAX_DELAY,
+                 multiplier: float = DEFAULT_MULTIPLIER, jitter: bool = True):
+        """
+        Initializes the backoff policy.
+
+        Args:
+            baseDelay (float, optional): Seconds before the first retry.
+            maxDelay (float, optional): Maximum delay in seconds.
+            multiplier (float, optional): Growth factor between consecutive retries.
+            jitter (bool, optional): Whether to randomize each delay.
+        """
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    @classmethod
+    def fromConfig(cls, backoffConfig: dict):
+        """
+        Builds a backoff policy from a 'backoff' configuration section.
+
+        Args:
+            backoffConfig (dict): Optional keys 'baseDelay', 'maxDelay', 'multiplier' and 'jitter'.
+
+        Returns:
+            Backoff: The configured policy.
+        """
+        return cls(
+            backoffConfig.get("baseDelay", cls.DEFAULT_BASE_DELAY),
+            backoffConfig.get("maxDelay", cls.DEFAULT_MAX_DELAY),
+            backoffConfig.get("multiplier", cls.DEFAULT_MULTIPLIER),
+            backoffConfig.get("jitter", True),
+        )
+
+    def getDelay(self, attempt: int) -> float:
+        """
+        Computes the delay before a retry.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+        """
+        delay = min(self.maxDelay, self.baseDelay * self.multiplier ** attempt)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
@@ -0,0 +1,195 @@
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from playwright.sync_api import sync_playwright
+from src.scrapers.core.logger import Logger
+
+class BrowserPool:
+    """
+    Keeps a single Chromium instance alive and hands out pages to browser-based fetchers.
+
+    Chromium is launched on first use and reused for every URL, instead of starting
+    Playwright and a new browser per request. Pages live in their own browser context
+    and are recycled (context closed and recreated) after `maxPageUses` uses or after a
+    failure, so state such as cookies or leaked listeners never accumulates.
+
+    The Playwright sync API can only be used from the thread that started it, so there
+    is one pool per thread (`BrowserPool.get`). Worker threads close their pool with
+    `shutdownCurrent` when their channel finishes; the main thread's pool is shut down
+    when the process exits.
+    """
+
+    DEFAULT_MAX_PAGE_USES = 20  # URLs loaded in a page before its context is recreated
+
+    _local = threading.local()
+    _pools = []
+    _poolsLock = threading.Lock()
+
+    def __init__(self, logger, maxPageUses: int = DEFAULT_MAX_PAGE_USES, slowMo: int = None):
+        """
+        Initializes the pool without launching the browser yet.
+
+        Args:
+            logger: Logger instance to log info and errors.
+            maxPageUses (int, optional): Number of URLs loaded in a page before it is recycled.
+            slowMo (int, optional): Milliseconds Playwright waits between operations, for debugging.
+                                    Defaults to the 'PLAYWRIGHT_SLOW_MO' environment variable, or 0.
+        """
+        self.logger = logger
+        self.maxPageUses = maxPageUses
+        self.slowMo = slowMo if slowMo is not None else self.getDefaultSlowMo()
+        self.ownerThread = threading.current_thread()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.currentPage = None
+        self.pageUses = 0
+
+    @staticmethod
+    def getDefaultSlowMo() -> int:
+        """
+        Returns the slow motion delay requested through the 'PLAYWRIGHT_SLOW_MO' environment variable.
+
+        Returns:
+            int: Milliseconds Playwright waits between operations; 0 unless debugging.
+        """
+        return int(os.getenv("PLAYWRIGHT_SLOW_MO", "0"))
+
+    @classmethod
+    def get(cls, logger=None):
+        """
+        Returns the pool of the current thread, creating it on first use.
+
+        Args:
+            logger (optional): Logger used if the pool has to be created.
+
+        Returns:
+            BrowserPool: The pool owned by the calling thread.
+        """
+        pool = getattr(cls._local, "pool", None)
+        if pool is None:
+            pool = cls(logger or Logger())
+            cls._local.pool = pool
+            with cls._poolsLock:
+                cls._pools.append(pool)
+        return pool
+
+    def start(self):
+        """
+        Launches Chromium if it is not running (first use or after a crash).
+        """
+        if self.browser and self.browser.is_connected():
+            return
+
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(headless=True, slow_mo=self.slowMo)
+        self.context = None
+        self.currentPage = None
+        self.logger.logInfo("Browser pool launched Chromium")
+
+    @contextmanager
+    def acquirePage(self, requestPolicy=None):
+        """
+        Hands out the pool's page for loading one URL.
+
+        The page is recycled first if it reached `maxPageUses`, and discarded if the
+        caller raises, since a failed navigation may leave it in an unknown state.
+        Callers must remove the event listeners they register on the page.
+
+        Args:
+            requestPolicy (RequestPolicy, optional): Policy applied to the page's requests
+                                                     while the caller holds it.
+
+        Yields:
+            playwright.sync_api.Page: A page ready to navigate.
+        """
+        self.start()
+        if self.currentPage is None or self.pageUses >= self.maxPageUses:
+            self.recyclePage()
+
+        self.pageUses += 1
+        page = self.currentPage
+        if requestPolicy:
+            page.route("**/*", requestPolicy.handleRoute)
+        try:
+            yield page
+        except Exception:
+            self.closeContext()
+            raise
+
+        if requestPolicy:
+            page.unroute("**/*", requestPolicy.handleRoute)
+
+    def recyclePage(self):
+        """
+        Closes the current context and opens a new one with a single page.
+        """
+        self.closeContext()
+        self.context = self.browser.new_context()
+        self.currentPage = self.context.new_page()
+        self.pageUses = 0
+
+    def closeContext(self):
+        """
+        Closes the current context and its page, ignoring errors from a dead browser.
+        """
+        if self.context:
+            try:
+                self.context.close()
+            except Exception as closeError:
+                self.logger.logError(f"Error closing browser context: {closeError}")
+        self.context = None
+        self.currentPage = None
+
+    def shutdown(self):
+        """
+        Closes the context, the browser and Playwright.
+        """
+        self.closeContext()
+        try:
+            if self.browser:
+                self.browser.close()
+            if self.playwright:
+                self.playwright.stop()
+        except Exception as closeError:
+            self.logger.logError(f"Error shutting down the browser pool: {closeError}")
+        self.browser = None
+        self.playwright = None
+
+    @classmethod
+    def shutdownCurrent(cls):
+        """
+        Shuts down the pool of the calling thread, if it has one.
+
+        Must be called from the thread that owns the pool, before it finishes, since the
+        Playwright sync API cannot be used from any other thread. The next `get` in the
+        same thread creates a new pool.
+        """
+        pool = getattr(cls._local, "pool", None)
+        if pool is None:
+            return
+
+        cls._local.pool = None
+        with cls._poolsLock:
+            if pool in cls._pools:
+                cls._pools.remove(pool)
+        pool.shutdown()
+
+    @classmethod
+    def shutdownAll(cls):
+        """
+        Shuts down the pool of the main thread. Registered to run at exit.
+
+        Only pools owned by the calling thread can be closed through the sync API, so
+        worker threads must close theirs with `shutdownCurrent` before finishing.
+        """
+        with cls._poolsLock:
+            pools, cls._pools = cls._pools, []
+
+        for pool in pools:
+            if pool.ownerThread is threading.current_thread():
+                pool.shutdown()
+
+atexit.register(BrowserPool.shutdownAll)
@@ -0,0 +1,173 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from src.scrapers.core.browserpool import BrowserPool
+
+
+def runChannel(runner, channel: str, *runnerArgs) -> dict:
+    """
+    Runs a single channel through the given runner, measuring its wall time and
+    isolating any failure so it does not affect the other channels.
+
+    The browser pool of the worker is shut down once the channel finishes, from the
+    worker itself, since Playwright can only be closed from the thread that started it.
+
+    This function lives at module level so it can be pickled by a process pool.
+
+    Args:
+        runner (Callable): The function that scrapes one channel (e.g. `main.runScraper`).
+        channel (str): The channel identifier passed as the first argument to the runner.
+        *runnerArgs: Remaining positional arguments forwarded to the runner.
+
+    Returns:
+        dict: The outcome of the run with the keys:
+            - 'channel' (str): The channel identifier.
+            - 'status' (str): 'ok' if the runner finished, 'failed' if it raised.
+            - 'elapsed' (float): Wall time in seconds.
+            - 'error' (str): The error message when the run failed, otherwise an empty string.
+            - 'output' (str): What the runner returned about its output files (e.g. 'changed'
+              or 'unchanged'), or an empty string.
+    """
+    startTime = time.perf_counter()
+    output = ""
+    try:
+        output = runner(channel, *runnerArgs) or ""
+        status, error = "ok", ""
+    except Exception as runError:
+        status, error = "failed", f"{type(runError).__name__}: {runError}"
+    finally:
+        BrowserPool.shutdownCurrent()
+
+    return {
+        "channel": channel,
+        "status": status,
+        "elapsed": time.perf_counter() - startTime,
+        "error": error,
+        "output": output,
+    }
+
+
+class ChannelOrchestrator:
+    """
+    Schedules several channel scrapers concurrently using bounded worker pools.
+
+    Channels are split in two groups: regular channels, which run on the main pool, and
+    browser-based channels (Playwright), which are far heavier and run on a separate,
+    smaller pool. A failure in one channel is recorded in its result and never stops
+    the remaining channels.
+    """
+
+    EXECUTORS = {
+        "thread": ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
+
+    def __init__(self, runner, workers: int = 1, executor: str = "thread", browserWorkers: int = 1, logger=None):
+        """
+        Initializes the orchestrator.
+
+        Args:
+            runner (Callable): The function that scrapes one channel. It receives the channel
+                identifier followed by the arguments given to `run`.
+            workers (int, optional): Maximum number of regular channels running at once. Defaults to 1.
+            executor (str, optional): Pool type, either 'thread' or 'process'. Defaults to 'thread'.
+            browserWorkers (int, optional): Maximum number of browser-based channels running at once.
+                Defaults to 1.
+            logger (Logger, optional): Logger used to record each channel outcome.
+
+        Raises:
+            ValueError: If the executor type is unknown or a pool size is lower than 1.
+        """
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Options: {', '.join(self.EXECUTORS)}")
+        if workers < 1 or browserWorkers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+
+        self.runner = runner
+        self.workers = workers
+        self.executor = executor
+        self.browserWorkers = browserWorkers
+        self.logger = logger
+
+    def run(self, channels: list, browserChannels: set, *runnerArgs) -> list:
+        """
+        Runs all the given channels and waits for every one of them to finish.
+
+        Args:
+            channels (list): Channel identifiers to run, in the order used for the summary.
+            browserChannels (set): Subset of channels that must run on the browser pool.
+            *runnerArgs: Arguments forwarded to the runner after the channel identifier.
+
+        Returns:
+            list[dict]: One result per channel (see `runChannel`), in the same order as `channels`.
+        """
+        executorClass = self.EXECUTORS[self.executor]
+        regularChannels = [channel for channel in channels if channel not in browserChannels]
+        heavyChannels = [channel for channel in channels if channel in browserChannels]
+        resultsByChannel = {}
+
+        with executorClass(max_workers=self.workers) as regularPool, \
+                executorClass(max_workers=self.browserWorkers) as browserPool:
+            futures = {}
+            for pool, poolChannels in ((browserPool, heavyChannels), (regularPool, regularChannels)):
+                for channel in poolChannels:
+                    future = pool.submit(runChannel, self.runner, channel, *runnerArgs)
+                    futures[future] = channel
+
+            for future in as_completed(futures):
+                channel = futures[future]
+                try:
+                    result = future.result()
+                except Exception as poolError:
+                    # The worker itself died (e.g. a crashed process), not only the scraper
+                    result = {"channel": channel, "status": "failed", "elapsed": 0.0, "error": str(poolError), "output": ""}
+
+                resultsByChannel[channel] = result
+                self.logResult(result)
+
+        return [resultsByChannel[channel] for channel in channels]
+
+    def logResult(self, result: dict):
+        """
+        Records the outcome of a single channel in the logger, if one was provided.
+
+        Args:
+            result (dict): The channel result returned by `runChannel`.
+        """
+        if not self.logger:
+            return
+
+        message = f"Channel {result['channel']} finished with status '{result['status']}' in {result['elapsed']:.2f}s"
+        if result.get("output"):
+            message += f" (output {result['output']})"
+        if result["error"]:
+            self.logger.logError(f"{message}: {result['error']}")
+        else:
+            self.logger.logInfo(message)
+
+    @staticmethod
+    def formatSummary(results: list) -> str:
+        """
+        Builds a plain-text table with the timing and outcome of each channel.
+
+        Args:
+            results (list[dict]): The results returned by `run`.
+
+        Returns:
+            str: The summary table, one line per channel plus a header and a totals line.
+        """
+        channelWidth = max([len("Channel")] + [len(result["channel"]) for result in results])
+        lines = [f"{'Channel':<{channelWidth}}  {'Status':<7} {'Time (s)':>9}  {'Output':<9}  Error"]
+
+        for result in results:
+            lines.append(
+                f"{result['channel']:<{channelWidth}}  {result['status']:<7} {result['elapsed']:>9.2f}  "
+                f"{result.get('output', ''):<9}  {result['error']}".rstrip()
+            )
+
+        failedCount = sum(1 for result in results if result["status"] != "ok")
+        totals = f"{len(results)} channels, {len(results) - failedCount} ok, {failedCount} failed"
+        outputs = [result.get("output") for result in results]
+        if any(outputs):
+            totals += f", {outputs.count('changed')} changed, {outputs.count('unchanged')} unchanged"
+        lines.append(totals)
+        return "\n".join(lines)
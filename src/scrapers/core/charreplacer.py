@@ -0,0 +1,71 @@
+import re
+
+class CharReplacer:
+    """
+    Applies a dictionary of character replacements to the text of each event.
+
+    The dictionary is compiled once into an ordered tuple of pairs, applied in the same
+    order and with the same result as replacing each entry in turn, but skipping every
+    entry whose text does not occur: most titles contain none of them, so a membership
+    test replaces the copy made by each `str.replace`. Runs of dashes are collapsed with
+    a precompiled regex, only when the text contains one.
+
+    Instances are immutable and picklable, so one compiled replacer can be shared by
+    every channel of a run, across threads or worker processes.
+    """
+
+    DASH_RUN_PATTERN = re.compile(r'-{2,}')
+
+    def __init__(self, charReplacements: dict = None):
+        """
+        Compiles the replacements.
+
+        Args:
+            charReplacements (dict, optional): Text to replace mapped to its replacement.
+        """
+        self.replacements = tuple((charReplacements or {}).items())
+
+    @classmethod
+    def fromReplacements(cls, charReplacements):
+        """
+        Returns a compiled replacer, compiling the dictionary only if needed.
+
+        Args:
+            charReplacements (dict or CharReplacer or None): The replacements to apply.
+
+        Returns:
+            CharReplacer: The given replacer, or a new one compiled from the dictionary.
+        """
+        if isinstance(charReplacements, cls):
+            return charReplacements
+        return cls(charReplacements)
+
+    def replace(self, text: str) -> str:
+        """
+        Applies the replacements to a text.
+
+        Args:
+            text (str): The text to clean.
+
+        Returns:
+            str: The text with every replacement applied.
+        """
+        for oldText, newText in self.replacements:
+            if oldText in text:
+                text = text.replace(oldText, newText)
+        return text
+
+    def clean(self, text: str) -> str:
+        """
+        Applies the replacements, collapses runs of dashes and strips dashes at both ends.
+
+        Args:
+            text (str): The text to clean.
+
+        Returns:
+            str: The cleaned text.
+        """
+        text = self.replace(text)
+        if '--' in text:
+            text = self.DASH_RUN_PATTERN.sub('-', text)
+        return text.strip("-")
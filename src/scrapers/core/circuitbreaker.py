@@ -0,0 +1,99 @@
+import threading
+import time
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a host after repeated failures.
+
+    After `failureThreshold` consecutive failures the circuit opens and every request to
+    the host fails fast. Once `resetTimeout` seconds have passed, a single trial request
+    is let through (half-open): its success closes the circuit again, its failure opens
+    it for another `resetTimeout`.
+
+    Breakers are shared process-wide, one per host (`CircuitBreaker.forHost`), so every
+    scraper talking to the same host sees the same state.
+    """
+
+    DEFAULT_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+    DEFAULT_RESET_TIMEOUT = 60  # Seconds the circuit stays open before a trial request
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    _breakers = {}
+    _breakersLock = threading.Lock()
+
+    def __init__(self, failureThreshold: int = DEFAULT_FAILURE_THRESHOLD, resetTimeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        Initializes a closed circuit.
+
+        Args:
+            failureThreshold (int, optional): Consecutive failures that open the circuit.
+            resetTimeout (float, optional): Seconds the circuit stays open before a trial request.
+        """
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.openedAt = 0.0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def forHost(cls, host: str, failureThreshold: int = DEFAULT_FAILURE_THRESHOLD, resetTimeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        Returns the breaker of a host, creating it with the given settings on first use.
+
+        Args:
+            host (str): The host name (and port, if any).
+            failureThreshold (int, optional): Consecutive failures that open the circuit.
+            resetTimeout (float, optional): Seconds the circuit stays open before a trial request.
+
+        Returns:
+            CircuitBreaker: The breaker shared by every request to that host.
+        """
+        with cls._breakersLock:
+            if host not in cls._breakers:
+                cls._breakers[host] = cls(failureThreshold, resetTimeout)
+            return cls._breakers[host]
+
+    @classmethod
+    def resetAll(cls):
+        """
+        Forgets every host breaker.
+        """
+        with cls._breakersLock:
+            cls._breakers = {}
+
+    def allowRequest(self) -> bool:
+        """
+        Checks whether a request may be sent now.
+
+        Returns:
+            bool: False while the circuit is open, or while the half-open trial request is in flight.
+        """
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.openedAt >= self.resetTimeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def recordSuccess(self):
+        """
+        Closes the circuit and clears the failure count.
+        """
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def recordFailure(self):
+        """
+        Counts a failure, opening the circuit when the threshold is reached or a trial request fails.
+        """
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failureThreshold:
+                self.state = self.OPEN
+                self.openedAt = time.monotonic()
@@ -1,31 +1,260 @@
+from datetime import date
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import MISSING, TimezoneConverter
+
+MINUTES_PER_DAY = 24 * 60
+HOUR_MINUTES = {hour: minute for minute, hour in enumerate(TimezoneConverter.HOURS)}  # 'HH:MM' -> minute of the day
+
 class DuplicateRemover:
-    """Handles duplicate removal from hierarchical or flat data structures."""
+    """
+    Handles duplicate removal from hierarchical or flat data structures.
 
-    @staticmethod
-    def removeDuplicates(data: dict) -> dict:
+    Events are read once, in order, so lists and iterators are accepted alike. The key
+    of an event is made of the configured fields (by default its date and hour, which
+    the processors already intern) and is looked up in two nested dictionaries, first
+    field then the rest, so the default keys need no tuple per event. With 'group' among
+    the keys, each entry of the data (a date or a sub-channel) gets its own dictionaries.
+
+    With the "richer" policy a duplicate replaces the kept event, in place, when it
+    has a real synopsis and the kept one only has a default description (or a shorter
+    one). With `overlapMinutes`, programs of the same group starting less than that
+    many minutes after the kept one are treated as the same slot as well.
+    """
+
+    DEFAULT_KEYS = ("date", "hour")
+    GROUP_KEY = "group"  # Name of the dictionary entry an event is stored under
+
+    KEEP_FIRST = "first"
+    PREFER_RICHER = "richer"
+    POLICIES = (KEEP_FIRST, PREFER_RICHER)
+
+    def __init__(self, keys=DEFAULT_KEYS, policy: str = KEEP_FIRST, defaultDescriptions=(), overlapMinutes: int = 0):
         """
-        Removes duplicate entries from a nested dictionary (e.g., TV programs).
+        Initializes the remover.
 
         Args:
-            data (dict): The data structure (nested dictionary) containing program data.
+            keys (iterable[str], optional): Event fields ('date', 'hour', 'title', 'content')
+                and/or 'group' identifying a program. Defaults to ("date", "hour").
+            policy (str, optional): Which duplicate is kept: "first" or "richer". Defaults to "first".
+            defaultDescriptions (iterable[str], optional): Placeholder synopses that do not count
+                as a real description. Defaults to ().
+            overlapMinutes (int, optional): Programs of a group starting less than this many minutes
+                after the previous one collide with it. Defaults to 0 (disabled).
+
+        Raises:
+            ValueError: If the policy or a key is unknown.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown duplicate policy '{policy}', expected one of {self.POLICIES}")
+        self.keys = tuple(keys)
+        self.fieldKeys = tuple(key for key in self.keys if key != self.GROUP_KEY)
+        unknownKeys = [key for key in self.fieldKeys if key not in ProgramEvent.FIELDS]
+        if unknownKeys or not self.keys:
+            raise ValueError(f"Unknown duplicate keys {unknownKeys or self.keys}, expected {ProgramEvent.FIELDS} or '{self.GROUP_KEY}'")
+
+        self.useGroup = self.GROUP_KEY in self.keys
+        self.preferRicher = policy == self.PREFER_RICHER
+        self.defaultDescriptions = frozenset(description.strip() for description in defaultDescriptions if description)
+        self.overlapMinutes = overlapMinutes or 0
+
+    @classmethod
+    def fromConfig(cls, dedupeConfig: dict, defaultDescriptions=()):
+        """
+        Builds a remover from the 'dedupe' entry of a channel configuration.
+
+        Args:
+            dedupeConfig (dict): Optional keys 'keys', 'policy' and 'overlapMinutes'.
+            defaultDescriptions (iterable[str], optional): The channel's default descriptions.
 
         Returns:
-            dict: The updated dictionary with duplicates removed.
+            DuplicateRemover: The configured remover.
+        """
+        dedupeConfig = dedupeConfig or {}
+        return cls(
+            dedupeConfig.get("keys", cls.DEFAULT_KEYS),
+            dedupeConfig.get("policy", cls.KEEP_FIRST),
+            defaultDescriptions,
+            dedupeConfig.get("overlapMinutes", 0),
+        )
+
+    def getKeyParts(self, program) -> tuple:
+        """
+        Builds the key identifying a program, without its group.
+
+        The key is split in two parts, looked up one after the other: the first field
+        (the date by default) and the rest of the fields (the hour by default). Both are
+        plain, usually interned, strings for the default keys, so no tuple is built per
+        program.
+
+        Args:
+            program (ProgramEvent or dict): The program.
+
+        Returns:
+            tuple: The value of the first field, and the value (or tuple of values) of the
+                   other fields, or None if there are no other fields.
+        """
+        if isinstance(program, ProgramEvent):
+            values = [getattr(program, field) for field in self.fieldKeys]
+        else:
+            values = [(program.get(field) or "").strip() for field in self.fieldKeys]
+        if not values:
+            return None, None
+        if len(values) <= 2:
+            return values[0], values[1] if len(values) == 2 else None
+        return values[0], tuple(values[1:])
+
+    def getRichness(self, program) -> tuple:
+        """
+        Rates the description of a program; higher values are kept by the "richer" policy.
+
+        Args:
+            program (ProgramEvent or dict): The program.
+
+        Returns:
+            tuple[bool, int]: Whether it has a real synopsis, and the length of its description.
+        """
+        if type(program) is ProgramEvent:
+            content, title = program.content, program.title
+        else:
+            content, title = (program.get("content") or "").strip(), (program.get("title") or "").strip()
+        hasSynopsis = bool(content) and content not in self.defaultDescriptions and content != title
+        return hasSynopsis, len(content)
+
+    def isRicher(self, program, keptProgram) -> bool:
+        """
+        Checks whether a program should replace the kept one under the configured policy.
+        """
+        return self.preferRicher and self.getRichness(program) > self.getRichness(keptProgram)
+
+    def remove(self, data: dict) -> dict:
+        """
+        Removes duplicate programs from a dictionary of program lists, in a single pass.
+
+        Keys are global: unless 'group' is one of the keys, a program also duplicates the
+        programs of the other entries. A replaced program keeps the position of the one
+        it replaces.
+
+        Args:
+            data (dict): Lists (or iterators) of programs by date or sub-channel.
+
+        Returns:
+            dict: The entries that still have programs, with duplicates removed.
         """
-        seen = set()
+        sharedKeys = {}
+        keysByGroup = {}
+        byDateHour = self.fieldKeys == self.DEFAULT_KEYS
+        preferRicher = self.preferRicher
         filteredData = {}
-        for keyName, programData in data.items():
+        for groupName, programData in data.items():
+            # First key field -> {rest of the key -> (list holding the kept program, its index)}
+            keptKeys = keysByGroup.setdefault(groupName, {}) if self.useGroup else sharedKeys
             uniqueData = []
-
             for program in programData:
-                eventDate = program.get("date").strip()
-                eventHour = program.get("hour").strip()
-                uniqueKey = (eventDate, eventHour)
-    
-                if uniqueKey  not in seen:
-                    seen.add(uniqueKey)
+                if byDateHour and type(program) is ProgramEvent:
+                    keyHead, keyTail = program.date, program.hour
+                else:
+                    keyHead, keyTail = self.getKeyParts(program)
+
+                keptTails = keptKeys.get(keyHead)
+                if keptTails is None:
+                    keptTails = keptKeys[keyHead] = {}
+                position = keptTails.get(keyTail)
+                if position is None:
+                    # Only the "richer" policy needs to know where the kept program is
+                    keptTails[keyTail] = (uniqueData, len(uniqueData)) if preferRicher else True
                     uniqueData.append(program)
+                elif preferRicher and self.isRicher(program, position[0][position[1]]):
+                    position[0][position[1]] = program
 
             if uniqueData:
-                filteredData[keyName] = uniqueData
+                filteredData[groupName] = uniqueData
+
+        if self.overlapMinutes > 0:
+            filteredData = {groupName: self.resolveOverlaps(programData) for groupName, programData in filteredData.items()}
         return filteredData
+
+    def deduplicate(self, programs, groupName=None) -> list:
+        """
+        Removes duplicate programs from a single list or iterator of programs.
+
+        Args:
+            programs (iterable): The programs (ProgramEvent instances or dictionaries).
+            groupName (optional): The group the programs belong to. Defaults to None.
+
+        Returns:
+            list: The programs without duplicates, in their original order.
+        """
+        return self.remove({groupName: programs}).get(groupName, [])
+
+    def resolveOverlaps(self, programs: list) -> list:
+        """
+        Keeps one program of each run of programs starting too close to each other.
+
+        The programs are expected in chronological order, as the processors return
+        them. A program starting less than `overlapMinutes` after the kept one collides
+        with it and is dropped, or replaces it under the "richer" policy.
+
+        Args:
+            programs (list): The programs of one group, sorted by start.
+
+        Returns:
+            list: The programs without collisions.
+        """
+        dayStarts = {}
+        resolved = []
+        keptStart = None
+        for program in programs:
+            start = self.getStartMinute(program, dayStarts)
+            if resolved and start is not None and keptStart is not None and 0 <= start - keptStart < self.overlapMinutes:
+                if self.isRicher(program, resolved[-1]):
+                    resolved[-1] = program
+                    keptStart = start
+                continue
+            resolved.append(program)
+            keptStart = start
+        return resolved
+
+    @staticmethod
+    def getStartMinute(program, dayStarts: dict):
+        """
+        Returns the start of a program as minutes since 0001-01-01, from its date and hour.
+
+        Args:
+            program (ProgramEvent or dict): The program.
+            dayStarts (dict): Cache of the first minute of each date string.
+
+        Returns:
+            int: The start minute, or None if the date or hour cannot be read.
+        """
+        if type(program) is ProgramEvent:
+            dateStr, hourStr = program.date, program.hour
+        else:
+            dateStr, hourStr = (program.get("date") or "").strip(), (program.get("hour") or "").strip()
+
+        minuteOfDay = HOUR_MINUTES.get(hourStr)
+        if minuteOfDay is None:
+            return None
+        dayStart = dayStarts.get(dateStr, MISSING)
+        if dayStart is MISSING:
+            try:
+                dayStart = date.fromisoformat(dateStr).toordinal() * MINUTES_PER_DAY
+            except ValueError:
+                dayStart = None
+            dayStarts[dateStr] = dayStart
+        return None if dayStart is None else dayStart + minuteOfDay
+
+    @staticmethod
+    def removeDuplicates(data: dict) -> dict:
+        """
+        Removes duplicate entries from a nested dictionary (e.g., TV programs).
+
+        Programs are identified by their date and hour, and the first one seen is kept.
+
+        Args:
+            data (dict): The data structure (nested dictionary) containing program data
+                         (ProgramEvent instances or dictionaries).
+
+        Returns:
+            dict: The updated dictionary with duplicates removed.
+        """
+        return DuplicateRemover().remove(data)
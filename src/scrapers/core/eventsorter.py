@@ -0,0 +1,69 @@
+import itertools
+from operator import attrgetter
+from src.scrapers.core.programevent import ProgramEvent
+
+class EventSorter:
+    """
+    Sorts processed events chronologically without parsing their date and hour strings.
+
+    Events built by the processors carry their start as an aware datetime in the target
+    timezone, which is used directly as the sort key. Any other event (dictionaries,
+    events read back from the store) is sorted by its ('YYYY-MM-DD', 'HH:MM') strings,
+    which compare in the same order as the times they represent.
+    """
+
+    startKey = staticmethod(attrgetter("start"))
+
+    @staticmethod
+    def textKey(event) -> tuple:
+        """
+        Returns the (date, hour) sort key of an event.
+        """
+        return event["date"], event["hour"]
+
+    @classmethod
+    def getSortKey(cls, events):
+        """
+        Chooses the cheapest sort key valid for every event.
+
+        Args:
+            events (iterable): The events to sort.
+
+        Returns:
+            Callable: The key function.
+        """
+        for event in events:
+            if not isinstance(event, ProgramEvent) or event.start is None or event.start.tzinfo is None:
+                return cls.textKey
+        return cls.startKey
+
+    @classmethod
+    def sortEvents(cls, events: list) -> list:
+        """
+        Returns the events sorted by start time.
+
+        Args:
+            events (list): The events to sort (ProgramEvent or dict).
+
+        Returns:
+            list: A new list with the events in chronological order; ties keep their order.
+        """
+        return sorted(events, key=cls.getSortKey(events))
+
+    @classmethod
+    def mergeSorted(cls, chunks: list) -> list:
+        """
+        Merges lists of events that are each already sorted, e.g. the events of each date.
+
+        The chunks are concatenated and sorted once: Timsort detects each sorted chunk as
+        a run and only merges the runs, which is faster in CPython than `heapq.merge`.
+
+        Args:
+            chunks (list[list]): The sorted lists to merge.
+
+        Returns:
+            list: A new list with every event in chronological order; ties keep the chunk order.
+        """
+        events = list(itertools.chain.from_iterable(chunks))
+        events.sort(key=cls.getSortKey(events))
+        return events
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+from src.scrapers.core.programevent import ProgramEvent
+
+class EventStore:
+    """
+    Persists the processed events of a channel, one JSON file per date.
+
+    Used by the incremental mode to keep the events of dates whose guide no longer
+    changes, so later runs read them from disk instead of fetching them again.
+
+    Layout:
+        <storePath>/<channelName>/<YYYY-MM-DD>.json
+    """
+
+    def __init__(self, storePath: str, channelName: str, logger):
+        """
+        Initializes the store and creates the channel folder if it doesn't exist.
+
+        Args:
+            storePath (str): Base folder of the store.
+            channelName (str): Name of the channel folder inside the store.
+            logger: Logger instance to log info and errors.
+        """
+        self.channelPath = os.path.join(storePath, channelName)
+        self.logger = logger
+        os.makedirs(self.channelPath, exist_ok=True)
+
+    def dateFilePath(self, dateStr: str) -> str:
+        """
+        Returns the path of the file holding the events of a date.
+        """
+        return os.path.join(self.channelPath, f"{dateStr}.json")
+
+    def load(self, dateStr: str):
+        """
+        Loads the stored events of a date.
+
+        Args:
+            dateStr (str): The date in 'YYYY-MM-DD' format.
+
+        Returns:
+            list[ProgramEvent] or None: The stored events, or None if the date is not stored or unreadable.
+        """
+        try:
+            with open(self.dateFilePath(dateStr), "r", encoding="utf-8") as dateFile:
+                return [ProgramEvent.fromDict(eventData) for eventData in json.load(dateFile)]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as storeError:
+            self.logger.logError(f"Error reading stored events for {dateStr}: {storeError}")
+            return None
+
+    def save(self, dateStr: str, events: list):
+        """
+        Stores the events of a date, replacing any previous version atomically.
+
+        Args:
+            dateStr (str): The date in 'YYYY-MM-DD' format.
+            events (list): The processed events (ProgramEvent or dict) of that date.
+        """
+        fileDescriptor, tempPath = tempfile.mkstemp(dir=self.channelPath, suffix=".tmp")
+        try:
+            with os.fdopen(fileDescriptor, "w", encoding="utf-8") as tempFile:
+                json.dump(events, tempFile, ensure_ascii=False, default=ProgramEvent.toDict)
+            os.replace(tempPath, self.dateFilePath(dateStr))
+        except (OSError, TypeError, AttributeError) as storeError:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            self.logger.logError(f"Error storing events for {dateStr}: {storeError}")
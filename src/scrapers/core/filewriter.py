@@ -1,11 +1,38 @@
+import hashlib
+import itertools
 import os
-import re
+import stat
+import tempfile
+from collections.abc import Iterable, Iterator
+from src.scrapers.core.charreplacer import CharReplacer
+from src.scrapers.core.gzipjsonloutputwriter import GzipJsonlOutputWriter
+from src.scrapers.core.hashingwriter import HashingWriter
+from src.scrapers.core.jsonloutputwriter import JsonlOutputWriter
+from src.scrapers.core.parquetoutputwriter import ParquetOutputWriter
+from src.scrapers.core.txtoutputwriter import TxtOutputWriter
 
 class FileWriter:
     """
     Class to handle file writing operations.
+
+    Guides are written in the SIBA text format by default; `OUTPUT_WRITERS` lists every
+    available format (see `IOutputWriter`).
     """
 
+    BUFFER_SIZE = 1024 * 1024  # Bytes buffered in memory before each write to disk
+    DEFAULT_FILE_MODE = 0o644  # Permissions of new guide files (temporary files are private)
+
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+
+    OUTPUT_WRITERS = {
+        "txt": TxtOutputWriter,
+        "jsonl": JsonlOutputWriter,
+        "jsonl.gz": GzipJsonlOutputWriter,
+        "parquet": ParquetOutputWriter,
+    }
+    DEFAULT_OUTPUT_FORMATS = ["txt"]
+
     def __init__(self, logger):
         """
         Initializes the FileWriter.
@@ -20,86 +47,174 @@ class FileWriter:
         Writes program data to a text file, truncating title if it exceeds 120 characters.
 
         Args:
-            file: The open file object where data will be written.
+            file: The open text file object where data will be written.
             program (dict): A dictionary containing the program data.
             currentDate (str): The current date to write in the file.
-            charReplacements (dict, optional): A dictionary of character replacements.
+            charReplacements (dict or CharReplacer, optional): The character replacements,
+                                                               preferably compiled once.
 
         Returns:
             str: The updated current date if it changes.
         """
-        date = program.get('date', '')
-        hour = program.get('hour', '')
-        title = program.get('title', '').strip()
-        content = program.get('content', '').strip()
+        charReplacer = CharReplacer.fromReplacements(charReplacements)
+        file.write(TxtOutputWriter().formatProgram(program, currentDate, charReplacer))
+        return program.get('date', '')
 
-        # Apply character replacements if provided
-        if charReplacements:
-            for oldChar, newChar in charReplacements.items():
-                title = title.replace(oldChar, newChar)
-                content = content.replace(oldChar, newChar)
+    def saveData(self, channelName, programData, charReplacements=None, filePath='./data', outputFormats=None) -> dict:
+        """
+        Saves channel data in one or several output formats.
 
-        title = re.sub(r'-{2,}', '-', title)
-        content = re.sub(r'-{2,}', '-', content)
+        Args:
+            channelName (str): The name of the channel.
+            programData (dict or iterable): Program data, either a dictionary of program lists
+                                            keyed by date or any iterable of individual programs.
+            charReplacements (dict or CharReplacer, optional): Optional character replacements.
+            filePath (str, optional): The base path where the files will be saved.
+            outputFormats (list, optional): Keys of `OUTPUT_WRITERS`. Defaults to `DEFAULT_OUTPUT_FORMATS`.
 
-        title = title.strip("-")
-        content = content.strip("-")
+        Returns:
+            dict: The result of `saveDataAs` for each output format.
+        """
+        outputFormats = outputFormats or self.DEFAULT_OUTPUT_FORMATS
+        if len(outputFormats) > 1 and isinstance(programData, Iterator):
+            # A generator can only be iterated once
+            programData = list(programData)
 
-        # Truncate title if it exceeds 120 characters
-        if len(title) > 120:
-            title = title[:120]
+        charReplacer = CharReplacer.fromReplacements(charReplacements)
+        return {
+            outputFormat: self.saveDataAs(outputFormat, channelName, programData, charReplacer, filePath)
+            for outputFormat in outputFormats
+        }
 
-        # Write the date only if it changes
-        if date != currentDate:
-            currentDate = date
-            file.write(f"{currentDate}\n")
+    def saveDataToTxt(self, channelName, programData, charReplacements=None, filePath='./data'):
+        """
+        Saves channel data to a text file in the SIBA format.
 
-        # Write program data
-        file.write(f"{hour}---{title}---{content}---USA|TV-PG---SIBA_TIPO|UNICO--- --- --- --- --- ---SIN_CTI|{content}--- --- --- ---\n")
+        Args:
+            channelName (str): The name of the channel.
+            programData (dict or iterable): Program data, either a dictionary of program lists
+                                            keyed by date or any iterable (list, generator...)
+                                            of individual programs.
+            charReplacements (dict or CharReplacer, optional): Optional character replacements.
+            filePath (str, optional): The base path where the file will be saved.
 
-        return currentDate
+        Returns:
+            str or None: See `saveDataAs`.
+        """
+        return self.saveDataAs("txt", channelName, programData, charReplacements, filePath)
 
-    def saveDataToTxt(self, channelName, programData, charReplacements=None, filePath='./data'):
+    def saveDataAs(self, outputFormat, channelName, programData, charReplacements=None, filePath='./data'):
         """
-        Saves channel data to a text file.
+        Saves channel data to a file in the given output format.
+
+        The output is streamed through a large buffer into a temporary file next to the
+        final one, hashing it on the way. If the existing file already has that content it
+        is left untouched, mtime included, so downstream importers do not reprocess it;
+        otherwise the temporary file is flushed to disk and renamed over it. A failure
+        while writing leaves the previous file untouched instead of a truncated guide.
 
         Args:
+            outputFormat (str): A key of `OUTPUT_WRITERS` ('txt', 'jsonl', 'jsonl.gz' or 'parquet').
             channelName (str): The name of the channel.
-            programData (dict or list): Program data (either a list or a dictionary).
-            charReplacements (dict, optional): Optional character replacements.
+            programData (dict or iterable): Program data, either a dictionary of program lists
+                                            keyed by date or any iterable (list, generator...)
+                                            of individual programs.
+            charReplacements (dict or CharReplacer, optional): Optional character replacements.
             filePath (str, optional): The base path where the file will be saved.
 
         Returns:
-            None
+            str or None: FileWriter.CHANGED if the file was written, FileWriter.UNCHANGED if it
+                         already had the same content, or None if it could not be saved.
         """
+        outputWriterClass = self.OUTPUT_WRITERS.get(outputFormat)
+        if not outputWriterClass:
+            self.logger.logError(f"Unknown output format '{outputFormat}'. Options: {', '.join(self.OUTPUT_WRITERS)}")
+            return None
+        outputWriter = outputWriterClass()
+
         # Create the channel folder if it doesn't exist
         channelFolder = os.path.join(filePath)
         os.makedirs(channelFolder, exist_ok=True)
 
         # Generate the file name
-        fileName = f"{channelName}.txt"
+        fileName = f"{channelName}.{outputWriter.extension}"
         fullFilePath = os.path.join(channelFolder, fileName)
 
+        programs = self.iterPrograms(programData)
+        if programs is None:
+            self.logger.logError("The format of programData is invalid. It should be either a dictionary or an iterable of programs.")
+            return None
+
+        charReplacer = CharReplacer.fromReplacements(charReplacements)
+        tempFilePath = None
         try:
-            with open(fullFilePath, 'w', encoding='utf-8') as file:
-                currentDate = None
+            fileDescriptor, tempFilePath = tempfile.mkstemp(dir=channelFolder, prefix=f".{channelName}.", suffix=".tmp")
+            with open(fileDescriptor, 'wb', buffering=self.BUFFER_SIZE) as file:
+                writer = HashingWriter(file)
+                outputWriter.writePrograms(writer, channelName, programs, charReplacer)
+
+                unchanged = self.hasContent(fullFilePath, writer.size, writer.hexdigest())
+                if not unchanged:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            if unchanged:
+                os.remove(tempFilePath)
+                self.logger.logInfo(f"File unchanged for {channelName}: {fullFilePath}")
+                return self.UNCHANGED
+
+            # Keep the permissions of the file being replaced
+            fileMode = stat.S_IMODE(os.stat(fullFilePath).st_mode) if os.path.exists(fullFilePath) else self.DEFAULT_FILE_MODE
+            os.chmod(tempFilePath, fileMode)
+            os.replace(tempFilePath, fullFilePath)
+            self.logger.logInfo(f"File generated for {channelName}: {fullFilePath}")
+            return self.CHANGED
 
-                # If programData is a dictionary
-                if isinstance(programData, dict):
-                    for date, programs in programData.items():
-                        for program in programs:
-                            currentDate = self.writeProgramData(file, program, currentDate, charReplacements)
+        except Exception as e:
+            if tempFilePath and os.path.exists(tempFilePath):
+                os.remove(tempFilePath)
+            self.logger.logError(f"Error saving data to the file {fullFilePath}: {e}")
+            return None
 
-                # If programData is a list (individual programs)
-                elif isinstance(programData, list):
-                    for program in programData:
-                        currentDate = self.writeProgramData(file, program, currentDate, charReplacements)
+    @classmethod
+    def hasContent(cls, filePath: str, size: int, contentHash: str) -> bool:
+        """
+        Checks whether a file exists with the given content.
 
-                else:
-                    self.logger.logError("The format of programData is invalid. It should be either a dictionary or a list.")
-                    return
+        The size is compared first, so a file that changed length is never read.
 
-            self.logger.logInfo(f"File generated for {channelName}: {fullFilePath}")
+        Args:
+            filePath (str): The path of the file.
+            size (int): The expected size in bytes.
+            contentHash (str): The expected SHA-256, as a hex string.
 
-        except Exception as e:
-            self.logger.logError(f"Error saving data to the file {fullFilePath}: {e}")
+        Returns:
+            bool: True if the file has exactly that content.
+        """
+        try:
+            if os.path.getsize(filePath) != size:
+                return False
+            fileHash = hashlib.sha256()
+            with open(filePath, 'rb') as file:
+                for chunk in iter(lambda: file.read(cls.BUFFER_SIZE), b''):
+                    fileHash.update(chunk)
+        except OSError:
+            return False
+        return fileHash.hexdigest() == contentHash
+
+    @staticmethod
+    def iterPrograms(programData):
+        """
+        Iterates over the individual programs of the supported data shapes.
+
+        Args:
+            programData (dict or iterable): A dictionary of program lists or an iterable of programs.
+
+        Returns:
+            iterator or None: The programs in order, or None if the data has an invalid format.
+        """
+        if isinstance(programData, dict):
+            return itertools.chain.from_iterable(programData.values())
+        if isinstance(programData, (str, bytes)) or not isinstance(programData, Iterable):
+            return None
+        return iter(programData)
@@ -0,0 +1,29 @@
+import gzip
+from src.scrapers.core.jsonloutputwriter import JsonlOutputWriter
+
+class GzipJsonlOutputWriter(JsonlOutputWriter):
+    """
+    Writes guides as gzip-compressed JSON Lines.
+
+    The gzip header carries no file name nor timestamp, so the same guide always
+    compresses to the same bytes and unchanged files are detected.
+    """
+
+    extension = "jsonl.gz"
+    COMPRESS_LEVEL = 6
+
+    def writePrograms(self, file, channelName: str, programs, charReplacer):
+        """
+        Writes the programs of a channel as gzip-compressed JSON Lines.
+
+        Args:
+            file: The open binary file object where data will be written.
+            channelName (str): The name of the channel.
+            programs (iterable): The programs to write, in order.
+            charReplacer (CharReplacer): Unused, the text is written as scraped.
+
+        Returns:
+            None
+        """
+        with gzip.GzipFile(filename="", mode="wb", compresslevel=self.COMPRESS_LEVEL, fileobj=file, mtime=0) as gzipFile:
+            super().writePrograms(gzipFile, channelName, programs, charReplacer)
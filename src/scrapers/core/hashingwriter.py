@@ -0,0 +1,52 @@
+import hashlib
+
+class HashingWriter:
+    """
+    Writer that hashes everything it writes into a binary file, encoding text if needed.
+
+    It wraps the temporary file given to the output writers, so the content hash of a
+    guide is known as soon as the last program is written, without reading the file back.
+    """
+
+    def __init__(self, file, encoding: str = 'utf-8'):
+        """
+        Initializes the writer.
+
+        Args:
+            file: The open binary file object where data will be written.
+            encoding (str, optional): The text encoding. Defaults to 'utf-8'.
+        """
+        self.file = file
+        self.encoding = encoding
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        """
+        Hashes and writes bytes, or a text after encoding it.
+
+        Args:
+            data (bytes or str): The data to write.
+
+        Returns:
+            int: The number of bytes or characters given.
+        """
+        length = len(data)
+        if isinstance(data, str):
+            data = data.encode(self.encoding)
+        self.hash.update(data)
+        self.file.write(data)
+        self.size += memoryview(data).nbytes
+        return length
+
+    def flush(self):
+        """
+        Flushes the underlying file.
+        """
+        self.file.flush()
+
+    def hexdigest(self) -> str:
+        """
+        Returns the SHA-256 of everything written so far.
+        """
+        return self.hash.hexdigest()
@@ -0,0 +1,102 @@
+import html
+import re
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# Text that is not shown: comments, declarations and the content of script and style elements
+HIDDEN_MARKUP_PATTERN = re.compile(r"<!--.*?-->|<![^>]*>|<\?[^>]*>|<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r"</?[A-Za-z][^>]*>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+class HtmlParser:
+    """
+    Builds the BeautifulSoup documents of the HTML-based data processors.
+
+    The parser backend is chosen once per process: lxml when it is installed, which
+    builds the tree several times faster, and Python's built-in 'html.parser'
+    otherwise. Processors pass a `SoupStrainer` matching the schedule containers they
+    read, so the rest of the page (navigation, scripts, footers) is tokenized but
+    never turned into tags.
+    """
+
+    PREFERRED_BACKENDS = ("lxml", "html.parser")
+
+    _backend = None
+
+    @classmethod
+    def getBackend(cls) -> str:
+        """
+        Returns the parser backend in use, picking the first installed one on first use.
+
+        Returns:
+            str: The BeautifulSoup feature name of the backend (e.g. "lxml").
+        """
+        if cls._backend is None:
+            cls._backend = next(
+                (backend for backend in cls.PREFERRED_BACKENDS if builder_registry.lookup(backend) is not None),
+                "html.parser",
+            )
+        return cls._backend
+
+    @classmethod
+    def setBackend(cls, backend: str = None):
+        """
+        Forces a parser backend, or restores the automatic choice.
+
+        Args:
+            backend (str, optional): A BeautifulSoup feature name ("lxml", "html.parser", ...).
+                Defaults to None (automatic).
+
+        Raises:
+            ValueError: If the backend is not installed.
+        """
+        if backend is not None and builder_registry.lookup(backend) is None:
+            raise ValueError(f"HTML parser backend '{backend}' is not installed")
+        cls._backend = backend
+
+    @classmethod
+    def makeSoup(cls, rawData, parseOnly=None) -> BeautifulSoup:
+        """
+        Parses an HTML document with the selected backend.
+
+        Args:
+            rawData (str or bytes): The HTML document.
+            parseOnly (SoupStrainer, optional): Only the matching elements (and their
+                content) are kept. Defaults to None (whole document).
+
+        Returns:
+            BeautifulSoup: The parsed document.
+        """
+        return BeautifulSoup(rawData, cls.getBackend(), parse_only=parseOnly)
+
+    @staticmethod
+    def htmlToText(markup: str) -> str:
+        """
+        Extracts the text of a small HTML fragment (e.g. a synopsis) without building a soup.
+
+        Gives the same text as `BeautifulSoup(markup).get_text(strip=True)` with its
+        whitespace collapsed: tags are removed, each text between tags is unescaped and
+        stripped, and the texts are joined.
+
+        Args:
+            markup (str): The HTML fragment.
+
+        Returns:
+            str: The visible text, with runs of whitespace collapsed to one space.
+        """
+        markup = HIDDEN_MARKUP_PATTERN.sub("", markup)
+        text = "".join(html.unescape(part).strip() for part in TAG_PATTERN.split(markup))
+        return WHITESPACE_PATTERN.sub(" ", text)
+
+    @staticmethod
+    def collapseWhitespace(text: str) -> str:
+        """
+        Strips a text and collapses its runs of whitespace (line breaks included) to one space.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            str: The cleaned text.
+        """
+        return WHITESPACE_PATTERN.sub(" ", text.strip())
@@ -1,13 +1,140 @@
+import json
+import threading
+import time
 import requests
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from src.scrapers.core.backoff import Backoff
+from src.scrapers.core.circuitbreaker import CircuitBreaker
 from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
+from src.scrapers.core.ratelimiter import RateLimiter
+from src.scrapers.core.responsecache import ResponseCache
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of sending a request to a host whose circuit breaker is open.
+    """
 
 class HttpClient(IDataFetcher):
     """
     Class for handling HTTP requests.
+
+    All instances share a single process-wide `requests.Session`, so connections to the
+    same host are pooled and kept alive across URLs and across scrapers. Compressed
+    responses (gzip, deflate and, with Brotli installed, br) are requested and decoded
+    transparently by the session.
+
+    When the channel configuration has a 'cache' section, responses are kept in an
+    on-disk `ResponseCache` and revalidated with conditional GETs once their TTL expires.
+
+    Every request has connect and read timeouts. Connection errors, timeouts and 429/5xx
+    answers are retried with exponential backoff and jitter (honouring 'Retry-After'),
+    and a per-host `CircuitBreaker` makes requests fail fast once a host keeps failing.
+    These settings come from the channel's optional 'http' section. Requests to hosts
+    with a 'rateLimit' wait for the host's shared `RateLimiter` before being sent.
     """
 
+    DEFAULT_POOL_CONNECTIONS = 10  # Number of hosts whose connection pools are cached
+    DEFAULT_POOL_MAX_SIZE = 10  # Keep-alive connections kept open per host
+    DEFAULT_CONNECT_TIMEOUT = 10  # Seconds to establish a connection
+    DEFAULT_READ_TIMEOUT = 30  # Seconds to wait for data from the server
+    DEFAULT_MAX_RETRIES = 3  # Retries after the first attempt
+    MAX_RETRY_AFTER = 120  # Longest 'Retry-After' honoured, in seconds
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    _session = None
+    _sessionLock = threading.Lock()
+
     def __init__(self, logger):
         self.logger = logger
+        self.responseCache = None
+        self.timeout = (self.DEFAULT_CONNECT_TIMEOUT, self.DEFAULT_READ_TIMEOUT)
+        self.maxRetries = self.DEFAULT_MAX_RETRIES
+        self.backoff = Backoff()
+        self.failureThreshold = CircuitBreaker.DEFAULT_FAILURE_THRESHOLD
+        self.resetTimeout = CircuitBreaker.DEFAULT_RESET_TIMEOUT
+        self.rateLimit = None
+
+    def configure(self, channelConfig: dict):
+        """
+        Enables the response cache when the channel configuration has a 'cache' section,
+        and reads the timeouts, retries and circuit breaker settings from its 'http'
+        section (keys 'connectTimeout', 'readTimeout', 'maxRetries', 'backoff',
+        'failureThreshold' and 'resetTimeout'). A 'rateLimit' section limits the request
+        rate against the channel's hosts.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        cacheConfig = channelConfig.get("cache")
+        if cacheConfig:
+            self.responseCache = ResponseCache.fromConfig(cacheConfig, self.logger)
+
+        httpConfig = channelConfig.get("http", {})
+        self.timeout = (
+            httpConfig.get("connectTimeout", self.DEFAULT_CONNECT_TIMEOUT),
+            httpConfig.get("readTimeout", self.DEFAULT_READ_TIMEOUT),
+        )
+        self.maxRetries = max(0, httpConfig.get("maxRetries", self.DEFAULT_MAX_RETRIES))  # Always one attempt
+        self.backoff = Backoff.fromConfig(httpConfig.get("backoff", {}))
+        self.failureThreshold = httpConfig.get("failureThreshold", CircuitBreaker.DEFAULT_FAILURE_THRESHOLD)
+        self.resetTimeout = httpConfig.get("resetTimeout", CircuitBreaker.DEFAULT_RESET_TIMEOUT)
+        self.rateLimit = channelConfig.get("rateLimit")
+
+    @staticmethod
+    def buildSession(poolConnections: int, poolMaxSize: int):
+        """
+        Builds a session whose HTTP and HTTPS adapters keep the given connection pools.
+
+        Args:
+            poolConnections (int): Number of hosts whose connection pools are cached.
+            poolMaxSize (int): Maximum number of keep-alive connections kept per host.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=poolConnections, pool_maxsize=poolMaxSize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def configureSession(cls, poolConnections: int = DEFAULT_POOL_CONNECTIONS, poolMaxSize: int = DEFAULT_POOL_MAX_SIZE):
+        """
+        Replaces the shared session with a new one using the given connection pool sizes.
+
+        Args:
+            poolConnections (int, optional): Number of hosts whose connection pools are cached.
+            poolMaxSize (int, optional): Maximum number of keep-alive connections kept per host.
+
+        Returns:
+            requests.Session: The new shared session.
+        """
+        session = cls.buildSession(poolConnections, poolMaxSize)
+
+        with cls._sessionLock:
+            previousSession, cls._session = cls._session, session
+
+        if previousSession:
+            previousSession.close()
+        return session
+
+    @classmethod
+    def getSession(cls):
+        """
+        Returns the shared session, creating it with the default pool sizes on first use.
+
+        Returns:
+            requests.Session: The process-wide session used by every HttpClient.
+        """
+        if cls._session is None:
+            with cls._sessionLock:
+                if cls._session is None:
+                    cls._session = cls.buildSession(cls.DEFAULT_POOL_CONNECTIONS, cls.DEFAULT_POOL_MAX_SIZE)
+        return cls._session
 
     def fetchData(self, url, headers=None):
         """
@@ -20,11 +147,143 @@ class HttpClient(IDataFetcher):
         Returns:
             dict or str: The response content in JSON format if applicable, otherwise text.
         """
+        requestHeaders = headers
+        cachedEntry = self.responseCache.lookup(url, headers) if self.responseCache else None  # Counts the misses
+
+        if cachedEntry:
+            if self.responseCache.isFresh(cachedEntry):
+                self.responseCache.recordHit(cachedEntry)
+                return self.decodeBody(cachedEntry["body"], cachedEntry["contentType"])
+
+            validatorHeaders = ResponseCache.conditionalHeaders(cachedEntry)
+            if validatorHeaders:
+                requestHeaders = {**(headers or {}), **validatorHeaders}
+            else:
+                # A stale entry without validators cannot be revalidated: it is downloaded again
+                self.responseCache.recordMiss()
+                cachedEntry = None
+
         try:
-            response = requests.get(url, headers=headers)
+            response = self.getWithRetries(url, requestHeaders)
+
+            if cachedEntry:
+                if response.status_code == 304:
+                    self.responseCache.recordRevalidation(cachedEntry)
+                    self.logger.logInfo(f"Cached data from {url} is still valid")
+                    return self.decodeBody(cachedEntry["body"], cachedEntry["contentType"])
+                self.responseCache.recordMiss()  # The entry changed, or the revalidation failed
+                cachedEntry = None
+
             response.raise_for_status()  # Raises an exception for unsuccessful responses
             self.logger.logInfo(f"Successfully retrieved data from {url}")
+
+            if self.responseCache:
+                self.responseCache.store(
+                    url, headers, response.text, response.headers.get('Content-Type', ''),
+                    response.headers.get('ETag'), response.headers.get('Last-Modified')
+                )
+
             return response.json() if 'application/json' in response.headers.get('Content-Type', '') else response.text
         except requests.RequestException as requestError:
+            if cachedEntry:
+                self.responseCache.recordMiss()  # The revalidation got no answer
             self.logger.logError(f"Error retrieving data from {url}: {requestError}")
             return None
+
+    def getWithRetries(self, url: str, headers=None):
+        """
+        Sends a GET request, retrying connection errors, timeouts and 429/5xx answers.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (dict, optional): A dictionary of HTTP headers to include in the request.
+
+        Returns:
+            requests.Response: The last response received; it may still be a 429/5xx answer
+                               once the retries are exhausted.
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open.
+            requests.RequestException: If the request failed on every attempt, or failed
+                                       for a reason that is not worth retrying.
+        """
+        host = urlparse(url).netloc
+        circuitBreaker = CircuitBreaker.forHost(host, self.failureThreshold, self.resetTimeout)
+        rateLimiter = RateLimiter.forUrl(url, self.rateLimit)
+
+        for attempt in range(self.maxRetries + 1):
+            if not circuitBreaker.allowRequest():
+                raise CircuitOpenError(f"too many recent failures from {host}, request skipped")
+
+            if rateLimiter:
+                rateLimiter.acquire()
+
+            try:
+                response = self.getSession().get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as requestError:
+                circuitBreaker.recordFailure()
+                if attempt == self.maxRetries:
+                    raise
+                delay = self.backoff.getDelay(attempt)
+                self.logger.logInfo(f"Retrying {url} in {delay:.1f}s after error: {requestError}")
+            except requests.RequestException:
+                # Not worth retrying, but still a failure: a half-open trial must not stay unanswered
+                circuitBreaker.recordFailure()
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    circuitBreaker.recordSuccess()
+                    return response
+
+                circuitBreaker.recordFailure()
+                if attempt == self.maxRetries:
+                    return response
+                delay = self.getRetryAfter(response)
+                if delay is None:
+                    delay = self.backoff.getDelay(attempt)
+                self.logger.logInfo(f"Retrying {url} in {delay:.1f}s after HTTP {response.status_code}")
+
+            time.sleep(delay)
+
+    @classmethod
+    def getRetryAfter(cls, response):
+        """
+        Reads the delay requested by the server in the 'Retry-After' header.
+
+        Args:
+            response (requests.Response): A 429 or 5xx response.
+
+        Returns:
+            float or None: Seconds to wait (at most `MAX_RETRY_AFTER`), or None if the header
+                           is missing or invalid.
+        """
+        retryAfter = response.headers.get("Retry-After")
+        if not retryAfter:
+            return None
+
+        try:
+            delay = float(retryAfter)
+        except ValueError:
+            try:
+                retryDate = parsedate_to_datetime(retryAfter)
+            except (TypeError, ValueError):
+                return None
+            if retryDate.tzinfo is None:
+                retryDate = retryDate.replace(tzinfo=timezone.utc)
+            delay = (retryDate - datetime.now(timezone.utc)).total_seconds()
+
+        return min(max(delay, 0.0), cls.MAX_RETRY_AFTER)
+
+    @staticmethod
+    def decodeBody(body: str, contentType: str):
+        """
+        Decodes a cached body the same way a live response is decoded.
+
+        Args:
+            body (str): The response body.
+            contentType (str): The response 'Content-Type' header.
+
+        Returns:
+            dict or str: The JSON content if applicable, otherwise the text.
+        """
+        return json.loads(body) if 'application/json' in contentType else body
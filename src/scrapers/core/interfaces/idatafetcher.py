@@ -4,8 +4,23 @@ class IDataFetcher(ABC):
     """
     Abstract base class for a data fetcher.
     Classes implementing this interface should define the fetchData method.
+
+    Attributes:
+        requiresBrowser (bool): Whether the fetcher drives a real browser (e.g. Playwright).
+            Browser-based fetchers are much heavier and are scheduled on a separate pool.
     """
-    
+
+    requiresBrowser = False
+
+    def configure(self, channelConfig: dict):
+        """
+        Hook to read fetcher settings from the channel configuration. Does nothing by default.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        pass
+
     @abstractmethod
     def fetchData(self, url: str):
         """
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+class IOutputWriter(ABC):
+    """
+    Abstract base class for the writers of a guide file format.
+
+    Attributes:
+        extension (str): Extension of the files written in this format, without the dot.
+    """
+
+    extension = ""
+
+    @abstractmethod
+    def writePrograms(self, file, channelName: str, programs, charReplacer):
+        """
+        Writes the programs of a channel in this format.
+
+        Args:
+            file: The open binary file object where data will be written.
+            channelName (str): The name of the channel.
+            programs (iterable): The programs to write, in order.
+            charReplacer (CharReplacer): The character replacements of the run.
+
+        Returns:
+            None
+        """
+        pass
@@ -0,0 +1,53 @@
+import json
+from src.scrapers.core.interfaces.ioutputwriter import IOutputWriter
+from src.scrapers.core.programevent import ProgramEvent
+
+class JsonlOutputWriter(IOutputWriter):
+    """
+    Writes guides as JSON Lines: one JSON object per program with the keys in `FIELDS`.
+
+    The title and content are kept as scraped (only stripped): character replacements
+    and truncation exist for the SIBA text format, not for analytics.
+    """
+
+    extension = "jsonl"
+    FIELDS = ("channel", "date", "hour", "title", "content")
+
+    def writePrograms(self, file, channelName: str, programs, charReplacer):
+        """
+        Writes the programs of a channel as JSON Lines.
+
+        Args:
+            file: The open binary file object where data will be written.
+            channelName (str): The name of the channel.
+            programs (iterable): The programs to write, in order.
+            charReplacer (CharReplacer): Unused, the text is written as scraped.
+
+        Returns:
+            None
+        """
+        for program in programs:
+            record = self.toRecord(channelName, program)
+            file.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+
+    @staticmethod
+    def toRecord(channelName: str, program: dict) -> dict:
+        """
+        Builds the record of a program.
+
+        Args:
+            channelName (str): The name of the channel.
+            program (ProgramEvent or dict): The program data.
+
+        Returns:
+            dict: The program fields listed in `FIELDS`.
+        """
+        if isinstance(program, ProgramEvent):
+            return {"channel": channelName, **program.toDict()}
+        return {
+            "channel": channelName,
+            "date": program.get('date', ''),
+            "hour": program.get('hour', ''),
+            "title": program.get('title', '').strip(),
+            "content": program.get('content', '').strip(),
+        }
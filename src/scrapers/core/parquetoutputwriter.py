@@ -0,0 +1,32 @@
+import io
+import pandas as pd
+from src.scrapers.core.jsonloutputwriter import JsonlOutputWriter
+
+class ParquetOutputWriter(JsonlOutputWriter):
+    """
+    Writes guides as a columnar Parquet file (requires pyarrow), with the same columns
+    as the JSON Lines records.
+    """
+
+    extension = "parquet"
+
+    def writePrograms(self, file, channelName: str, programs, charReplacer):
+        """
+        Writes the programs of a channel as a Parquet file.
+
+        Args:
+            file: The open binary file object where data will be written.
+            channelName (str): The name of the channel.
+            programs (iterable): The programs to write, in order.
+            charReplacer (CharReplacer): Unused, the text is written as scraped.
+
+        Returns:
+            None
+        """
+        records = [self.toRecord(channelName, program) for program in programs]
+        dataFrame = pd.DataFrame(records, columns=list(self.FIELDS), dtype="string")
+
+        # Parquet needs a seekable target, so the file is built in memory first
+        buffer = io.BytesIO()
+        dataFrame.to_parquet(buffer, index=False)
+        file.write(buffer.getvalue())
@@ -0,0 +1,108 @@
+import sys
+from datetime import datetime
+
+class ProgramEvent:
+    """
+    A program of a guide, as built by the data processors.
+
+    A compact replacement for the four-key dictionaries the processors used to return:
+    the fields live in `__slots__`, the date and hour strings are formatted once and
+    interned (a guide repeats the same few dates and hours thousands of times), and the
+    start datetime is kept so events can be compared without parsing strings again.
+
+    It still reads like those dictionaries (`event["title"]`, `event.get("hour", "")`,
+    `"date" in event`) and compares equal to its `toDict()` form, so code written for
+    dictionaries keeps working.
+    """
+
+    __slots__ = ("start", "date", "hour", "title", "content")
+
+    FIELDS = ("date", "hour", "title", "content")
+
+    def __init__(self, start: datetime, date: str, hour: str, title: str, content: str):
+        """
+        Initializes the event.
+
+        Args:
+            start (datetime): Start of the event in the target timezone, or None if unknown.
+            date (str): The event date in 'YYYY-MM-DD' format.
+            hour (str): The event start time in 'HH:MM' format.
+            title (str): The title of the event.
+            content (str): The description of the event.
+        """
+        self.start = start
+        self.date = sys.intern(date.strip())
+        self.hour = sys.intern(hour.strip())
+        self.title = (title or "").strip()
+        self.content = (content or "").strip()
+
+    @classmethod
+    def fromStart(cls, start: datetime, title: str, content: str):
+        """
+        Builds an event from its start datetime, formatting its date and hour.
+
+        Args:
+            start (datetime): Start of the event in the target timezone.
+            title (str): The title of the event.
+            content (str): The description of the event.
+
+        Returns:
+            ProgramEvent: The event.
+        """
+        return cls(start, start.strftime("%Y-%m-%d"), start.strftime("%H:%M"), title, content)
+
+    @classmethod
+    def fromDict(cls, eventData: dict):
+        """
+        Builds an event from its dictionary form (e.g. read back from the event store).
+
+        The start is rebuilt, without timezone, from the date and hour.
+
+        Args:
+            eventData (dict): A dictionary with the keys 'date', 'hour', 'title' and 'content'.
+
+        Returns:
+            ProgramEvent: The event.
+        """
+        if isinstance(eventData, cls):
+            return eventData
+
+        date = eventData.get("date", "")
+        hour = eventData.get("hour", "")
+        try:
+            start = datetime.strptime(f"{date.strip()} {hour.strip()}", "%Y-%m-%d %H:%M")
+        except ValueError:
+            start = None
+        return cls(start, date, hour, eventData.get("title", ""), eventData.get("content", ""))
+
+    def toDict(self) -> dict:
+        """
+        Returns the dictionary form of the event, with the keys in `FIELDS`.
+        """
+        return {"date": self.date, "hour": self.hour, "title": self.title, "content": self.content}
+
+    def get(self, key: str, default=None):
+        """
+        Returns a field like `dict.get`.
+        """
+        return getattr(self, key, default) if key in self.FIELDS else default
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.FIELDS
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProgramEvent):
+            return (self.date, self.hour, self.title, self.content) == (other.date, other.hour, other.title, other.content)
+        if isinstance(other, dict):
+            return self.toDict() == other
+        return NotImplemented
+
+    __hash__ = None  # Mutable like the dictionaries it replaces
+
+    def __repr__(self) -> str:
+        return f"ProgramEvent({self.date} {self.hour} {self.title!r})"
@@ -0,0 +1,88 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+class RateLimiter:
+    """
+    Token bucket that limits the request rate against a host.
+
+    The bucket holds up to `burst` tokens and refills at `requestsPerSecond`. Each request
+    takes a token; when none is left, the request waits until its token is refilled.
+    Tokens are reserved in order, so concurrent callers are spaced out instead of all
+    waking up at once.
+
+    Limiters are shared process-wide, one per host (`RateLimiter.forUrl`): the first
+    channel that configures a 'rateLimit' for a host sets its budget, and every fetcher
+    requesting that host, in any channel, draws from it. The registry is not shared
+    between processes: with the 'process' executor each worker has its own limiters, so
+    a host requested from several workers may receive up to the configured rate times
+    the number of workers.
+    """
+
+    DEFAULT_BURST = 1
+
+    _limiters = {}
+    _limitersLock = threading.Lock()
+
+    def __init__(self, requestsPerSecond: float, burst: int = DEFAULT_BURST):
+        """
+        Initializes a full bucket.
+
+        Args:
+            requestsPerSecond (float): Sustained number of requests allowed per second.
+            burst (int, optional): Number of requests that may be sent back to back.
+        """
+        self.requestsPerSecond = float(requestsPerSecond)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updatedAt = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def forUrl(cls, url: str, rateLimitConfig: dict = None):
+        """
+        Returns the limiter of a URL's host, creating it from the configuration on first use.
+
+        Args:
+            url (str): The URL about to be requested.
+            rateLimitConfig (dict, optional): The 'rateLimit' section of the channel, with keys
+                                              'requestsPerSecond' and optional 'burst'.
+
+        Returns:
+            RateLimiter or None: The host's limiter, or None if no channel limits that host.
+        """
+        host = urlparse(url).netloc
+        with cls._limitersLock:
+            if host not in cls._limiters and rateLimitConfig:
+                cls._limiters[host] = cls(rateLimitConfig["requestsPerSecond"], rateLimitConfig.get("burst", cls.DEFAULT_BURST))
+            return cls._limiters.get(host)
+
+    @classmethod
+    def resetAll(cls):
+        """
+        Forgets every host limiter.
+        """
+        with cls._limitersLock:
+            cls._limiters = {}
+
+    def reserve(self) -> float:
+        """
+        Takes a token, borrowing it from the future if the bucket is empty.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request (0 if it may go now).
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updatedAt) * self.requestsPerSecond)
+            self.updatedAt = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.requestsPerSecond
+
+    def acquire(self):
+        """
+        Blocks the calling thread until a request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
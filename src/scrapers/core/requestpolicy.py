@@ -0,0 +1,133 @@
+import re
+from urllib.parse import urlsplit
+
+class RequestPolicy:
+    """
+    Decides which requests a Playwright page may make, so pages skip images, fonts,
+    stylesheets and third-party assets the scrapers never read.
+
+    A request is allowed when its resource type is in the allow-list and it goes to
+    the origin of the page (scheme, host and port) or its URL matches one of the
+    configured patterns. The navigation of the page itself is always same-origin, so
+    third-party scripts, frames and API calls only load when a pattern allows them.
+    Requests matching the required pattern (the response a fetcher waits for) are
+    always allowed. Everything else is aborted before it reaches the network.
+    """
+
+    DEFAULT_RESOURCE_TYPES = ("document", "script", "xhr", "fetch")
+
+    def __init__(self, allowedResourceTypes=DEFAULT_RESOURCE_TYPES, allowedUrlPatterns=None, requiredUrlPattern=None):
+        """
+        Initializes the policy.
+
+        Args:
+            allowedResourceTypes (iterable[str], optional): Playwright resource types that may be loaded.
+            allowedUrlPatterns (iterable[str], optional): Regular expressions of the URLs that may be
+                                                          loaded from other origins than the page's.
+            requiredUrlPattern (str or re.Pattern, optional): URLs that are always loaded, whatever their
+                                                              origin or resource type (e.g. the response the
+                                                              fetcher's `WaitStrategy` waits for).
+        """
+        self.allowedResourceTypes = frozenset(allowedResourceTypes)
+        self.allowedUrlPattern = re.compile("|".join(f"(?:{pattern})" for pattern in allowedUrlPatterns)) if allowedUrlPatterns else None
+        self.requiredUrlPattern = re.compile(requiredUrlPattern) if requiredUrlPattern else None
+        self.blockedRequests = 0
+
+    @classmethod
+    def fromConfig(cls, policyConfig: dict, requiredUrlPattern=None):
+        """
+        Builds a policy from the 'requestPolicy' section of a channel configuration.
+
+        Args:
+            policyConfig (dict): Optional keys 'allowedResourceTypes' and 'allowedUrlPatterns'.
+            requiredUrlPattern (str or re.Pattern, optional): URLs that are always loaded.
+
+        Returns:
+            RequestPolicy: The configured policy.
+        """
+        return cls(
+            policyConfig.get("allowedResourceTypes", cls.DEFAULT_RESOURCE_TYPES),
+            policyConfig.get("allowedUrlPatterns"),
+            requiredUrlPattern,
+        )
+
+    @staticmethod
+    def getOrigin(url: str) -> tuple:
+        """
+        Returns the origin of a URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            tuple: The scheme and the network location (host and port), lowercased.
+        """
+        parts = urlsplit(url or "")
+        return parts.scheme.lower(), parts.netloc.lower()
+
+    @staticmethod
+    def getPageUrl(request) -> str:
+        """
+        Returns the URL of the page a Playwright request is made for.
+
+        The navigation of the main frame is the page itself, so its own URL is returned.
+
+        Args:
+            request (playwright Request): The intercepted request.
+
+        Returns:
+            str: The URL of the page, or None if the request has no page (e.g. a service worker).
+        """
+        try:
+            if request.is_navigation_request() and request.frame.parent_frame is None:
+                return request.url
+            return request.frame.page.url
+        except Exception:
+            return None
+
+    def isAllowed(self, resourceType: str, url: str, pageUrl: str = None) -> bool:
+        """
+        Checks whether a request may be loaded.
+
+        Args:
+            resourceType (str): The Playwright resource type of the request (e.g. 'image').
+            url (str): The requested URL.
+            pageUrl (str, optional): The URL of the page making the request. Defaults to None
+                                     (unknown, so only the URL patterns can allow it).
+
+        Returns:
+            bool: True if the request passes the policy.
+        """
+        if self.requiredUrlPattern is not None and self.requiredUrlPattern.search(url) is not None:
+            return True
+        if resourceType not in self.allowedResourceTypes:
+            return False
+        if pageUrl and self.getOrigin(url) == self.getOrigin(pageUrl):
+            return True
+        return self.allowedUrlPattern is not None and self.allowedUrlPattern.search(url) is not None
+
+    def handleRoute(self, route):
+        """
+        Route handler for the sync Playwright API (`page.route("**/*", policy.handleRoute)`).
+
+        Args:
+            route (playwright.sync_api.Route): The intercepted request.
+        """
+        if self.isAllowed(route.request.resource_type, route.request.url, self.getPageUrl(route.request)):
+            route.continue_()
+        else:
+            self.blockedRequests += 1
+            route.abort()
+
+    async def handleRouteAsync(self, route):
+        """
+        Route handler for the async Playwright API.
+
+        Args:
+            route (playwright.async_api.Route): The intercepted request.
+        """
+        if self.isAllowed(route.request.resource_type, route.request.url, self.getPageUrl(route.request)):
+            await route.continue_()
+        else:
+            self.blockedRequests += 1
+            await route.abort()
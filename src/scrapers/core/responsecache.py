@@ -0,0 +1,360 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+class ResponseCache:
+    """
+    On-disk cache of HTTP responses with conditional revalidation and an LRU size cap.
+
+    Each request (URL plus headers) has a small JSON entry with its validators (ETag and
+    Last-Modified) that points to a gzip-compressed body stored by the SHA-256 of its
+    content, so identical bodies are stored only once. Entries younger than the TTL are
+    served without touching the network; older ones are revalidated with a conditional GET.
+    When the bodies exceed the size cap, the least recently used entries are evicted.
+
+    Layout:
+        <cachePath>/entries/<ab>/<requestKey>.json
+        <cachePath>/blobs/<cd>/<contentHash>.gz
+    """
+
+    DEFAULT_PATH = "./cache/http"
+    DEFAULT_TTL = 6 * 60 * 60  # Seconds an entry is served without revalidation
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # Size cap of the compressed bodies
+
+    def __init__(self, logger, cachePath: str = DEFAULT_PATH, ttl: int = DEFAULT_TTL, maxBytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache and creates its folders if they don't exist.
+
+        Args:
+            logger: Logger instance to log info and errors.
+            cachePath (str, optional): Folder where entries and bodies are stored.
+            ttl (int, optional): Seconds an entry is considered fresh.
+            maxBytes (int, optional): Maximum size of the stored bodies before evicting entries.
+        """
+        self.logger = logger
+        self.cachePath = cachePath
+        self.ttl = ttl
+        self.maxBytes = maxBytes
+        self.entriesPath = os.path.join(cachePath, "entries")
+        self.blobsPath = os.path.join(cachePath, "blobs")
+        os.makedirs(self.entriesPath, exist_ok=True)
+        os.makedirs(self.blobsPath, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytesSaved = 0
+        self.storedBytes = None  # Computed lazily on the first store
+
+    @classmethod
+    def fromConfig(cls, cacheConfig: dict, logger):
+        """
+        Builds a cache from the 'cache' section of a channel configuration.
+
+        Args:
+            cacheConfig (dict): Optional keys 'path', 'ttl' (seconds) and 'maxBytes'.
+            logger: Logger instance to log info and errors.
+
+        Returns:
+            ResponseCache: The configured cache.
+        """
+        return cls(
+            logger,
+            cacheConfig.get("path", cls.DEFAULT_PATH),
+            cacheConfig.get("ttl", cls.DEFAULT_TTL),
+            cacheConfig.get("maxBytes", cls.DEFAULT_MAX_BYTES),
+        )
+
+    @staticmethod
+    def buildKey(url: str, headers: dict = None) -> str:
+        """
+        Builds the cache key of a request from its URL and headers.
+
+        Args:
+            url (str): The requested URL.
+            headers (dict, optional): The request headers.
+
+        Returns:
+            str: A hexadecimal SHA-256 digest identifying the request.
+        """
+        normalizedHeaders = sorted((name.lower(), value) for name, value in (headers or {}).items())
+        return hashlib.sha256(json.dumps([url, normalizedHeaders]).encode("utf-8")).hexdigest()
+
+    def entryFilePath(self, key: str) -> str:
+        """
+        Returns the path of the JSON entry of a request key.
+        """
+        return os.path.join(self.entriesPath, key[:2], f"{key}.json")
+
+    def blobFilePath(self, contentHash: str) -> str:
+        """
+        Returns the path of the compressed body with the given content hash.
+        """
+        return os.path.join(self.blobsPath, contentHash[:2], f"{contentHash}.gz")
+
+    def lookup(self, url: str, headers: dict = None):
+        """
+        Looks up the cached response of a request and marks it as recently used.
+
+        A request with no usable entry is counted as a miss here, whether or not its
+        download succeeds afterwards.
+
+        Args:
+            url (str): The requested URL.
+            headers (dict, optional): The request headers.
+
+        Returns:
+            dict or None: The entry with its metadata and the decoded 'body', or None if
+                          the request is not cached or its body is missing.
+        """
+        key = self.buildKey(url, headers)
+        entryPath = self.entryFilePath(key)
+
+        try:
+            with open(entryPath, "r", encoding="utf-8") as entryFile:
+                entry = json.load(entryFile)
+            with gzip.open(self.blobFilePath(entry["contentHash"]), "rb") as blobFile:
+                entry["body"] = blobFile.read().decode("utf-8")
+            os.utime(entryPath)  # The modification time tracks the last use for the LRU
+        except (OSError, ValueError, KeyError):
+            self.recordMiss()
+            return None
+
+        entry["key"] = key
+        return entry
+
+    def isFresh(self, entry: dict) -> bool:
+        """
+        Checks whether an entry can be served without revalidating it.
+
+        Args:
+            entry (dict): An entry returned by `lookup`.
+
+        Returns:
+            bool: True if the entry is younger than the TTL.
+        """
+        return time.time() - entry["storedAt"] < self.ttl
+
+    @staticmethod
+    def conditionalHeaders(entry: dict) -> dict:
+        """
+        Builds the headers of a conditional GET for a cached entry.
+
+        Args:
+            entry (dict): An entry returned by `lookup`.
+
+        Returns:
+            dict: 'If-None-Match' and/or 'If-Modified-Since' when the entry has validators.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def recordHit(self, entry: dict):
+        """
+        Counts a response served from the cache without any request.
+
+        Args:
+            entry (dict): The entry that was served.
+        """
+        with self.lock:
+            self.hits += 1
+            self.bytesSaved += len(entry["body"])
+
+    def recordMiss(self):
+        """
+        Counts a request the cache could not answer, so its response has to be downloaded.
+        """
+        with self.lock:
+            self.misses += 1
+
+    def recordRevalidation(self, entry: dict):
+        """
+        Counts a '304 Not Modified' answer and restarts the TTL of the entry.
+
+        Args:
+            entry (dict): The entry that was revalidated.
+        """
+        entry["storedAt"] = time.time()
+        self.writeEntry(entry["key"], entry)
+
+        with self.lock:
+            self.revalidated += 1
+            self.bytesSaved += len(entry["body"])
+
+    def store(self, url: str, headers: dict, body: str, contentType: str, etag: str = None, lastModified: str = None):
+        """
+        Stores a downloaded response and evicts old entries if the size cap is exceeded.
+
+        Args:
+            url (str): The requested URL.
+            headers (dict): The request headers.
+            body (str): The response body.
+            contentType (str): The response 'Content-Type' header.
+            etag (str, optional): The response 'ETag' header.
+            lastModified (str, optional): The response 'Last-Modified' header.
+        """
+        encodedBody = body.encode("utf-8")
+        contentHash = hashlib.sha256(encodedBody).hexdigest()
+        blobPath = self.blobFilePath(contentHash)
+        addedBytes = 0
+
+        try:
+            if not os.path.exists(blobPath):
+                self.writeAtomically(blobPath, gzip.compress(encodedBody))
+                addedBytes = os.path.getsize(blobPath)
+
+            self.writeEntry(self.buildKey(url, headers), {
+                "url": url,
+                "contentType": contentType,
+                "etag": etag,
+                "lastModified": lastModified,
+                "storedAt": time.time(),
+                "contentHash": contentHash,
+            })
+        except OSError as cacheError:
+            self.logger.logError(f"Error storing {url} in the response cache: {cacheError}")
+            return
+
+        with self.lock:
+            if self.storedBytes is None:
+                self.storedBytes = self.computeStoredBytes()
+            else:
+                self.storedBytes += addedBytes
+            mustEvict = self.storedBytes > self.maxBytes
+
+        if mustEvict:
+            self.evict()
+
+    def writeEntry(self, key: str, entry: dict):
+        """
+        Writes the metadata of an entry, leaving out the fields added by `lookup`.
+
+        Args:
+            key (str): The request key of the entry.
+            entry (dict): The entry to write.
+        """
+        metadata = {name: value for name, value in entry.items() if name not in ("body", "key")}
+        self.writeAtomically(self.entryFilePath(key), json.dumps(metadata).encode("utf-8"))
+
+    @staticmethod
+    def writeAtomically(filePath: str, content: bytes):
+        """
+        Writes a file through a temporary file and a rename, so readers never see partial content.
+
+        Args:
+            filePath (str): The final path of the file.
+            content (bytes): The content to write.
+        """
+        folder = os.path.dirname(filePath)
+        os.makedirs(folder, exist_ok=True)
+        fileDescriptor, tempPath = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fileDescriptor, "wb") as tempFile:
+                tempFile.write(content)
+            os.replace(tempPath, filePath)
+        except OSError:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+
+    def computeStoredBytes(self) -> int:
+        """
+        Computes the size of all the stored bodies.
+
+        Returns:
+            int: The total size in bytes.
+        """
+        totalBytes = 0
+        for folder, _, fileNames in os.walk(self.blobsPath):
+            for fileName in fileNames:
+                totalBytes += os.path.getsize(os.path.join(folder, fileName))
+        return totalBytes
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the bodies use at most 90% of the
+        size cap, then deletes the bodies no remaining entry points to.
+        """
+        entries = []
+        for folder, _, fileNames in os.walk(self.entriesPath):
+            for fileName in fileNames:
+                if not fileName.endswith(".json"):
+                    continue
+                entryPath = os.path.join(folder, fileName)
+                try:
+                    with open(entryPath, "r", encoding="utf-8") as entryFile:
+                        contentHash = json.load(entryFile)["contentHash"]
+                    entries.append((os.path.getmtime(entryPath), entryPath, contentHash))
+                except (OSError, ValueError, KeyError):
+                    continue
+
+        entries.sort()  # Oldest use first
+        blobSizes = {}
+        for _, _, contentHash in entries:
+            if contentHash not in blobSizes:
+                blobPath = self.blobFilePath(contentHash)
+                blobSizes[contentHash] = os.path.getsize(blobPath) if os.path.exists(blobPath) else 0
+
+        referenceCounts = {}
+        for _, _, contentHash in entries:
+            referenceCounts[contentHash] = referenceCounts.get(contentHash, 0) + 1
+
+        targetBytes = int(self.maxBytes * 0.9)
+        storedBytes = sum(blobSizes.values())
+        evictedEntries = 0
+
+        for _, entryPath, contentHash in entries:
+            if storedBytes <= targetBytes:
+                break
+            try:
+                os.remove(entryPath)
+            except OSError:
+                continue
+            evictedEntries += 1
+            referenceCounts[contentHash] -= 1
+            if referenceCounts[contentHash] == 0:
+                try:
+                    os.remove(self.blobFilePath(contentHash))
+                except OSError:
+                    pass
+                storedBytes -= blobSizes[contentHash]
+
+        # Bodies left behind by entries that were overwritten with new content. Recent ones
+        # are kept because their entry may still be being written by another worker.
+        orphanDeadline = time.time() - 60
+        for folder, _, fileNames in os.walk(self.blobsPath):
+            for fileName in fileNames:
+                blobPath = os.path.join(folder, fileName)
+                if referenceCounts.get(fileName[:-len(".gz")], 0) > 0:
+                    continue
+                try:
+                    if os.path.getmtime(blobPath) < orphanDeadline:
+                        os.remove(blobPath)
+                except OSError:
+                    pass
+
+        with self.lock:
+            self.storedBytes = self.computeStoredBytes()
+
+        self.logger.logInfo(f"Response cache evicted {evictedEntries} entries ({self.storedBytes} bytes kept)")
+
+    def logStats(self, channelName: str):
+        """
+        Logs how many responses of a channel were served from the cache.
+
+        Args:
+            channelName (str): The channel the statistics belong to.
+        """
+        self.logger.logInfo(
+            f"Response cache for {channelName}: {self.hits} hits, {self.revalidated} revalidated, "
+            f"{self.misses} misses, {self.bytesSaved / 1024:.1f} KB not downloaded"
+        )
@@ -1,9 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import BoundedSemaphore
+from urllib.parse import urlparse
 from src.scrapers.core.interfaces.ichannelscraper import IChannelScraper
+from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
 from src.scrapers.core.urlgenerator import UrlGenerator
+from src.scrapers.core.eventstore import EventStore
+from src.scrapers.core.duplicateremover import DuplicateRemover
 from src.scrapers.core.filewriter import FileWriter
 from src.scrapers.core.logger import Logger
 
 class ScraperBase(IChannelScraper):
+    DEFAULT_MAX_CONCURRENCY = 8  # Simultaneous requests per channel
+    DEFAULT_MAX_CONCURRENCY_PER_HOST = 4  # Simultaneous requests against the same host
+    DEFAULT_FINAL_AFTER_DAYS = 2  # Dates older than this many days are considered final
+    DEFAULT_STORE_PATH = "./data/store"  # Where the incremental mode keeps final dates
+
     def __init__(self, channelConfig, urlFormatter, dataFetcher, dataProcessor, headers=None):
         """
         Base class for channel scrapers, providing common functionality for fetching,
@@ -23,6 +35,30 @@ class ScraperBase(IChannelScraper):
         self.urlGenerator = UrlGenerator(channelConfig["url"], urlFormatter)  # Initializes the URL generator
         self.fileWriter = FileWriter(Logger())  # Initializes FileWriter with a logger
         self.headers = headers  # Use provided headers or default to None
+
+        # Let the fetcher pick up its own channel settings (concurrency, timeouts, ...)
+        if isinstance(dataFetcher, IDataFetcher):
+            dataFetcher.configure(channelConfig)
+
+        # Incremental mode: final dates are read from an event store instead of the network
+        self.incrementalConfig = channelConfig.get("incremental")
+        self.eventStore = None
+        if self.incrementalConfig:
+            storePath = self.incrementalConfig.get("storePath", self.DEFAULT_STORE_PATH)
+            self.eventStore = EventStore(storePath, channelConfig.get("fileName", "default"), Logger())
+        self.finalBeforeDate = None  # Dates strictly before this one ('YYYY-MM-DD') are final
+        self.urlDates = {}  # Date each pending URL was generated for
+        self.pendingDateUrls = {}  # URLs of each date not fetched and processed yet
+        self.completeDates = set()  # Dates whose every URL or window was fetched and processed
+        self.storedEvents = {}  # Events of final dates loaded from the store, by date
+        self.fetchedEvents = {}  # Events processed during this run, by date
+        self.fileStatuses = {}  # Outcome of each saved file (FileWriter.CHANGED, ...), by file name
+        self.outputFormats = channelConfig.get("outputFormats", FileWriter.DEFAULT_OUTPUT_FORMATS)
+
+        # Duplicate removal ('dedupe': keys, policy, overlapMinutes); default descriptions are not real synopses
+        defaultDescriptions = [channelConfig.get("defaultDescription")]
+        defaultDescriptions += [subChannel.get("defaultDescription") for subChannel in channelConfig.get("subChannels", [])]
+        self.duplicateRemover = DuplicateRemover.fromConfig(channelConfig.get("dedupe"), defaultDescriptions)
         
     def getDataFromUrl(self, url: str):
         """
@@ -35,10 +71,207 @@ class ScraperBase(IChannelScraper):
             dict or str: Parsed JSON data if applicable, otherwise raw text data.
         """
         return self.dataFetcher.fetchData(url, self.headers) if self.headers else self.dataFetcher.fetchData(url)
+
+    def fetchAll(self, urls: list) -> list:
+        """
+        Retrieves data from several URLs concurrently, keeping each result next to its URL.
+
+        The number of simultaneous requests is bounded by the channel settings
+        'maxConcurrency' and 'maxConcurrencyPerHost'. Fetchers that provide their own
+        `fetchMany` (e.g. `AsyncHttpClient`) receive all the URLs at once. Browser-based
+        fetchers are not thread-safe, so their URLs are always fetched one after another.
+
+        Args:
+            urls (list[str]): The URLs from which data should be fetched.
+
+        Returns:
+            list[tuple]: A list of (url, data) pairs in the same order as `urls`, where data is
+                         whatever `getDataFromUrl` returned for that URL.
+        """
+        fetchMany = getattr(self.dataFetcher, "fetchMany", None)
+        if fetchMany:
+            return list(zip(urls, fetchMany(urls, self.headers)))
+
+        maxConcurrency = self.channelConfig.get("maxConcurrency", self.DEFAULT_MAX_CONCURRENCY)
+        maxConcurrencyPerHost = self.channelConfig.get("maxConcurrencyPerHost", self.DEFAULT_MAX_CONCURRENCY_PER_HOST)
+
+        if len(urls) <= 1 or maxConcurrency <= 1 or getattr(self.dataFetcher, "requiresBrowser", False):
+            return [(url, self.getDataFromUrl(url)) for url in urls]
+
+        # One semaphore per host, created up front so worker threads never race to create them
+        hostSemaphores = {
+            urlparse(url).netloc: BoundedSemaphore(max(1, maxConcurrencyPerHost))
+            for url in urls
+        }
+
+        def fetchWithHostLimit(url):
+            with hostSemaphores[urlparse(url).netloc]:
+                return self.getDataFromUrl(url)
+
+        with ThreadPoolExecutor(max_workers=min(maxConcurrency, len(urls))) as executor:
+            results = list(executor.map(fetchWithHostLimit, urls))
+
+        return list(zip(urls, results))
     
+    def getIncrementalDates(self, startDate: str, numberOfDays: int) -> list:
+        """
+        Generates the dates of a range that still have to be fetched.
+
+        Without an 'incremental' section in the channel configuration every date is
+        returned. Otherwise, dates strictly before today minus 'finalAfterDays' whose
+        events are in the store are loaded from it and left out.
+
+        Args:
+            startDate (str): The initial date, in the format 'YYYY-MM-DD'.
+            numberOfDays (int): The number of days before and after the initial date.
+
+        Returns:
+            list[str]: The pending dates, in 'YYYY-MM-DD' format.
+        """
+        dates = [date.strftime("%Y-%m-%d") for date in self.urlGenerator.getDates(startDate, numberOfDays)]
+        if not self.eventStore:
+            return dates
+
+        finalAfterDays = self.incrementalConfig.get("finalAfterDays", self.DEFAULT_FINAL_AFTER_DAYS)
+        self.finalBeforeDate = (datetime.now() - timedelta(days=finalAfterDays)).strftime("%Y-%m-%d")
+
+        for dateStr in dates:
+            if dateStr < self.finalBeforeDate:
+                storedEvents = self.eventStore.load(dateStr)
+                if storedEvents is not None:
+                    self.storedEvents[dateStr] = storedEvents
+
+        return [dateStr for dateStr in dates if dateStr not in self.storedEvents]
+
+    def getIncrementalUrls(self, startDate: str, numberOfDays: int) -> list:
+        """
+        Generates the URLs of a date range, leaving out the final dates that are already stored.
+
+        Without an 'incremental' section in the channel configuration this is the same as
+        `urlGenerator.getDateUrls`. Otherwise only the URLs of the dates returned by
+        `getIncrementalDates` (the changing window and any final date missing from the
+        store) are fetched.
+
+        Args:
+            startDate (str): The initial date, in the format 'YYYY-MM-DD'.
+            numberOfDays (int): The number of days before and after the initial date.
+
+        Returns:
+            list[str]: The URLs that still have to be fetched.
+        """
+        datedUrls = self.urlGenerator.getDatedUrls(startDate, numberOfDays)
+        if not self.eventStore:
+            return [url for _, url in datedUrls]
+
+        pendingDates = set(self.getIncrementalDates(startDate, numberOfDays))
+        pendingUrls = []
+        for dateStr, url in datedUrls:
+            if dateStr in pendingDates:
+                self.urlDates[url] = dateStr
+                self.pendingDateUrls.setdefault(dateStr, set()).add(url)
+                pendingUrls.append(url)
+
+        self.eventStore.logger.logInfo(
+            f"Incremental mode for {self.channelConfig.get('fileName')}: {len(self.storedEvents)} dates read from the store, "
+            f"{len(pendingUrls)} of {len(datedUrls)} URLs to fetch"
+        )
+        return pendingUrls
+
+    def recordEvents(self, url: str, events: list):
+        """
+        Remembers the processed events of a URL so final dates can be stored after the run.
+
+        Must only be called for URLs that were fetched and processed: a date is complete,
+        and may be stored, once every one of its URLs has been recorded.
+
+        Does nothing when the incremental mode is disabled.
+
+        Args:
+            url (str): A URL returned by `getIncrementalUrls`.
+            events (list): The events processed from that URL.
+        """
+        if self.eventStore and url in self.urlDates:
+            dateStr = self.urlDates[url]
+            self.recordDateEvents(dateStr, events)
+            pendingUrls = self.pendingDateUrls.get(dateStr, set())
+            pendingUrls.discard(url)
+            if not pendingUrls:
+                self.markDateComplete(dateStr)
+
+    def recordDateEvents(self, dateStr: str, events: list):
+        """
+        Remembers the processed events of a date so they can be stored after the run if final.
+
+        The date is only stored if it is also marked with `markDateComplete`.
+
+        Does nothing when the incremental mode is disabled.
+
+        Args:
+            dateStr (str): The date the events were fetched for, in 'YYYY-MM-DD' format.
+            events (list): The events processed for that date.
+        """
+        if self.eventStore:
+            self.fetchedEvents.setdefault(dateStr, []).extend(events)
+
+    def markDateComplete(self, dateStr: str):
+        """
+        Marks a date whose every URL or window was fetched and processed during this run.
+
+        Does nothing when the incremental mode is disabled.
+
+        Args:
+            dateStr (str): The date in 'YYYY-MM-DD' format.
+        """
+        if self.eventStore:
+            self.completeDates.add(dateStr)
+
+    def withStoredEvents(self, data: dict) -> dict:
+        """
+        Stores the final dates fetched during this run and adds the stored dates to the data.
+
+        Only complete dates with at least one event are stored, so a date that failed,
+        came back empty or was only partially fetched is fetched again on the next run.
+
+        Returns the data unchanged when the incremental mode is disabled.
+
+        Args:
+            data (dict): The program data fetched during this run, grouped by date key.
+
+        Returns:
+            dict: The stored and fetched dates in chronological order; a date in both keeps
+                  the fetched data.
+        """
+        if not self.eventStore:
+            return data
+
+        for dateStr, events in self.fetchedEvents.items():
+            if dateStr < self.finalBeforeDate and dateStr in self.completeDates and events:
+                self.eventStore.save(dateStr, events)
+
+        return {
+            dateStr: data[dateStr] if dateStr in data else self.storedEvents[dateStr]
+            for dateStr in sorted(set(self.storedEvents) | set(data))
+        }
+
+    def removeDuplicates(self, data):
+        """
+        Removes duplicate programs with the channel's duplicate settings ('dedupe').
+
+        Args:
+            data (dict or list): The program data, grouped by date or sub-channel, or the
+                                 programs of a single output file.
+
+        Returns:
+            dict or list: The data without duplicates, in the same shape.
+        """
+        if isinstance(data, dict):
+            return self.duplicateRemover.remove(data)
+        return self.duplicateRemover.deduplicate(data)
+
     def saveData(self, fileName: str, data: dict, charReplacements: dict, filePath: str):
         """
-        Saves processed program data to a structured text file.
+        Saves processed program data in the output formats of the channel ('outputFormats',
+        the SIBA text format by default).
 
         Args:
             fileName (str): The name of the output file (without extension).
@@ -46,4 +279,22 @@ class ScraperBase(IChannelScraper):
             charReplacements (dict): Dictionary of character replacements to clean the data.
             filePath (str): Directory where the output file will be saved.
         """
-        self.fileWriter.saveDataToTxt(fileName, data, charReplacements, filePath)
+        statuses = self.fileWriter.saveData(fileName, data, charReplacements, filePath, self.outputFormats)
+        for outputFormat, status in statuses.items():
+            self.fileStatuses[f"{fileName}.{outputFormat}"] = status
+
+    def getOutputStatus(self) -> str:
+        """
+        Summarizes whether the files saved during the run changed.
+
+        Returns:
+            str: 'changed' if any file was rewritten, 'unchanged' if every file already had
+                 the same content, 'not saved' if a file could not be saved, or an empty
+                 string if nothing was saved.
+        """
+        statuses = set(self.fileStatuses.values())
+        if None in statuses:
+            return "not saved"
+        if FileWriter.CHANGED in statuses:
+            return FileWriter.CHANGED
+        return FileWriter.UNCHANGED if statuses else ""
@@ -0,0 +1,174 @@
+import threading
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+import pytz
+
+MISSING = object()
+ONE_DAY = timedelta(days=1)
+
+class TimezoneConverter:
+    """
+    Converts naive event datetimes from a channel's source timezone to the guide's target timezone.
+
+    Zone offsets only change a couple of times a year, so they are cached per day: the
+    UTC offset of each source-local day and the target offset of each UTC day are
+    computed once with pytz, and every other event of that day is converted with two
+    dictionary lookups and a `timedelta` addition. The few days that contain a DST
+    change are cached per quarter hour instead. Results are the same aware datetimes as
+    `sourceZone.localize(value).astimezone(targetZone)`, ambiguous and nonexistent
+    local times included (pytz's `is_dst=False` rule).
+
+    Converters are shared process-wide, one per (source, target) pair
+    (`TimezoneConverter.forZones`), so every processor of a run reuses the same caches.
+    """
+
+    DEFAULT_TARGET_TIMEZONE = "America/Bogota"
+
+    HOURS = [f"{hour:02}:{minute:02}" for hour in range(24) for minute in range(60)]  # 'HH:MM' by minute of the day
+
+    _converters = {}
+    _convertersLock = threading.Lock()
+
+    def __init__(self, sourceTimezone: str, targetTimezone: str = DEFAULT_TARGET_TIMEZONE):
+        """
+        Initializes the converter.
+
+        Args:
+            sourceTimezone (str): The timezone of the source event data (e.g., "UTC").
+            targetTimezone (str, optional): The timezone of the guide. Defaults to "America/Bogota".
+        """
+        self.sourceZone = pytz.timezone(sourceTimezone)
+        self.targetZone = pytz.timezone(targetTimezone)
+        self.sourceOffsets = {}  # Source-local day or quarter hour -> UTC offset (None: see quarters)
+        self.targetOffsets = {}  # UTC day or quarter hour -> (target offset, target tzinfo) (None: see quarters)
+        self.dates = {}  # (year, month, day) -> 'YYYY-MM-DD'
+
+    @classmethod
+    def forZones(cls, sourceTimezone: str, targetTimezone: str = DEFAULT_TARGET_TIMEZONE):
+        """
+        Returns the converter of a (source, target) pair, creating it on first use.
+
+        Args:
+            sourceTimezone (str): The timezone of the source event data.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to "America/Bogota".
+
+        Returns:
+            TimezoneConverter: The converter shared by every processor using that pair.
+        """
+        key = (sourceTimezone, targetTimezone or cls.DEFAULT_TARGET_TIMEZONE)
+        with cls._convertersLock:
+            if key not in cls._converters:
+                cls._converters[key] = cls(*key)
+            return cls._converters[key]
+
+    def convert(self, value: datetime) -> datetime:
+        """
+        Converts a datetime to the target timezone.
+
+        Args:
+            value (datetime): A naive datetime in the source timezone, or an aware datetime.
+
+        Returns:
+            datetime: The aware datetime in the target timezone.
+        """
+        if value.tzinfo is not None:
+            utcValue = value.astimezone(timezone.utc).replace(tzinfo=None)
+        else:
+            utcValue = value - self.getCached(self.sourceOffsets, value, self.getSourceOffset)
+
+        targetOffset, targetTzinfo = self.getCached(self.targetOffsets, utcValue, self.getTargetOffset)
+        return (utcValue + targetOffset).replace(tzinfo=targetTzinfo)
+
+    @staticmethod
+    def getCached(cache: dict, value: datetime, compute):
+        """
+        Returns the cached offset of a naive datetime, computing it for its day if needed.
+
+        A day is cached only when the offset is the same at its start and at the start of
+        the next day; otherwise the day is marked with None and its quarter hours are
+        cached one by one.
+
+        Args:
+            cache (dict): The cache, keyed by date and by quarter-hour datetime.
+            value (datetime): The naive datetime.
+            compute (Callable): Computes the offset at a naive datetime.
+
+        Returns:
+            The offset of `value`, as returned by `compute`.
+        """
+        day = value.date()
+        offset = cache.get(day, MISSING)
+        if offset is MISSING:
+            dayStart = datetime(day.year, day.month, day.day)
+            offset = compute(dayStart)
+            if compute(dayStart + ONE_DAY) != offset:
+                offset = None
+            cache[day] = offset
+        if offset is not None:
+            return offset
+
+        quarter = value.replace(minute=value.minute - value.minute % 15, second=0, microsecond=0)
+        offset = cache.get(quarter)
+        if offset is None:
+            offset = cache[quarter] = compute(quarter)
+        return offset
+
+    def getSourceOffset(self, sourceValue: datetime) -> timedelta:
+        """
+        Computes the UTC offset of a naive source-local datetime with pytz.
+        """
+        return self.sourceZone.localize(sourceValue, is_dst=False).utcoffset()
+
+    def getTargetOffset(self, utcValue: datetime) -> tuple:
+        """
+        Computes the target offset and tzinfo of a naive UTC datetime with pytz.
+        """
+        targetValue = pytz.utc.localize(utcValue).astimezone(self.targetZone)
+        return targetValue.utcoffset(), targetValue.tzinfo
+
+    def convertMany(self, values) -> list:
+        """
+        Converts a batch of datetimes to the target timezone.
+
+        Args:
+            values (iterable): Naive datetimes in the source timezone (or aware datetimes).
+
+        Returns:
+            list[datetime]: The aware datetimes in the target timezone, in the same order.
+        """
+        convert = self.convert
+        return [convert(value) for value in values]
+
+    def convertSeries(self, values: pd.Series) -> pd.Series:
+        """
+        Converts a pandas Series of naive datetimes to the target timezone in a vectorized way.
+
+        Nonexistent local times are shifted forward one hour and ambiguous ones read as
+        standard time, which matches pytz's `is_dst=False` for one-hour DST changes.
+
+        Args:
+            values (pandas.Series): Naive datetimes (datetime64) in the source timezone.
+
+        Returns:
+            pandas.Series: The timezone-aware datetimes in the target timezone.
+        """
+        localized = values.dt.tz_localize(self.sourceZone.zone, ambiguous=False, nonexistent=timedelta(hours=1))
+        return localized.dt.tz_convert(self.targetZone.zone)
+
+    def formatDateHour(self, value: datetime) -> tuple:
+        """
+        Formats the date ('YYYY-MM-DD') and hour ('HH:MM') of a datetime.
+
+        Both strings come from caches, so every event of a date shares the same objects.
+
+        Args:
+            value (datetime): The datetime to format.
+
+        Returns:
+            tuple[str, str]: The date and the hour.
+        """
+        dateKey = (value.year, value.month, value.day)
+        dateStr = self.dates.get(dateKey)
+        if dateStr is None:
+            dateStr = self.dates[dateKey] = f"{value.year:04}-{value.month:02}-{value.day:02}"
+        return dateStr, self.HOURS[value.hour * 60 + value.minute]
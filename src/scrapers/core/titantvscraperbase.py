@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from src.scrapers.core.scraperbase import ScraperBase
+from src.scrapers.core.logger import Logger
+
+class TitanTvScraperBase(ScraperBase):
+    """
+    Base class for the channels whose guide comes from the TitanTV schedule API.
+
+    Each TitanTV response covers a window of several hours starting at the requested
+    hour. Instead of requesting the 24 hours of a day and removing the overlapping
+    results, the scraper reads the start time of the last show of each response and
+    requests the next hour that is not covered yet, so a day costs one request per
+    window actually needed.
+    """
+
+    HOURS_PER_DAY = 24
+
+    def scrapeProgramGuide(self, startDate: str, numberOfDays: int, charReplacements: dict):
+        """
+        Scrapes and processes the program guide over a specified date range.
+
+        The days are walked in rounds: each round requests, concurrently, the next
+        uncovered hour of every day that is not complete yet.
+
+        Args:
+            startDate (str): The starting date for scraping in 'YYYY-MM-DD' format.
+            numberOfDays (int): The number of days before and after the initial date.
+            charReplacements (dict): A dictionary of character replacements to apply when saving the data.
+
+        Returns:
+            None
+        """
+        defaultSynopsis = self.channelConfig['defaultDescription']
+        fileName = self.channelConfig['fileName']
+        filePath = self.channelConfig['outputPath']
+        data = {}
+
+        # Next hour to request for each pending date
+        nextHours = {dateKey: 0 for dateKey in self.getIncrementalDates(startDate, numberOfDays)}
+        requestCount = 0
+        incompleteDates = set()  # Dates with a window that could not be fetched
+
+        while nextHours:
+            urls = {
+                self.urlFormatter.formatHourUrl(datetime.strptime(dateKey, "%Y-%m-%d"), hour, self.channelConfig["url"]): dateKey
+                for dateKey, hour in nextHours.items()
+            }
+            requestCount += len(urls)
+
+            for url, dataFromUrl in self.fetchAll(list(urls)):
+                dateKey = urls[url]
+                nextHour = nextHours[dateKey] + 1
+
+                if dataFromUrl:
+                    programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                    self.recordDateEvents(dateKey, programs)
+                    data.setdefault(dateKey, []).extend(programs)
+                    nextHour = max(nextHour, self.getNextUncoveredHour(dataFromUrl, dateKey))
+                else:
+                    incompleteDates.add(dateKey)
+
+                if nextHour < self.HOURS_PER_DAY:
+                    nextHours[dateKey] = nextHour
+                else:
+                    del nextHours[dateKey]
+                    if dateKey not in incompleteDates:
+                        self.markDateComplete(dateKey)
+
+        hourlyRequests = self.HOURS_PER_DAY * len(self.urlGenerator.getDates(startDate, numberOfDays))
+        Logger().logInfo(
+            f"TitanTV guide for {fileName}: {requestCount} requests instead of {hourlyRequests} "
+            f"({hourlyRequests - requestCount} saved)"
+        )
+
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
+
+        data = self.removeDuplicates(data)
+
+        # Save the processed data
+        self.saveData(fileName, data, charReplacements, filePath)
+
+    @staticmethod
+    def getNextUncoveredHour(rawData, dateKey: str) -> int:
+        """
+        Computes the first hour of a date that a TitanTV response may not fully cover.
+
+        Shows starting after the last one returned are unknown, so the next window must
+        start at the hour of that last start time.
+
+        Args:
+            rawData (dict): The raw schedule data, with shows under 'Json' -> 'Channels' -> 'Days' -> 'Shows'.
+            dateKey (str): The requested date in 'YYYY-MM-DD' format.
+
+        Returns:
+            int: Hours since the start of the date (24 or more when the response reaches the next day),
+                 or 0 if the response has no shows.
+        """
+        try:
+            shows = rawData['Json']['Channels'][0]["Days"][0]["Shows"]
+        except (KeyError, IndexError, TypeError):
+            return 0
+
+        startTimes = [
+            datetime.fromisoformat(show["StartTime"]).replace(tzinfo=None)
+            for show in shows if show.get("StartTime")
+        ]
+        if not startTimes:
+            return 0
+
+        coveredUntil = max(startTimes) - datetime.strptime(dateKey, "%Y-%m-%d")
+        return int(coveredUntil // timedelta(hours=1))
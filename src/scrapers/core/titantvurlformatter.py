@@ -20,20 +20,27 @@ class TitanTvUrlFormatter(IUrlFormatter):
         Returns:
             list: A list of formatted URLs covering each hour of the target date.
         """
-        formattedUrls = []  # List to store generated URLs
+        # Generate a URL for each hour (00:00 to 23:00)
+        return [self.formatHourUrl(targetDate, hour, baseUrl) for hour in range(24)]
+
+    def formatHourUrl(self, targetDate: datetime, hour: int, baseUrl: str) -> str:
+        """
+        Generates the URL of the schedule window starting at a given hour of a date.
+
+        Args:
+            targetDate (datetime): The date for which the URL will be generated.
+            hour (int): The starting hour of the window, from 0 to 23.
+            baseUrl (str): The base URL, which will be modified with date and time parameters.
 
+        Returns:
+            str: The formatted URL for that date and hour.
+        """
         # Extract components of the base URL
         urlParts = baseUrl.split("/")
         baseUrlPrefix = "/".join(urlParts[:7]) + "/"  # Base URL section
         extraPath = "/" + "/".join(urlParts[8:])  # Remaining path after date/hour
 
-        # Format the target date as YYYYMMDD
+        # Format the target date as YYYYMMDD and the hour as HHMM
         formattedDate = targetDate.strftime('%Y%m%d')
-
-        # Generate a URL for each hour (00:00 to 23:00)
-        for hour in range(24):
-            formattedHour = f"{hour:02}00"  # Format hour as HHMM
-            formattedUrl = f"{baseUrlPrefix}{formattedDate}{formattedHour}{extraPath}"
-            formattedUrls.append(formattedUrl)
-
-        return formattedUrls
+        formattedHour = f"{hour:02}00"
+        return f"{baseUrlPrefix}{formattedDate}{formattedHour}{extraPath}"
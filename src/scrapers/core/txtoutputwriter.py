@@ -0,0 +1,64 @@
+from src.scrapers.core.interfaces.ioutputwriter import IOutputWriter
+from src.scrapers.core.programevent import ProgramEvent
+
+class TxtOutputWriter(IOutputWriter):
+    """
+    Writes guides in the SIBA text format: a line with each new date followed by one
+    line per program.
+    """
+
+    extension = "txt"
+    MAX_TITLE_LENGTH = 120
+
+    def writePrograms(self, file, channelName: str, programs, charReplacer):
+        """
+        Writes the programs of a channel in the SIBA text format.
+
+        Args:
+            file: The open binary file object where data will be written.
+            channelName (str): The name of the channel.
+            programs (iterable): The programs to write, in order.
+            charReplacer (CharReplacer): The character replacements of the run.
+
+        Returns:
+            None
+        """
+        currentDate = None
+        for program in programs:
+            file.write(self.formatProgram(program, currentDate, charReplacer).encode('utf-8'))
+            currentDate = program.get('date', '')
+
+    def formatProgram(self, program: dict, currentDate: str, charReplacer) -> str:
+        """
+        Formats the line of a program, preceded by its date when the date changes.
+
+        Args:
+            program (ProgramEvent or dict): The program data.
+            currentDate (str): The date of the previous program.
+            charReplacer (CharReplacer): The character replacements of the run.
+
+        Returns:
+            str: The text to write for the program.
+        """
+        if isinstance(program, ProgramEvent):
+            date, hour, title, content = program.date, program.hour, program.title, program.content
+        else:
+            date = program.get('date', '')
+            hour = program.get('hour', '')
+            title = program.get('title', '').strip()
+            content = program.get('content', '').strip()
+
+        # Apply character replacements and collapse runs of dashes
+        title = charReplacer.clean(title)
+        content = charReplacer.clean(content)
+
+        # Truncate title if it exceeds 120 characters
+        if len(title) > self.MAX_TITLE_LENGTH:
+            title = title[:self.MAX_TITLE_LENGTH]
+
+        programLine = f"{hour}---{title}---{content}---USA|TV-PG---SIBA_TIPO|UNICO--- --- --- --- --- ---SIN_CTI|{content}--- --- --- ---\n"
+
+        # Write the date only if it changes
+        if date != currentDate:
+            return f"{date}\n{programLine}"
+        return programLine
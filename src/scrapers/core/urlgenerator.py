@@ -20,28 +20,56 @@ class UrlGenerator:
         self.baseUrl = baseUrl
         self.formatter = formatter
 
-    def getDateUrls(self, initialDateStr: str, daysRange: int = 15) -> list[str]:
+    def getDates(self, initialDateStr: str, daysRange: int = 15) -> list[datetime]:
         """
-        Generates a list of URLs for a specified date range.
+        Generates the dates covered by a date range.
 
         Args:
             initialDateStr (str): The starting date as a string in 'YYYY-MM-DD' format.
-            daysRange (int, optional): The number of days before and after the initial date
-                                      to generate URLs for. Defaults to 15.
+            daysRange (int, optional): The number of days before and after the initial date.
+                                      Defaults to 15.
 
         Returns:
-            list[str]: A list of formatted URLs covering the specified date range.
+            list[datetime]: The dates from `initialDate - daysRange` to `initialDate + daysRange`.
         """
         initialDate = datetime.strptime(initialDateStr, "%Y-%m-%d")
-        dates = [
+        return [
             initialDate + timedelta(days=i)
             for i in range(-daysRange, daysRange + 1)
         ]
-        urls = []
-        for date in dates:
+
+    def getDatedUrls(self, initialDateStr: str, daysRange: int = 15) -> list[tuple[str, str]]:
+        """
+        Generates the URLs for a date range, each one paired with the date it was built for.
+
+        Args:
+            initialDateStr (str): The starting date as a string in 'YYYY-MM-DD' format.
+            daysRange (int, optional): The number of days before and after the initial date
+                                      to generate URLs for. Defaults to 15.
+
+        Returns:
+            list[tuple[str, str]]: A list of (date, url) pairs, where date is in 'YYYY-MM-DD' format.
+        """
+        datedUrls = []
+        for date in self.getDates(initialDateStr, daysRange):
+            dateStr = date.strftime("%Y-%m-%d")
             formattedUrl = self.formatter.formatUrl(date, self.baseUrl)
             if isinstance(formattedUrl, list):
-                urls.extend(formattedUrl)
+                datedUrls.extend((dateStr, url) for url in formattedUrl)
             else:
-                urls.append(formattedUrl)
-        return urls
+                datedUrls.append((dateStr, formattedUrl))
+        return datedUrls
+
+    def getDateUrls(self, initialDateStr: str, daysRange: int = 15) -> list[str]:
+        """
+        Generates a list of URLs for a specified date range.
+
+        Args:
+            initialDateStr (str): The starting date as a string in 'YYYY-MM-DD' format.
+            daysRange (int, optional): The number of days before and after the initial date
+                                      to generate URLs for. Defaults to 15.
+
+        Returns:
+            list[str]: A list of formatted URLs covering the specified date range.
+        """
+        return [url for _, url in self.getDatedUrls(initialDateStr, daysRange)]
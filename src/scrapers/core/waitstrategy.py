@@ -0,0 +1,151 @@
+import re
+import time
+from src.scrapers.core.backoff import Backoff
+
+class WaitStrategy:
+    """
+    Describes how a browser fetcher knows a page is ready, and how it retries when it is not.
+
+    A page is ready when its condition holds, taken in this order of precedence:
+        - responsePattern: a response whose URL matches the regular expression arrives.
+        - selector: an element matching the selector is attached to the DOM.
+        - loadState: the page reaches a Playwright load state ('load' by default, 'networkidle', ...).
+    Navigation itself only waits for the first bytes of the document, so no time is spent
+    on anything the condition does not need. Failed attempts are retried after an
+    exponential backoff with jitter.
+    """
+
+    DEFAULT_TIMEOUT = 30000  # Milliseconds allowed for navigation and for the wait
+    DEFAULT_MAX_ATTEMPTS = 1
+
+    def __init__(self, logger, selector: str = None, responsePattern: str = None, loadState: str = None,
+                 timeout: int = DEFAULT_TIMEOUT, maxAttempts: int = DEFAULT_MAX_ATTEMPTS, backoff: Backoff = None):
+        """
+        Initializes the strategy.
+
+        Args:
+            logger: Logger instance to log the wait timings.
+            selector (str, optional): Selector of the element that signals the page is ready.
+            responsePattern (str, optional): Regular expression of the URL of the response to wait for.
+            loadState (str, optional): Playwright load state to wait for when no other condition is set.
+            timeout (int, optional): Milliseconds allowed for navigation and for the wait.
+            maxAttempts (int, optional): Attempts per URL before giving up.
+            backoff (Backoff, optional): Delays between attempts.
+        """
+        self.logger = logger
+        self.selector = selector
+        self.responsePattern = re.compile(responsePattern) if responsePattern else None
+        self.loadState = loadState
+        self.timeout = timeout
+        self.maxAttempts = maxAttempts
+        self.backoff = backoff or Backoff()
+
+    @classmethod
+    def fromConfig(cls, logger, waitConfig: dict, **defaults):
+        """
+        Builds a strategy from the 'wait' section of a channel configuration.
+
+        Args:
+            logger: Logger instance to log the wait timings.
+            waitConfig (dict): Optional keys 'selector', 'responsePattern', 'loadState',
+                               'timeout', 'maxAttempts' and 'backoff' (see `Backoff.fromConfig`).
+            **defaults: Values used for the keys missing from `waitConfig`.
+
+        Returns:
+            WaitStrategy: The configured strategy.
+        """
+        settings = {**defaults, **waitConfig}
+        if isinstance(settings.get("backoff"), dict):
+            settings["backoff"] = Backoff.fromConfig(settings["backoff"])
+        return cls(logger, **settings)
+
+    def describe(self) -> str:
+        """
+        Returns a short description of the wait condition, for the logs.
+        """
+        if self.responsePattern:
+            return f"response matching '{self.responsePattern.pattern}'"
+        if self.selector:
+            return f"selector '{self.selector}'"
+        return f"load state '{self.loadState or 'load'}'"
+
+    def matchesResponse(self, response) -> bool:
+        """
+        Checks whether a response is the one the strategy waits for.
+        """
+        return self.responsePattern.search(response.url) is not None
+
+    def load(self, page, url: str):
+        """
+        Navigates a sync Playwright page to a URL and waits until it is ready.
+
+        Args:
+            page (playwright.sync_api.Page): The page to navigate.
+            url (str): The URL to load.
+
+        Returns:
+            playwright.sync_api.Response or None: The awaited response when waiting for one.
+        """
+        startTime = time.perf_counter()
+        response = None
+
+        if self.responsePattern:
+            with page.expect_response(self.matchesResponse, timeout=self.timeout) as responseInfo:
+                page.goto(url, wait_until="commit", timeout=self.timeout)
+                navigatedTime = time.perf_counter()
+            response = responseInfo.value
+        else:
+            page.goto(url, wait_until="commit", timeout=self.timeout)
+            navigatedTime = time.perf_counter()
+            if self.selector:
+                page.wait_for_selector(self.selector, state="attached", timeout=self.timeout)
+            else:
+                page.wait_for_load_state(self.loadState or "load", timeout=self.timeout)
+
+        self.logTimings(url, startTime, navigatedTime)
+        return response
+
+    async def loadAsync(self, page, url: str):
+        """
+        Navigates an async Playwright page to a URL and waits until it is ready.
+
+        Args:
+            page (playwright.async_api.Page): The page to navigate.
+            url (str): The URL to load.
+
+        Returns:
+            playwright.async_api.Response or None: The awaited response when waiting for one.
+        """
+        startTime = time.perf_counter()
+        response = None
+
+        if self.responsePattern:
+            async with page.expect_response(self.matchesResponse, timeout=self.timeout) as responseInfo:
+                await page.goto(url, wait_until="commit", timeout=self.timeout)
+                navigatedTime = time.perf_counter()
+            response = await responseInfo.value
+        else:
+            await page.goto(url, wait_until="commit", timeout=self.timeout)
+            navigatedTime = time.perf_counter()
+            if self.selector:
+                await page.wait_for_selector(self.selector, state="attached", timeout=self.timeout)
+            else:
+                await page.wait_for_load_state(self.loadState or "load", timeout=self.timeout)
+
+        self.logTimings(url, startTime, navigatedTime)
+        return response
+
+    def logTimings(self, url: str, startTime: float, navigatedTime: float):
+        """
+        Logs how long a page took to navigate and how long it then waited for its condition.
+
+        Args:
+            url (str): The loaded URL.
+            startTime (float): `time.perf_counter()` before navigating.
+            navigatedTime (float): `time.perf_counter()` once navigation committed.
+        """
+        waitedTime = time.perf_counter() - navigatedTime
+        self.logger.logInfo(
+            f"Loaded {url}: navigation {navigatedTime - startTime:.2f}s, "
+            f"waited {waitedTime:.2f}s for {self.describe()}"
+        )
@@ -1,8 +1,9 @@
-import re
-import pytz
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from datetime import datetime, timedelta
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class EwtnDataProcessor(IDataProcessor):
     """
@@ -12,15 +13,19 @@ class EwtnDataProcessor(IDataProcessor):
     adjusts time zones, and returns a list of structured event data for a specified date.
     """
 
-    def __init__(self, timezone: str):
+    SCHEDULE_STRAINER = SoupStrainer('div', class_='schedule__entry')  # The only part of the page that is read
+
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -33,12 +38,12 @@ class EwtnDataProcessor(IDataProcessor):
             targetDate (str): Target date to filter events (format: YYYY-MM-DD).
 
         Returns:
-            list[dict]: A list of processed event data, each containing the date, time, title, and content.
+            list[ProgramEvent]: A list of processed events, each containing the date, time, title, and content.
         """
         processedEvents = []
 
         # Parse HTML content
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
         entries = soup.find_all('div', class_='schedule__entry')
         if not entries:
             return processedEvents
@@ -50,13 +55,13 @@ class EwtnDataProcessor(IDataProcessor):
             titleContainer = event.find('div', class_='schedule__title')
             if not titleContainer:
                 continue
-            title = re.sub(r'\s+', ' ', titleContainer.text.strip().replace("\n", " "))
+            title = HtmlParser.collapseWhitespace(titleContainer.text)
 
             subtitleContainer = event.find('h3', class_='schedule__sub-title')
-            subtitle = re.sub(r'\s+', ' ', subtitleContainer.text.strip().replace("\n", " ")) if subtitleContainer else 'n/a'
+            subtitle = HtmlParser.collapseWhitespace(subtitleContainer.text) if subtitleContainer else 'n/a'
 
             descriptionContainer = event.find('p', class_='schedule__description')
-            description = re.sub(r'\s+', ' ', descriptionContainer.text.strip().replace("\n", " ")) if descriptionContainer else 'n/a'
+            description = HtmlParser.collapseWhitespace(descriptionContainer.text) if descriptionContainer else 'n/a'
 
             # Determine final event content
             if subtitle and description:
@@ -72,18 +77,11 @@ class EwtnDataProcessor(IDataProcessor):
             if not startTime:
                 continue
             startTimeObj = datetime.fromisoformat(startTime.replace("Z", "+00:00")).replace(tzinfo=None)
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
 
             # Format final date and time
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
-
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": eventContent,
-            })
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
+
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, eventContent))
 
         return processedEvents
\ No newline at end of file
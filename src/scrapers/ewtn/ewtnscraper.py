@@ -1,5 +1,4 @@
 from src.scrapers.core.scraperbase import ScraperBase
-from src.scrapers.core.duplicateremover import DuplicateRemover
 
 class EwtnScraper(ScraperBase):
     """
@@ -22,21 +21,25 @@ class EwtnScraper(ScraperBase):
             None
         """
         # Generate URLs for the specified date range
-        urls = self.urlGenerator.getDateUrls(startDate, numberOfDays)
+        urls = self.getIncrementalUrls(startDate, numberOfDays)
         defaultSynopsis = self.channelConfig['defaultDescription']
         fileName = self.channelConfig['fileName']
         filePath = self.channelConfig['outputPath']
         data = {}
 
         # Fetch and process data from each generated URL
-        for url in urls:
-            dataFromUrl = self.getDataFromUrl(url)
+        for url, dataFromUrl in self.fetchAll(urls):
             if dataFromUrl:
                 dateKey = url.split("/")[-2]  # Extract the date key from the URL
-                data[dateKey] = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                self.recordEvents(url, programs)
+                data[dateKey] = programs
+
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
 
         # Remove duplicate entries from the collected data
-        data = DuplicateRemover.removeDuplicates(data)
+        data = self.removeDuplicates(data)
 
         # Save the cleaned data to a file
         self.saveData(fileName, data, charReplacements, filePath)
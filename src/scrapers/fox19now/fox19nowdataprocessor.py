@@ -1,20 +1,23 @@
-import pytz
 import re
 from datetime import datetime, timedelta
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class Fox19NowDataProcessor(IDataProcessor):
 
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription: str, targetDate: str):
         """
@@ -26,7 +29,7 @@ class Fox19NowDataProcessor(IDataProcessor):
             targetDate (str): The date to filter events by, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list: A list of processed events occurring on the target date, each with:
+            list[ProgramEvent]: A list of processed events occurring on the target date, each with:
                 - 'date' (str): The event date ('YYYY-MM-DD').
                 - 'hour' (str): The event start time ('HH:MM').
                 - 'title' (str): The event title.
@@ -44,14 +47,10 @@ class Fox19NowDataProcessor(IDataProcessor):
             # Parse the event start time
             eventStartDatetime = datetime.fromisoformat(programStart).replace(tzinfo=None)
 
-            localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-
-            # Convert to the target timezone
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            targetEventDatetime = self.timezoneConverter.convert(eventStartDatetime)
 
             # Extract formatted date and time
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d")
-            eventTime = targetEventDatetime.strftime("%H:%M")
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Safely extract titles
             mainTitle = (
@@ -85,11 +84,6 @@ class Fox19NowDataProcessor(IDataProcessor):
             elif episodeTitle != "n/a":
                 eventContent = episodeTitle
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": mainTitle,
-                "content": eventContent,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, mainTitle, eventContent))
 
         return processedEvents
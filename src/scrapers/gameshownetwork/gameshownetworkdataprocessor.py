@@ -1,8 +1,9 @@
-import pytz
 import re
 import json
 from datetime import datetime, timezone
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class GameShowNetworkDataProcessor(IDataProcessor):
     """
@@ -13,15 +14,17 @@ class GameShowNetworkDataProcessor(IDataProcessor):
     processed events for a given date.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData: str, defaultDescription: str, targetDate: str) -> list:
         """
@@ -34,7 +37,7 @@ class GameShowNetworkDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events (format: 'YYYY-MM-DD').
 
         Returns:
-            list: A list of dictionaries, each representing a processed event with the following keys:
+            list[ProgramEvent]: A list of processed events, each with the following fields:
                 - 'date' (str): The event date in 'YYYY-MM-DD' format.
                 - 'hour' (str): The event start time in 'HH:MM' format.
                 - 'title' (str): The title of the event.
@@ -63,12 +66,10 @@ class GameShowNetworkDataProcessor(IDataProcessor):
 
                 # Parse and convert the event start time
                 eventStartDatetime = datetime.fromtimestamp(programStart, tz=timezone.utc).replace(tzinfo=None)
-                localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-                targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+                targetEventDatetime = self.timezoneConverter.convert(eventStartDatetime)
 
                 # Format the event date and time
-                eventDate = targetEventDatetime.strftime("%Y-%m-%d")
-                eventTime = targetEventDatetime.strftime("%H:%M")
+                eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
                 # Construct the event content based on available data
                 if description and host:
@@ -79,11 +80,6 @@ class GameShowNetworkDataProcessor(IDataProcessor):
                     eventContent = host
 
                 # Append the processed event to the list
-                processedEvents.append({
-                    "date": eventDate,
-                    "hour": eventTime,
-                    "title": title,
-                    "content": eventContent,
-                })
+                processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, eventContent))
 
         return processedEvents
\ No newline at end of file
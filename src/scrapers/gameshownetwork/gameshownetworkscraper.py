@@ -24,5 +24,8 @@ class GameShowNetworkScraper(ScraperBase):
         dataFromUrl = self.getDataFromUrl(url)
         data = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, None)
 
+        # Remove duplicate entries from the processed data
+        data = self.removeDuplicates(data)
+
         # Save the processed data
         self.saveData(fileName, data, charReplacements, filePath)
@@ -0,0 +1,33 @@
+from src.scrapers.core.asyncbrowserfetcher import AsyncBrowserFetcher
+from src.scrapers.hopetv.hopetvdatafetcher import HopeTvDataFetcher
+
+class HopeTvAsyncDataFetcher(AsyncBrowserFetcher):
+    """
+    Fetches schedule data from Hope TV loading several dates at once with async Playwright.
+    """
+
+    DEFAULT_WAIT = HopeTvDataFetcher.DEFAULT_WAIT
+    DEFAULT_REQUEST_POLICY = HopeTvDataFetcher.DEFAULT_REQUEST_POLICY
+
+    async def fetchPage(self, page, url: str) -> list:
+        """
+        Loads a Hope TV schedule page and returns the items of its 'schedule' JSON response
+        as soon as it arrives, without waiting for network idle.
+
+        Args:
+            page (playwright.async_api.Page): A new page in its own context.
+            url (str): The target URL to fetch schedule data from.
+
+        Returns:
+            list: The schedule items, or an empty list if none were received.
+        """
+        response = await self.waitStrategy.loadAsync(page, url)
+        if not response:
+            return []
+
+        try:
+            jsonData = await response.json()
+        except ValueError as error:
+            self.logger.logError(f"Error parsing JSON response: {error}")
+            return []
+        return jsonData.get("items", [])
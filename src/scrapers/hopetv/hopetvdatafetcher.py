@@ -1,13 +1,25 @@
 from time import sleep
-from playwright.sync_api import sync_playwright
+from src.scrapers.core.browserpool import BrowserPool
 from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
+from src.scrapers.core.ratelimiter import RateLimiter
+from src.scrapers.core.requestpolicy import RequestPolicy
+from src.scrapers.core.waitstrategy import WaitStrategy
 from src.scrapers.core.logger import Logger
 
 class HopeTvDataFetcher(IDataFetcher):
     """
     Fetches schedule data from Hope TV using Playwright with retry logic.
+
+    Pages come from the shared `BrowserPool`, so Chromium is launched once per run.
     """
 
+    requiresBrowser = True
+
+    # Wait for the 'schedule' JSON response; retry up to 3 times with a backoff starting at 2 seconds
+    DEFAULT_WAIT = {"responsePattern": "schedule", "maxAttempts": 3, "backoff": {"baseDelay": 2}}
+    # Scripts and API calls of any hopetv.org host are loaded, not only those of the page's own origin
+    DEFAULT_REQUEST_POLICY = {"allowedUrlPatterns": [r"^https://([\w-]+\.)*hopetv\.org/"]}
+
     def __init__(self, logger: Logger):
         """
         Initializes the data fetcher with a logger instance.
@@ -16,51 +28,59 @@ class HopeTvDataFetcher(IDataFetcher):
             logger (Logger): Logger instance for logging messages.
         """
         self.logger = logger
+        self.waitStrategy = WaitStrategy.fromConfig(logger, {}, **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig(self.DEFAULT_REQUEST_POLICY, self.waitStrategy.responsePattern)
+        self.rateLimit = None
+
+    def configure(self, channelConfig: dict):
+        """
+        Reads the request interception rules from the channel 'requestPolicy' section, the
+        wait strategy from its 'wait' section and the page load rate limit from its
+        'rateLimit' section. The response the wait strategy waits for is always allowed.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        self.waitStrategy = WaitStrategy.fromConfig(self.logger, channelConfig.get("wait", {}), **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig(
+            channelConfig.get("requestPolicy", self.DEFAULT_REQUEST_POLICY), self.waitStrategy.responsePattern
+        )
+        self.rateLimit = channelConfig.get("rateLimit")
 
     def fetchData(self, url):
         """
         Retrieves schedule data from the specified Hope TV URL with retry logic.
 
+        Assets blocked by the request policy are never loaded, and the page is left as
+        soon as the 'schedule' JSON response arrives instead of waiting for network idle.
+
         Args:
             url (str): The target URL to fetch schedule data from.
 
         Returns:
             list: A list of schedule items if successful, otherwise an empty list.
         """
-        scheduleResponses = []
-        retries = 3
-        wait_time = 2
+        retries = self.waitStrategy.maxAttempts
 
         for attempt in range(retries):
-            try:
-                with sync_playwright() as playwright:
-                    browser = playwright.chromium.launch(headless=True, slow_mo=500)
-                    page = browser.new_page()
-
-                    def handleResponse(response):
-                        if "schedule" in response.url:
-                            try:
-                                jsonData = response.json()
-                                if "items" in jsonData:
-                                    scheduleResponses.extend(jsonData["items"])
-                            except Exception as error:
-                                self.logger.logError(f"Error parsing JSON response: {error}")
-
-                    page.on("response", handleResponse)
+            rateLimiter = RateLimiter.forUrl(url, self.rateLimit)
+            if rateLimiter:
+                rateLimiter.acquire()
 
+            try:
+                with BrowserPool.get(self.logger).acquirePage(self.requestPolicy) as page:
                     self.logger.logInfo(f"Attempt {attempt + 1}/{retries}: Fetching {url}")
-                    page.goto(url, timeout=30000)  # Timeout set to 30 seconds
-                    page.wait_for_load_state("networkidle")
-
-                    browser.close()
+                    response = self.waitStrategy.load(page, url)
+                    jsonData = response.json() if response else {}
 
-                    if scheduleResponses:
-                        return scheduleResponses  # Return if data is obtained
+                    if jsonData.get("items"):
+                        return jsonData["items"]  # Return if data is obtained
             
             except Exception as e:
                 self.logger.logError(f"Error fetching data (Attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    sleep(wait_time)  # Wait before retrying
+
+            if attempt < retries - 1:
+                sleep(self.waitStrategy.backoff.getDelay(attempt))  # Wait before retrying
 
         self.logger.logError(f"Failed to fetch data after {retries} attempts.")
         return []  # Return an empty list if all attempts fail
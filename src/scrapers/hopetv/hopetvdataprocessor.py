@@ -1,6 +1,7 @@
-import pytz
 from datetime import datetime
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class HopeTvDataProcessor(IDataProcessor):
     """
@@ -8,15 +9,17 @@ class HopeTvDataProcessor(IDataProcessor):
     and returns a list of formatted events.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -28,7 +31,7 @@ class HopeTvDataProcessor(IDataProcessor):
             targetDate (str): Target date to filter events (format: YYYY-MM-DD).
 
         Returns:
-            list: A list of processed events, each containing date, time, title, and content.
+            list[ProgramEvent]: A list of processed events, each containing date, time, title, and content.
         """
         processedEvents = []
 
@@ -51,16 +54,9 @@ class HopeTvDataProcessor(IDataProcessor):
                 eventContent = eventDescription
 
             startTimeObj = datetime.fromisoformat(startTimeUtc.replace("Z", "+00:00")).replace(tzinfo=None)
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": showTitle,
-                "content": eventContent,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, showTitle, eventContent))
 
         return processedEvents
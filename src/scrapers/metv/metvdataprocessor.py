@@ -1,7 +1,10 @@
-import pytz
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from datetime import datetime
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class MeTvDataProcessor(IDataProcessor):
     """
@@ -11,15 +14,19 @@ class MeTvDataProcessor(IDataProcessor):
     converts timestamps between timezones, and filters events based on a specific target date.
     """
 
-    def __init__(self, timezone: str):
+    SCHEDULE_STRAINER = SoupStrainer('div', class_='schedule-item-wrap')  # The only part of the page that is read
+
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData: str, defaultDescription: str, targetDate: str) -> list:
         """
@@ -31,7 +38,7 @@ class MeTvDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events by, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list: A list of dictionaries, each representing a processed event with the following keys:
+            list[ProgramEvent]: A list of processed events, each with the following fields:
                 - 'date' (str): The event date in 'YYYY-MM-DD' format.
                 - 'hour' (str): The event start time in 'HH:MM' format.
                 - 'title' (str): The title of the event.
@@ -39,7 +46,7 @@ class MeTvDataProcessor(IDataProcessor):
                   description if available, or falling back to the default description.
         """
         processedEvents = []
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
         scheduleItems = soup.find_all('div', class_='schedule-item-wrap')
 
         # Iterate over each schedule item in the HTML
@@ -52,12 +59,10 @@ class MeTvDataProcessor(IDataProcessor):
 
             # Parse and convert the event time to the target timezone
             startTimeObj = datetime.strptime(f"{targetDate} {formattedTime}", "%Y-%m-%d %H:%M")
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
 
             # Format the event date and time
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Extract event details
             mainTitle = item.find('div', class_='content-now-title-schedule').get_text(strip=True)
@@ -76,12 +81,7 @@ class MeTvDataProcessor(IDataProcessor):
             )
 
             # Append the processed event to the list
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": mainTitle,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, mainTitle, content))
 
         # Sort the events by date and time
-        return sorted(processedEvents, key=lambda x: (x["date"], x["hour"]))
\ No newline at end of file
+        return EventSorter.sortEvents(processedEvents)
\ No newline at end of file
@@ -1,4 +1,3 @@
-from src.scrapers.core.duplicateremover import DuplicateRemover
 from src.scrapers.core.scraperbase import ScraperBase
 
 class MeTvScraper(ScraperBase):
@@ -24,21 +23,25 @@ class MeTvScraper(ScraperBase):
             None: The processed data is saved to a file instead of being returned.
         """
         # Generate URLs based on the provided date range
-        urls = self.urlGenerator.getDateUrls(startDate, numberOfDays)
+        urls = self.getIncrementalUrls(startDate, numberOfDays)
         defaultSynopsis = self.channelConfig['defaultDescription']
         fileName = self.channelConfig['fileName']
         filePath = self.channelConfig['outputPath']
         data = {}
 
         # Iterate over each URL and process the data
-        for url in urls:
-            dataFromUrl = self.getDataFromUrl(url)
+        for url, dataFromUrl in self.fetchAll(urls):
             if dataFromUrl:
                 dateKey = url.split("/")[-2]  # Extract the date key from the URL
-                data[dateKey] = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                self.recordEvents(url, programs)
+                data[dateKey] = programs
+
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
 
         # Remove duplicates from the processed data
-        data = DuplicateRemover.removeDuplicates(data)
+        data = self.removeDuplicates(data)
 
         # Save the processed data to a file
         self.saveData(fileName, data, charReplacements, filePath)
\ No newline at end of file
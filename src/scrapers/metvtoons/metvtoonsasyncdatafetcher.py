@@ -0,0 +1,39 @@
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.scrapers.core.asyncbrowserfetcher import AsyncBrowserFetcher
+from src.scrapers.metvtoons.metvtoonsdatafetcher import MeTvToonsDataFetcher
+
+class MeTvToonsAsyncDataFetcher(AsyncBrowserFetcher):
+    """
+    Scrapes MeTV Toons schedule pages loading several dates at once with async Playwright.
+
+    Produces the same tuples as `MeTvToonsDataFetcher`, so it works with the same processor.
+    """
+
+    DEFAULT_WAIT = MeTvToonsDataFetcher.DEFAULT_WAIT
+
+    formatTime = MeTvToonsDataFetcher.formatTime
+    parseScheduleHtml = MeTvToonsDataFetcher.parseScheduleHtml
+    getElementText = staticmethod(MeTvToonsDataFetcher.getElementText)
+
+    async def fetchPage(self, page, url: str) -> list:
+        """
+        Loads a schedule page and extracts the show details from a single read of its container.
+
+        Args:
+            page (playwright.async_api.Page): A new page in its own context.
+            url (str): The webpage URL containing the schedule data.
+
+        Returns:
+            list: A list of tuples containing extracted show data in the format:
+                  (date, show_time, show_title, episode_title, description)
+        """
+        date = url.split('/')[-2]
+
+        try:
+            await self.waitStrategy.loadAsync(page, url)
+        except PlaywrightTimeoutError:
+            self.logger.logError("Timeout occurred while fetching data from MeTvToons. The schedule page may be unresponsive or have changed structure.")
+            return []
+
+        containerHtml = await page.locator(MeTvToonsDataFetcher.SCHEDULE_CONTAINER).inner_html()
+        return self.parseScheduleHtml(containerHtml, date)
@@ -1,11 +1,20 @@
 import re
-from time import sleep
-from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from src.scrapers.core.browserpool import BrowserPool
 from src.scrapers.core.interfaces.idatafetcher import IDataFetcher
+from src.scrapers.core.ratelimiter import RateLimiter
+from src.scrapers.core.requestpolicy import RequestPolicy
+from src.scrapers.core.waitstrategy import WaitStrategy
 from src.scrapers.core.logger import Logger
 from datetime import datetime
 
 class MeTvToonsDataFetcher(IDataFetcher):
+    requiresBrowser = True
+
+    SCHEDULE_CONTAINER = 'xpath=//*[@id="schedule_container"]'
+    DEFAULT_WAIT = {"selector": SCHEDULE_CONTAINER, "timeout": 15000}
+
     def __init__(self, logger: Logger):
         """
         Initializes the data fetcher with a logger instance.
@@ -14,11 +23,30 @@ class MeTvToonsDataFetcher(IDataFetcher):
             logger (Logger): An instance of the Logger class for logging errors and messages.
         """
         self.logger = logger
+        self.waitStrategy = WaitStrategy.fromConfig(logger, {}, **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig({}, self.waitStrategy.responsePattern)
+        self.rateLimit = None
+
+    def configure(self, channelConfig: dict):
+        """
+        Reads the request interception rules from the channel 'requestPolicy' section, the
+        wait strategy from its 'wait' section and the page load rate limit from its
+        'rateLimit' section. The response the wait strategy waits for, if any, is always allowed.
+
+        Args:
+            channelConfig (dict): Configuration settings for the channel.
+        """
+        self.waitStrategy = WaitStrategy.fromConfig(self.logger, channelConfig.get("wait", {}), **self.DEFAULT_WAIT)
+        self.requestPolicy = RequestPolicy.fromConfig(channelConfig.get("requestPolicy", {}), self.waitStrategy.responsePattern)
+        self.rateLimit = channelConfig.get("rateLimit")
 
     def fetchData(self, url):
         """
         Scrapes schedule data from the specified URL and extracts show details.
 
+        The schedule container is read from the page in a single `inner_html` call and
+        parsed locally, instead of querying the browser once per field of every show.
+
         Args:
             url (str): The webpage URL containing the schedule data.
 
@@ -27,69 +55,71 @@ class MeTvToonsDataFetcher(IDataFetcher):
                   (date, show_time, show_title, episode_title, description)
         """
         eventDataList = []
-        
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=True, slow_mo=500)
-            page = browser.new_page()
-            page.goto(url)
+        rateLimiter = RateLimiter.forUrl(url, self.rateLimit)
+        if rateLimiter:
+            rateLimiter.acquire()
+
+        with BrowserPool.get(self.logger).acquirePage(self.requestPolicy) as page:
             date = url.split('/')[-2]
 
             try:
-                containerXPath = '//*[@id="schedule_container"]'
-                page.wait_for_selector(f'xpath={containerXPath}', timeout=5000)
-                container = page.locator(f'xpath={containerXPath}')
-
-                currentShowWrapper = container.locator('section.current-show-wrapper')
-                hasCurrentShow = currentShowWrapper.count() >= 1 
-
-                if hasCurrentShow:
-                    currentEvent = currentShowWrapper.first
-                    rawShowTime = self.getTextIfExists(currentEvent, '.sched-show-title')
-                    rawShowTime = rawShowTime[-10:].strip()
-                    showTime = self.formatTime(rawShowTime)
-                    showTitle = self.getTextIfExists(currentEvent, '.current-show-title')
-                    episodeTitle = self.getTextIfExists(currentEvent, '.current-episode-title')
-                    description = self.getTextIfExists(currentEvent, 'p')
-                    eventDataList.append((date, showTime, showTitle, episodeTitle, description))
-
-                scheduledEvents = container.locator('div.sched-item')
-                eventCount = scheduledEvents.count()
-
-                if eventCount >= 1:
-                    for i in range(eventCount):
-                        event = scheduledEvents.nth(i)
-                        rawShowTime = self.getTextIfExists(event, '.sched-show-time')
-                        showTime = self.formatTime(rawShowTime)
-                        showTitle = self.getTextIfExists(event, '.sched-show-name')
-                        episodeTitle = self.getTextIfExists(event, '.sched-episode-title')
-                        description = self.getTextIfExists(event, 'p')
-                        eventDataList.append((date, showTime, showTitle, episodeTitle, description))
+                self.waitStrategy.load(page, url)
+                containerHtml = page.locator(self.SCHEDULE_CONTAINER).inner_html()
+                eventDataList = self.parseScheduleHtml(containerHtml, date)
             
-            except TimeoutError:
+            except PlaywrightTimeoutError:
                 self.logger.logError("Timeout occurred while fetching data from MeTvToons. The schedule page may be unresponsive or have changed structure.")
-            
-            browser.close()
-            return eventDataList
 
-    def getTextIfExists(self, locator, selector, timeout=500) -> str:
+        return eventDataList
+
+    def parseScheduleHtml(self, containerHtml: str, date: str) -> list:
+        """
+        Extracts the show details from the HTML of the schedule container.
+
+        Args:
+            containerHtml (str): The inner HTML of '#schedule_container'.
+            date (str): The date of the schedule page.
+
+        Returns:
+            list: A list of tuples in the format (date, show_time, show_title, episode_title, description).
+        """
+        eventDataList = []
+        container = BeautifulSoup(containerHtml, 'html.parser')
+
+        currentEvent = container.select_one('section.current-show-wrapper')
+        if currentEvent:
+            rawShowTime = self.getElementText(currentEvent, '.sched-show-title')
+            rawShowTime = rawShowTime[-10:].strip()
+            showTime = self.formatTime(rawShowTime)
+            showTitle = self.getElementText(currentEvent, '.current-show-title')
+            episodeTitle = self.getElementText(currentEvent, '.current-episode-title')
+            description = self.getElementText(currentEvent, 'p')
+            eventDataList.append((date, showTime, showTitle, episodeTitle, description))
+
+        for event in container.select('div.sched-item'):
+            rawShowTime = self.getElementText(event, '.sched-show-time')
+            showTime = self.formatTime(rawShowTime)
+            showTitle = self.getElementText(event, '.sched-show-name')
+            episodeTitle = self.getElementText(event, '.sched-episode-title')
+            description = self.getElementText(event, 'p')
+            eventDataList.append((date, showTime, showTitle, episodeTitle, description))
+
+        return eventDataList
+
+    @staticmethod
+    def getElementText(element, selector) -> str:
         """
-        Extracts text from an element if it exists; otherwise, returns a default value.
+        Extracts the text of the first element matching a selector; otherwise, returns a default value.
 
         Args:
-            locator: The locator object used to find the element.
+            element (bs4.element.Tag): The element to search in.
             selector (str): The CSS selector for the element to be extracted.
-            timeout (int, optional): The maximum time to wait for the element, in milliseconds. Defaults to 500.
 
         Returns:
             str: The text content of the element, or 'n/a' if not found.
         """
-        try:
-            element = locator.locator(selector).first
-            if element.count() > 0:
-                return element.text_content(timeout=timeout).strip()
-            return "n/a"
-        except TimeoutError:
-            return "Not available"
+        match = element.select_one(selector)
+        return match.get_text().strip() if match else "n/a"
 
     def formatTime(self, timeText):
         """
@@ -1,8 +1,10 @@
-import pytz
 import re
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
+from src.scrapers.core.eventsorter import EventSorter
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class MeTvToonsDataProcessor(IDataProcessor):
     """
@@ -18,15 +20,17 @@ class MeTvToonsDataProcessor(IDataProcessor):
         targetTimezone (pytz.timezone): The target timezone for converting event times.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The timezone from which the raw schedule data originates.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -42,7 +46,7 @@ class MeTvToonsDataProcessor(IDataProcessor):
                 formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list of dict: A list of processed events, each represented as a dictionary with:
+            list[ProgramEvent]: A list of processed events, each with:
                 - "date" (str): The event date in 'YYYY-MM-DD' format.
                 - "hour" (str): The event time in 'HH:MM' format (24-hour).
                 - "title" (str): The show title.
@@ -52,10 +56,8 @@ class MeTvToonsDataProcessor(IDataProcessor):
         
         for date, showTime, showTitle, episodeTitle, description in rawData:
             startTimeObj = datetime.strptime(f"{date} {showTime}", "%Y-%m-%d %H:%M")
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             content = (
                 f"{episodeTitle} - {description}" if description != "n/a" and episodeTitle != "n/a"
@@ -64,16 +66,8 @@ class MeTvToonsDataProcessor(IDataProcessor):
                 else defaultDescription
             )
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": showTitle,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, showTitle, content))
 
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
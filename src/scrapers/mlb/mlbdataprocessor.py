@@ -1,9 +1,10 @@
-import pytz
 import re
 import json
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class MlbDataProcessor(IDataProcessor):
     """
@@ -19,15 +20,17 @@ class MlbDataProcessor(IDataProcessor):
         targetTimezone (pytz.timezone): The target timezone for converting event times.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The timezone in which the original event schedule is provided.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -43,7 +46,7 @@ class MlbDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list of dict: A list of processed events, where each event is represented as a dictionary with:
+            list[ProgramEvent]: A list of processed events, each with:
                 - "date" (str): The event date in 'YYYY-MM-DD' format.
                 - "hour" (str): The event time in 'HH:MM' format (24-hour).
                 - "title" (str): The main title of the event.
@@ -63,15 +66,11 @@ class MlbDataProcessor(IDataProcessor):
             # Combine date and time into a single datetime object
             startTimeObj = datetime.combine(dateObj, timeObj.time())
             
-            # Check if the datetime object is naive (doesn't have timezone info)
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            
-            # Convert the localized datetime to the target timezone
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            # Convert the event datetime from the source timezone to the target timezone
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
             
             # Get the event date and time in the desired format
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
             
             mainTitle = show.get("umbrellatitle") or show.get("seriestitle")
             
@@ -88,12 +87,7 @@ class MlbDataProcessor(IDataProcessor):
             elif synopsis:
                 content = synopsis
             
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": mainTitle,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, mainTitle, content))
 
 
         return processedEvents
@@ -31,5 +31,8 @@ class MlbScraper(ScraperBase):
         dataFromUrl = self.getDataFromUrl(url)
         data = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
 
+        # Remove duplicate entries from the processed data
+        data = self.removeDuplicates(data)
+
         # Save the processed data
         self.saveData(fileName, data, charReplacements, filePath)
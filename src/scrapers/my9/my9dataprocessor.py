@@ -1,7 +1,8 @@
-import pytz
 import re
 from datetime import datetime, timedelta
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class My9DataProcessor(IDataProcessor):
     """
@@ -11,15 +12,17 @@ class My9DataProcessor(IDataProcessor):
     converting timestamps between time zones, and filtering events by a specified date.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source and target time zones.
 
         Args:
             timezone (str): The source time zone of the event data.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription: str, targetDate: str):
         """
@@ -35,7 +38,7 @@ class My9DataProcessor(IDataProcessor):
             targetDate (str): The date to filter events by, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list[dict]: A list of processed events, each containing:
+            list[ProgramEvent]: A list of processed events, each containing:
                 - 'date' (str): The event date in 'YYYY-MM-DD' format.
                 - 'hour' (str): The event start time in 'HH:MM' format.
                 - 'title' (str): The main title of the event.
@@ -53,14 +56,10 @@ class My9DataProcessor(IDataProcessor):
             # Parse the event start time
             eventStartDatetime = datetime.fromisoformat(programStart).replace(tzinfo=None)
 
-            localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-
-            # Convert to the target timezone
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            targetEventDatetime = self.timezoneConverter.convert(eventStartDatetime)
             
             # Extract formatted date and time
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d")
-            eventTime = targetEventDatetime.strftime("%H:%M")
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Safely extract titles
             mainTitle = (
@@ -94,11 +93,6 @@ class My9DataProcessor(IDataProcessor):
             elif episodeTitle != "n/a":
                 eventContent = episodeTitle
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": mainTitle,
-                "content": eventContent,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, mainTitle, eventContent))
 
         return processedEvents
@@ -1,8 +1,10 @@
-import pytz
 import re
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
+from src.scrapers.core.eventsorter import EventSorter
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class NhlDataProcessor(IDataProcessor):
     """
@@ -13,15 +15,17 @@ class NhlDataProcessor(IDataProcessor):
     list of processed events.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source and target timezones.
 
         Args:
             timezone (str): The source timezone of the event data.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription: str, targetDate: str):
         """
@@ -34,7 +38,7 @@ class NhlDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events (format: 'YYYY-MM-DD').
 
         Returns:
-            list: A sorted list of processed events occurring on the target date, 
+            list[ProgramEvent]: A sorted list of processed events occurring on the target date, 
                   each containing:
                   - 'date' (str): The event date ('YYYY-MM-DD').
                   - 'hour' (str): The event start time ('HH:MM').
@@ -48,10 +52,8 @@ class NhlDataProcessor(IDataProcessor):
             rawStartTime = broadcast.get("startTime")
             
             startTimeObj = datetime.fromisoformat(rawStartTime)
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             title = broadcast.get("title") or title
             description = broadcast.get("description") or description
@@ -59,16 +61,8 @@ class NhlDataProcessor(IDataProcessor):
             if description:
                 content = description
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, content))
 
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
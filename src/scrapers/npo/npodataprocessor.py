@@ -1,8 +1,10 @@
-import pytz
 import re
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
+from src.scrapers.core.eventsorter import EventSorter
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class NpoDataProcessor(IDataProcessor):
     """
@@ -13,15 +15,17 @@ class NpoDataProcessor(IDataProcessor):
     timezone and returns a list of processed events sorted chronologically.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -34,7 +38,7 @@ class NpoDataProcessor(IDataProcessor):
             targetDate (str): The target date for filtering events, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list: A list of processed event data, each containing:
+            list[ProgramEvent]: A list of processed events, each containing:
                 - 'date' (str): Event date ('YYYY-MM-DD').
                 - 'hour' (str): Event start time ('HH:MM').
                 - 'title' (str): Program title.
@@ -53,20 +57,10 @@ class NpoDataProcessor(IDataProcessor):
             if programStartTimestamp:
                 programStartTimestamp = programStartTimestamp // 1000 if programStartTimestamp > 10**10 else programStartTimestamp
                 startTimeObj = datetime.fromtimestamp(programStartTimestamp, tz=timezone.utc).replace(tzinfo=None)
-                localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-                targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-                eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-                eventTime = targetEventDatetime.strftime("%H:%M").strip()
-                processedEvents.append({
-                    "date": eventDate,
-                    "hour": eventTime,
-                    "title": programTitle,
-                    "content": programSynopsis,
-                })
+                targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+                eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
+                processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, programTitle, programSynopsis))
 
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
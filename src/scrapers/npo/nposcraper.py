@@ -1,6 +1,6 @@
 import re
 from src.scrapers.core.scraperbase import ScraperBase
-from src.scrapers.core.duplicateremover import DuplicateRemover
+from src.scrapers.core.eventsorter import EventSorter
 from playwright.sync_api import sync_playwright
 from src.scrapers.core.logger import Logger
 from time import sleep
@@ -33,22 +33,26 @@ class NpoScraper(ScraperBase):
         data = {}
         dateKey = None
 
+        # Build one URL per date and sub-channel, keeping track of the sub-channel of each one
+        clientRequests = [
+            (channel, f"{url}{channel.get('id')}")
+            for url in urls
+            for channel in self.channelConfig['subChannels']
+        ]
+        clientData = self.fetchAll([clientUrl for _, clientUrl in clientRequests])
+
         # Iterate over each URL and process the data
-        for url in urls:
-            for channel in self.channelConfig['subChannels']:
-                channelName = channel.get("fileName")
-                clientId =  channel.get("id")
-                defaultSynopsis = channel.get('defaultDescription')
-                clientUrl = f"{url}{clientId}"
-                dataFromUrl = self.getDataFromUrl(clientUrl)
-                if dataFromUrl:
-                    programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
-                    if channelName in data:
-                        data[channelName].extend(programs)
-                    else:
-                        data[channelName] = programs
-
-        data = DuplicateRemover.removeDuplicates(data)
+        for (channel, _), (_, dataFromUrl) in zip(clientRequests, clientData):
+            channelName = channel.get("fileName")
+            defaultSynopsis = channel.get('defaultDescription')
+            if dataFromUrl:
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                data.setdefault(channelName, []).append(programs)
+
+        # Each date comes sorted by the processor: merge them per sub-channel
+        data = {channelName: EventSorter.mergeSorted(dateChunks) for channelName, dateChunks in data.items()}
+
+        data = self.removeDuplicates(data)
         # Save the processed data
         for channelName, programData in data.items():
             self.saveData(channelName, programData, charReplacements,filePath)
@@ -1,6 +1,8 @@
-import pytz
-from datetime import datetime
+import numpy as np
+import pandas as pd
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class RushPrimeDataProcessor(IDataProcessor):
     """
@@ -8,29 +10,33 @@ class RushPrimeDataProcessor(IDataProcessor):
 
     Esta clase toma datos crudos provenientes de un archivo (por ejemplo, un CSV),
     convierte las fechas y horas de los eventos desde una zona horaria fuente hacia la zona horaria
-    objetivo ("America/Bogota") y estructura los eventos para su posterior almacenamiento o uso.
+    objetivo ("America/Bogota" por defecto) y estructura los eventos para su posterior almacenamiento o uso.
 
     Atributos:
         sourceTimezone (pytz.timezone): Zona horaria original de los datos recibidos.
-        targetTimezone (pytz.timezone): Zona horaria destino para convertir las fechas (siempre 'America/Bogota').
+        targetTimezone (pytz.timezone): Zona horaria destino para convertir las fechas.
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Inicializa el procesador con la zona horaria fuente de los eventos.
 
         Args:
             timezone (str): Zona horaria fuente (ej. "UTC", "America/New_York", etc.).
+            targetTimezone (str, optional): Zona horaria destino (por defecto 'America/Bogota').
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription: str, targetDate: str) -> list:
         """
         Procesa una tabla de datos crudos y extrae la información relevante de los eventos.
 
         Convierte fechas y horas desde la zona horaria fuente a la zona horaria objetivo,
-        normaliza el contenido y estructura cada evento con formato uniforme.
+        normaliza el contenido y estructura cada evento con formato uniforme. Las columnas
+        se procesan completas con pandas (sin iterar filas); las filas sin fecha, hora o
+        título, o con fecha u hora inválida, se descartan.
 
         Args:
             rawData (pd.DataFrame): DataFrame con columnas esperadas: 
@@ -39,46 +45,80 @@ class RushPrimeDataProcessor(IDataProcessor):
             targetDate (str): (Actualmente ignorado) Fecha objetivo para filtrar eventos, formato 'YYYY-MM-DD'.
 
         Returns:
-            list: Lista de eventos procesados. Cada elemento es un diccionario con:
+            list[ProgramEvent]: Lista de eventos procesados. Cada elemento tiene:
                 - 'date': Fecha del evento (str, formato 'YYYY-MM-DD').
                 - 'hour': Hora de inicio del evento (str, formato 'HH:MM').
                 - 'title': Título del programa (str).
                 - 'content': Sinopsis del programa o descripción por defecto (str).
         """
-        processedEvents = []
-
-        for _, row in rawData.iterrows():
-            try:
-                rawDate = str(row.get("Program Start Date", "")).strip()
-                rawHour = str(row.get("Program Start Time", "")).strip()
-                eventTitle = str(row.get("Program Title", "")).strip()
-                eventContent = str(row.get("Program Description", "")).strip() or defaultDescription
-
-                if not rawDate or not rawHour or not eventTitle:
-                    continue
-
-                # Convertir a datetime (se espera formato mm/dd/yyyy HH:MM)
-                eventStartDatetime = datetime.strptime(f"{rawDate} {rawHour}", "%m/%d/%Y %H:%M")
-                
-                # Aplicar zona horaria fuente
-                localizedEventDatetime = self.sourceTimezone.localize(eventStartDatetime)
-                
-                # Convertir a zona horaria destino
-                targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-
-                # Formatear resultado
-                eventDate = targetEventDatetime.strftime("%Y-%m-%d")
-                eventTime = targetEventDatetime.strftime("%H:%M")
-
-                processedEvents.append({
-                    "date": eventDate,
-                    "hour": eventTime,
-                    "title": eventTitle,
-                    "content": eventContent,
-                })
-
-            except Exception as e:
-                print(f"[Error] Evento con error: {e}")
-                continue
-
-        return processedEvents
+        dates = self.getColumn(rawData, "Program Start Date")
+        hours = self.getColumn(rawData, "Program Start Time")
+        titles = self.getColumn(rawData, "Program Title")
+        contents = self.getColumn(rawData, "Program Description")
+
+        # Convertir a datetime (se espera formato mm/dd/yyyy HH:MM); las inválidas quedan NaT
+        startDatetimes = self.parseStartDatetimes(dates, hours)
+        complete = (dates != "") & (hours != "") & (titles != "")
+        invalid = complete & startDatetimes.isna()
+        if invalid.any():
+            print(f"[Error] {int(invalid.sum())} eventos con fecha u hora inválida")
+        valid = complete & startDatetimes.notna()
+        if not valid.any():
+            return []
+
+        # Convertir de la zona horaria fuente a la zona horaria destino, en bloque
+        targetDatetimes = self.timezoneConverter.convertSeries(startDatetimes[valid])
+
+        # Formatear: strftime solo una vez por día distinto y las horas desde la tabla 'HH:MM' por minuto
+        localDatetimes = targetDatetimes.dt.tz_localize(None)
+        dayCodes, uniqueDays = pd.factorize(localDatetimes.dt.normalize())
+        eventDates = np.asarray(uniqueDays.strftime("%Y-%m-%d"), dtype=object)[dayCodes]
+        minutesOfDay = (localDatetimes.dt.hour * 60 + localDatetimes.dt.minute).to_numpy()
+        eventTimes = np.asarray(TimezoneConverter.HOURS, dtype=object)[minutesOfDay]
+        eventContents = contents[valid].mask(contents[valid] == "", defaultDescription)
+
+        return [
+            ProgramEvent(targetEventDatetime, eventDate, eventTime, eventTitle, eventContent)
+            for targetEventDatetime, eventDate, eventTime, eventTitle, eventContent in zip(
+                pd.DatetimeIndex(targetDatetimes).to_pydatetime(), eventDates, eventTimes, titles[valid], eventContents
+            )
+        ]
+
+    @staticmethod
+    def parseStartDatetimes(dates: pd.Series, hours: pd.Series) -> pd.Series:
+        """
+        Convierte las columnas de fecha ('mm/dd/yyyy') y hora ('HH:MM') en datetimes.
+
+        Un CSV repite pocas fechas y horas distintas, así que se convierte cada valor
+        distinto una sola vez y el resultado se reparte a las filas con sus códigos.
+
+        Args:
+            dates (pd.Series): Fechas de inicio como texto.
+            hours (pd.Series): Horas de inicio como texto.
+
+        Returns:
+            pd.Series: Datetimes sin zona horaria, NaT donde la fecha o la hora no son válidas.
+        """
+        dateCodes, uniqueDates = pd.factorize(dates)
+        hourCodes, uniqueHours = pd.factorize(hours)
+        parsedDates = pd.to_datetime(uniqueDates, format="%m/%d/%Y", errors="coerce")
+        parsedHours = pd.to_datetime(uniqueHours, format="%H:%M", errors="coerce") - pd.Timestamp(1900, 1, 1)
+        return pd.Series(parsedDates[dateCodes] + parsedHours[hourCodes], index=dates.index)
+
+    @staticmethod
+    def getColumn(rawData: pd.DataFrame, columnName: str) -> pd.Series:
+        """
+        Obtiene una columna como texto sin espacios al inicio ni al final.
+
+        Las celdas vacías (NaN) y las columnas inexistentes se leen como cadenas vacías.
+
+        Args:
+            rawData (pd.DataFrame): Datos crudos del CSV.
+            columnName (str): Nombre de la columna.
+
+        Returns:
+            pd.Series: Los valores de la columna como str.
+        """
+        if columnName not in rawData:
+            return pd.Series("", index=rawData.index, dtype=object)
+        return rawData[columnName].fillna("").astype(str).str.strip()
@@ -36,6 +36,7 @@ class RushPrimeScraper(ScraperBase):
         if rawData is None or rawData.empty:
             return
 
-        # Procesar los datos y guardar el resultado
+        # Procesar los datos, eliminar duplicados y guardar el resultado
         data = self.dataProcessor.processData(rawData, defaultSynopsis, targetDate='')
+        data = self.removeDuplicates(data)
         self.saveData(fileName, data, charReplacements, filePath)
@@ -1,8 +1,11 @@
-import pytz
 import re
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class StartTvDataProcessor(IDataProcessor):
     """
@@ -13,15 +16,19 @@ class StartTvDataProcessor(IDataProcessor):
     target timezone and returns a list of formatted events.
     """
 
-    def __init__(self, timezone: str):
+    SCHEDULE_STRAINER = SoupStrainer('div', class_='sched-item clearfix')  # The only part of the page that is read
+
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The timezone of the original schedule data.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData: str, defaultDescription: str, targetDate: str) -> list:
         """
@@ -33,14 +40,14 @@ class StartTvDataProcessor(IDataProcessor):
             targetDate (str): The date for which the schedule is being processed, formatted as 'YYYY-MM-DD'.
 
         Returns:
-            list: A sorted list of processed events, where each event contains:
+            list[ProgramEvent]: A sorted list of processed events, where each event contains:
                 - 'date' (str): The event date ('YYYY-MM-DD').
                 - 'hour' (str): The event start time ('HH:MM').
                 - 'title' (str): The event title.
                 - 'content' (str): A formatted description of the event.
         """
         processedEvents = []
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
 
         # Find all schedule items on the page
         scheduleItems = soup.find_all('div', class_='sched-item clearfix')
@@ -50,11 +57,9 @@ class StartTvDataProcessor(IDataProcessor):
             showTime = datetime.strptime(timeString, "%I:%M%p").strftime("%H:%M")
             startTimeObj = datetime.strptime(f"{targetDate} {showTime}", "%Y-%m-%d %H:%M")
 
-            # Convert timezone
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            # Convert the event datetime from the source timezone to the target timezone
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             title = item.find('h1', class_='hp-section-header sched-inline').text.strip()
 
@@ -78,16 +83,8 @@ class StartTvDataProcessor(IDataProcessor):
             elif description:
                 content = description
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": content,
-            })
-
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, content))
+
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
@@ -1,6 +1,5 @@
 import re
 from src.scrapers.core.scraperbase import ScraperBase
-from src.scrapers.core.duplicateremover import DuplicateRemover
 from playwright.sync_api import sync_playwright
 from src.scrapers.core.logger import Logger
 from time import sleep
@@ -28,19 +27,23 @@ class StartTvScraper(ScraperBase):
             None
         """
         # Generate URLs based on the provided date range
-        urls = self.urlGenerator.getDateUrls(startDate, numberOfDays)
+        urls = self.getIncrementalUrls(startDate, numberOfDays)
         defaultSynopsis = self.channelConfig['defaultDescription']
         fileName = self.channelConfig['fileName']
         filePath = self.channelConfig['outputPath']
         data = {}
         # Iterate over each URL and process the data
-        for url in urls:
-            dataFromUrl = self.getDataFromUrl(url)
+        for url, dataFromUrl in self.fetchAll(urls):
             if dataFromUrl:
                 dateKey = url.split('/')[-2]
-                data[dateKey] = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                self.recordEvents(url, programs)
+                data[dateKey] = programs
 
-        data = DuplicateRemover.removeDuplicates(data)
+        # Add the final dates kept by previous runs
+        data = self.withStoredEvents(data)
+
+        data = self.removeDuplicates(data)
         
         # Save the processed data
         self.saveData(fileName, data, charReplacements, filePath)
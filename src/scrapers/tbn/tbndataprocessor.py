@@ -1,8 +1,10 @@
-import pytz
-import re
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class TbnDataProcessor(IDataProcessor):
     """
@@ -13,15 +15,19 @@ class TbnDataProcessor(IDataProcessor):
     a structured list of scheduled programs.
     """
 
-    def __init__(self, timezone: str):
+    SCHEDULE_STRAINER = SoupStrainer('tr', class_='episode-row')  # The only part of the page that is read
+
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The timezone of the source data.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -33,14 +39,14 @@ class TbnDataProcessor(IDataProcessor):
             targetDate (str): The target date for which events are being processed (format: 'YYYY-MM-DD').
 
         Returns:
-            list[dict]: A sorted list of processed TV schedule events, each containing:
+            list[ProgramEvent]: A sorted list of processed TV schedule events, each containing:
                 - "date" (str): The broadcast date in 'YYYY-MM-DD' format.
                 - "hour" (str): The broadcast time in 'HH:MM' format.
                 - "title" (str): The program title.
                 - "content" (str): The program description.
         """
         processedEvents = []
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
 
         # Find all schedule items on the page
         episodeRows = soup.find_all('tr', class_='episode-row')
@@ -51,11 +57,9 @@ class TbnDataProcessor(IDataProcessor):
             dateStr = row.get('data-timestamp')
             startTimeObj = datetime.fromisoformat(str(dateStr))
             
-            # Convert timezone
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            # Convert the event datetime from the source timezone to the target timezone
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
             
 
             # Program title
@@ -68,24 +72,12 @@ class TbnDataProcessor(IDataProcessor):
                 descriptionElement = descriptionElement.strip()
 
                 if descriptionElement.startswith('<') and '>' in descriptionElement:
-                    soup = BeautifulSoup(descriptionElement, 'html.parser')
-                    content = soup.get_text(strip=True)
+                    content = HtmlParser.htmlToText(descriptionElement)
                 else:
-                    content = descriptionElement 
-
-              
-                content = re.sub(r'\s+', ' ', content).strip()
-
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": content,
-            })
-
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+                    content = HtmlParser.collapseWhitespace(descriptionElement)
+
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, content))
+
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
@@ -1,9 +1,12 @@
-import pytz
 import re
 import json
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class UlfnDataProcessor(IDataProcessor):
     """
@@ -14,18 +17,22 @@ class UlfnDataProcessor(IDataProcessor):
     and structures the data into a list of scheduled events.
     """
 
+    SCHEDULE_STRAINER = SoupStrainer('div', class_='wp-block-column')  # The only part of the page that is read
+
     initialDate = None  # Start date for processing the schedule
     daysRange = None  # Number of days to consider in the schedule
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source timezone.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def convertTo24Hour(self, timeStr: str) -> str:
         """
@@ -66,7 +73,7 @@ class UlfnDataProcessor(IDataProcessor):
             targetDate (str): The target date for processing events (YYYY-MM-DD).
 
         Returns:
-            list: A sorted list of processed event dictionaries, each containing:
+            list[ProgramEvent]: A sorted list of processed events, each containing:
                 - "date" (str): Event date in "YYYY-MM-DD" format.
                 - "hour" (str): Event start time in "HH:MM" 24-hour format.
                 - "title" (str): Event title.
@@ -77,9 +84,8 @@ class UlfnDataProcessor(IDataProcessor):
             'Saturday (Eastern Time)': [],
             'Sunday (Eastern Time)': []
         }
-        processedData = []
 
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
         scheduleSections = soup.find_all('div', class_='wp-block-column')
 
         # Generate date range for processing
@@ -102,7 +108,8 @@ class UlfnDataProcessor(IDataProcessor):
                         'content': defaultDescription
                     })
 
-        # Assign events to correct dates
+        # Assign events to correct dates, building one sorted chunk per date
+        dateChunks = []
         for date in dateRange:
             if date.weekday() < 5:
                 dayType = 'Weekdays(Eastern Time)Updates'
@@ -111,24 +118,16 @@ class UlfnDataProcessor(IDataProcessor):
             elif date.weekday() == 6:
                 dayType = 'Sunday (Eastern Time)'
 
+            dateEvents = []
             for item in scheduleByDayType[dayType]:
                 startTimeObj = datetime.strptime(f"{date.strftime('%Y-%m-%d')} {item['hour']}", "%Y-%m-%d %H:%M")
-                localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-                targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-                eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-                eventTime = targetEventDatetime.strftime("%H:%M").strip()
-
-                processedData.append({
-                    'date': eventDate,
-                    'hour': eventTime,
-                    'title': item['title'],
-                    'content': item['content'],
-                })
-
-        # Sort events by date and time
-        sortedEvents = sorted(
-            processedData,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+                targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+                eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
+
+                dateEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, item['title'], item['content']))
+            dateChunks.append(EventSorter.sortEvents(dateEvents))
+
+        # Merge the dates into one list sorted by date and time
+        sortedEvents = EventSorter.mergeSorted(dateChunks)
 
         return sortedEvents
@@ -40,5 +40,8 @@ class UlfnScraper(ScraperBase):
         # Process the retrieved data
         data = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, None)
 
+        # Remove duplicate entries from the processed data
+        data = self.removeDuplicates(data)
+
         # Save the processed data
         self.saveData(fileName, data, charReplacements, filePath)
@@ -1,9 +1,12 @@
-import pytz
 import re
 import json
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.htmlparser import HtmlParser
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class VeneVisionDataProcessor(IDataProcessor):
     """
@@ -14,15 +17,19 @@ class VeneVisionDataProcessor(IDataProcessor):
     processed events for a given date.
     """
 
-    def __init__(self, timezone: str):
+    SCHEDULE_STRAINER = SoupStrainer('div', class_='item')  # The only part of the page that is read
+
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with the source and target timezones.
 
         Args:
             timezone (str): The source timezone of the events.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData: str, defaultDescription: str, targetDate: str):
         """
@@ -35,14 +42,14 @@ class VeneVisionDataProcessor(IDataProcessor):
             targetDate (str): The target date to filter events (format: YYYY-MM-DD).
 
         Returns:
-            list: A list of processed event data for the target date. Each dictionary contains:
+            list[ProgramEvent]: A list of processed events for the target date. Each event contains:
                 - "date" (str): The formatted event date (YYYY-MM-DD).
                 - "hour" (str): The event time in 24-hour format (HH:MM).
                 - "title" (str): The event title.
                 - "content" (str): The event description or default description.
         """
         processedEvents = []
-        soup = BeautifulSoup(rawData, 'html.parser')
+        soup = HtmlParser.makeSoup(rawData, self.SCHEDULE_STRAINER)
 
         # Extract the necessary data
         scheduleItems = soup.find_all('div', class_='item')
@@ -69,26 +76,16 @@ class VeneVisionDataProcessor(IDataProcessor):
 
             # Convert timezones
             startTimeObj = datetime.strptime(f"{formattedDate} {formattedTime}", "%Y-%m-%d %H:%M")
-            localizedEventDatetime = self.sourceTimezone.localize(startTimeObj)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            targetEventDatetime = self.timezoneConverter.convert(startTimeObj)
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Extract event description
             nextParagraph = subtitleTag.find_next('p')
             content = nextParagraph.text.strip() if nextParagraph else defaultDescription
 
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, content))
 
         # Sort events chronologically by date and time
-        sortedEvents = sorted(
-            processedEvents,
-            key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
-        )
+        sortedEvents = EventSorter.sortEvents(processedEvents)
 
         return sortedEvents
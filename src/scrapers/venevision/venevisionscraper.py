@@ -32,6 +32,9 @@ class VeneVisionScraper(ScraperBase):
         # Process the extracted data
         data = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, targetDate=None)
 
+        # Remove duplicate entries from the processed data
+        data = self.removeDuplicates(data)
+
         # Save the processed data to a file
         self.saveData(fileName, data, charReplacements, filePath)
 
@@ -1,7 +1,8 @@
-import pytz
 import defusedxml.ElementTree as ET
 from datetime import datetime
 from src.scrapers.core.interfaces.idataprocessor import IDataProcessor
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.timezoneconverter import TimezoneConverter
 
 class WarnerDataProcessor(IDataProcessor):
     """
@@ -10,18 +11,20 @@ class WarnerDataProcessor(IDataProcessor):
 
     Attributes:
         sourceTimezone (pytz.timezone): Timezone of the source data.
-        targetTimezone (pytz.timezone): Target timezone for the processed events, set to 'America/Bogota'.
+        targetTimezone (pytz.timezone): Target timezone for the processed events ('America/Bogota' by default).
     """
 
-    def __init__(self, timezone: str):
+    def __init__(self, timezone: str, targetTimezone: str = TimezoneConverter.DEFAULT_TARGET_TIMEZONE):
         """
         Initializes the data processor with source and target timezones.
 
         Args:
             timezone (str): Timezone string representing the source data timezone.
+            targetTimezone (str, optional): The timezone of the guide. Defaults to 'America/Bogota'.
         """
-        self.sourceTimezone = pytz.timezone(timezone)
-        self.targetTimezone = pytz.timezone("America/Bogota")
+        self.timezoneConverter = TimezoneConverter.forZones(timezone, targetTimezone)
+        self.sourceTimezone = self.timezoneConverter.sourceZone
+        self.targetTimezone = self.timezoneConverter.targetZone
 
     def processData(self, rawData, defaultDescription, targetDate):
         """
@@ -34,7 +37,7 @@ class WarnerDataProcessor(IDataProcessor):
             targetDate (str): Target date (unused in current implementation, but part of interface).
 
         Returns:
-            list[dict]: A list of processed events, where each event contains:
+            list[ProgramEvent]: A list of processed events, where each event contains:
                 - date (str): Event date in 'YYYY-MM-DD' format.
                 - hour (str): Event time in 'HH:MM' format.
                 - title (str): Combined program and episode title.
@@ -52,11 +55,9 @@ class WarnerDataProcessor(IDataProcessor):
             # Parse and convert event datetime
             gmt = event.find('gmt').text
             parseDate = datetime.strptime(gmt, "%a %b %d %H:%M:%S GMT %Y")
-            localizedEventDatetime = self.sourceTimezone.localize(parseDate)
-            targetEventDatetime = localizedEventDatetime.astimezone(self.targetTimezone)
+            targetEventDatetime = self.timezoneConverter.convert(parseDate)
 
-            eventDate = targetEventDatetime.strftime("%Y-%m-%d").strip()
-            eventTime = targetEventDatetime.strftime("%H:%M").strip()
+            eventDate, eventTime = self.timezoneConverter.formatDateHour(targetEventDatetime)
 
             # Extract show and episode details
             show = event.find('show')
@@ -76,11 +77,6 @@ class WarnerDataProcessor(IDataProcessor):
                 content = description
 
             # Add processed event to list
-            processedEvents.append({
-                "date": eventDate,
-                "hour": eventTime,
-                "title": title,
-                "content": content,
-            })
+            processedEvents.append(ProgramEvent(targetEventDatetime, eventDate, eventTime, title, content))
 
         return processedEvents
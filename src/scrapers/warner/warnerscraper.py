@@ -1,6 +1,5 @@
 import re
 from src.scrapers.core.scraperbase import ScraperBase
-from src.scrapers.core.duplicateremover import DuplicateRemover
 from playwright.sync_api import sync_playwright
 from src.scrapers.core.logger import Logger
 from time import sleep
@@ -38,21 +37,20 @@ class WarnerScraper(ScraperBase):
         data = {}
         dateKey = None
 
-        # Loop through each configured sub-channel to fetch and process data
-        for channel in self.channelConfig['subChannels']:
+        # Build channel-specific URLs and fetch them all at once
+        subChannels = self.channelConfig['subChannels']
+        clientUrls = [baseUrl.replace("HLN", channel.get("id")) for channel in subChannels]
+        clientData = self.fetchAll(clientUrls)
+
+        # Loop through each configured sub-channel to process its data
+        for channel, (_, dataFromUrl) in zip(subChannels, clientData):
             channelName = channel.get("fileName")
-            clientId = channel.get("id")
             defaultSynopsis = channel.get('defaultDescription')
 
-            # Build channel-specific URL
-            clientUrl = baseUrl.replace("HLN", clientId)
-
-            # Fetch data from URL
-            dataFromUrl = self.getDataFromUrl(clientUrl)
-
             # Process data if successfully retrieved
             if dataFromUrl:
                 programs = self.dataProcessor.processData(dataFromUrl, defaultSynopsis, dateKey)
+                programs = self.removeDuplicates(programs)  # Each sub-channel is deduplicated on its own
                 if programs:
                     data[channelName] = programs
 
@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.scrapers.core import asyncbrowserfetcher
+from src.scrapers.core.asyncbrowserfetcher import AsyncBrowserFetcher
+
+class EchoBrowserFetcher(AsyncBrowserFetcher):
+    """
+    Fetcher whose pages return the URL and record how many are open at the same time.
+    """
+
+    def __init__(self, logger, maxPages):
+        super().__init__(logger, maxPages)
+        self.openPages = 0
+        self.peakPages = 0
+
+    async def fetchPage(self, page, url):
+        self.openPages += 1
+        self.peakPages = max(self.peakPages, self.openPages)
+        await asyncio.sleep(0.01)
+        self.openPages -= 1
+        return [] if "empty" in url else [url]
+
+@pytest.fixture
+def fakeAsyncPlaywright(monkeypatch):
+    """
+    Replaces async Playwright with mocks whose browser opens mock contexts and pages.
+    """
+    browser = MagicMock()
+    browser.new_context = AsyncMock(side_effect=lambda: MagicMock(route=AsyncMock(), new_page=AsyncMock(), close=AsyncMock()))
+    browser.close = AsyncMock()
+
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=playwright)
+    manager.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(asyncbrowserfetcher, "async_playwright", lambda: manager)
+    return playwright
+
+def testFetchPagesIsKeyedByUrlAndBounded(fakeAsyncPlaywright):
+    """
+    Validates that results are keyed by URL and no more than 'maxPages' pages are open at once.
+    """
+    fetcher = EchoBrowserFetcher(MagicMock(), maxPages=2)
+    urls = [f"https://example.com/{day}/" for day in range(6)]
+
+    results = fetcher.fetchPages(urls)
+
+    assert results == {url: [url] for url in urls}
+    assert fetcher.peakPages == 2
+    assert fakeAsyncPlaywright.chromium.launch.await_count == 1
+
+def testFetchManyKeepsOrderAndReportsEmptyPages(fakeAsyncPlaywright):
+    """
+    Validates that fetchMany keeps the input order and returns an empty list for failed pages.
+    """
+    fetcher = EchoBrowserFetcher(MagicMock(), maxPages=4)
+    urls = ["https://example.com/b/", "https://example.com/empty/", "https://example.com/a/"]
+
+    assert fetcher.fetchMany(urls) == [["https://example.com/b/"], [], ["https://example.com/a/"]]
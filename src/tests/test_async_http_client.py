@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import MagicMock
+from src.scrapers.core.asynchttpclient import AsyncHttpClient
+
+class ScheduleHandler(BaseHTTPRequestHandler):
+    """
+    Serves '/json/<n>' as JSON and '/text/<n>' as plain text, answering lower numbers last.
+    Any other path returns 404.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in ("json", "text"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        index = int(parts[1])
+        time.sleep(0.01 * (5 - index % 5))
+        if parts[0] == "json":
+            body, contentType = json.dumps({"index": index}).encode(), "application/json"
+        else:
+            body, contentType = f"text {index}".encode(), "text/plain"
+
+        self.send_response(200)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def serverUrl():
+    """
+    Starts a local HTTP server in a background thread and yields its base URL.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ScheduleHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def testFetchManyReturnsResultsInOrder(serverUrl):
+    """
+    Validates that results follow the order of the URLs even if responses arrive out of order.
+    """
+    client = AsyncHttpClient(MagicMock(), maxConcurrency=8, maxConcurrencyPerHost=4)
+    urls = [f"{serverUrl}/json/{index}" for index in range(10)]
+
+    results = client.fetchMany(urls)
+
+    assert results == [{"index": index} for index in range(10)]
+
+def testFetchManyHandlesTextAndErrors(serverUrl):
+    """
+    Validates that text responses are returned as strings and failed requests as None.
+    """
+    logger = MagicMock()
+    client = AsyncHttpClient(logger)
+    urls = [f"{serverUrl}/text/1", f"{serverUrl}/missing", f"{serverUrl}/json/2"]
+
+    results = client.fetchMany(urls)
+
+    assert results == ["text 1", None, {"index": 2}]
+    assert logger.logError.call_count == 1
+
+def testFetchDataFetchesASingleUrl(serverUrl):
+    """
+    Validates that fetchData behaves like the synchronous HttpClient for one URL.
+    """
+    logger = MagicMock()
+    client = AsyncHttpClient(logger)
+
+    assert client.fetchData(f"{serverUrl}/text/3") == "text 3"
+    logger.logInfo.assert_called_with(f"Successfully retrieved data from {serverUrl}/text/3")
+
+def testConfigureReadsChannelLimits():
+    """
+    Validates that the concurrency limits are read from the channel configuration.
+    """
+    client = AsyncHttpClient(MagicMock())
+    client.configure({"maxConcurrency": 32, "maxConcurrencyPerHost": 6})
+
+    assert client.maxConcurrency == 32
+    assert client.maxConcurrencyPerHost == 6
+
+def testBusyHostDoesNotHoldGlobalSlots(serverUrl):
+    """
+    Validates that requests waiting for a busy host leave the global slots to other hosts.
+    """
+    logger = MagicMock()
+    client = AsyncHttpClient(logger, maxConcurrency=2, maxConcurrencyPerHost=1)
+    otherHostUrl = serverUrl.replace("127.0.0.1", "localhost") + "/text/5"
+    urls = [f"{serverUrl}/text/{index}" for index in (0, 5, 10)] + [otherHostUrl]
+
+    client.fetchMany(urls)
+
+    retrievedUrls = [call.args[0].rsplit(" ", 1)[-1] for call in logger.logInfo.call_args_list]
+    assert otherHostUrl in retrievedUrls[:2]
@@ -0,0 +1,20 @@
+from src.scrapers.core.backoff import Backoff
+
+def testDelayGrowsExponentiallyUpToTheCap():
+    """
+    Validates that delays double on each attempt and never exceed 'maxDelay'.
+    """
+    backoff = Backoff(baseDelay=1, maxDelay=5, jitter=False)
+
+    assert [backoff.getDelay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+def testJitterKeepsDelayBetweenHalfAndFull():
+    """
+    Validates that jittered delays stay within half and all of the exponential delay.
+    """
+    backoff = Backoff.fromConfig({"baseDelay": 2})
+
+    delays = [backoff.getDelay(2) for _ in range(200)]
+
+    assert all(4 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
@@ -0,0 +1,91 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+from src.scrapers.core import browserpool
+from src.scrapers.core.browserpool import BrowserPool
+
+@pytest.fixture
+def fakePlaywright(monkeypatch):
+    """
+    Replaces Playwright with a mock whose browser creates a new mock context on each call.
+    """
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.new_context.side_effect = lambda: MagicMock()
+    starter = MagicMock()
+    starter.return_value.start.return_value = playwright
+    monkeypatch.setattr(browserpool, "sync_playwright", starter)
+    return playwright
+
+def testBrowserIsLaunchedOnceAndPagesAreRecycled(fakePlaywright):
+    """
+    Validates that Chromium starts once and a new context is opened every 'maxPageUses' URLs.
+    """
+    pool = BrowserPool(MagicMock(), maxPageUses=2)
+
+    pages = []
+    for _ in range(5):
+        with pool.acquirePage() as page:
+            pages.append(page)
+
+    browser = fakePlaywright.chromium.launch.return_value
+    assert fakePlaywright.chromium.launch.call_count == 1
+    assert browser.new_context.call_count == 3
+    assert pages[0] is pages[1] and pages[1] is not pages[2]
+
+def testFailedPageIsDiscarded(fakePlaywright):
+    """
+    Validates that an error while using a page closes its context so the next URL gets a new one.
+    """
+    pool = BrowserPool(MagicMock())
+
+    with pytest.raises(RuntimeError):
+        with pool.acquirePage():
+            raise RuntimeError("navigation failed")
+
+    with pool.acquirePage():
+        pass
+
+    assert fakePlaywright.chromium.launch.return_value.new_context.call_count == 2
+
+def testShutdownClosesBrowserAndPlaywright(fakePlaywright):
+    """
+    Validates that shutting down closes the browser and stops Playwright.
+    """
+    pool = BrowserPool(MagicMock())
+    with pool.acquirePage():
+        pass
+
+    pool.shutdown()
+
+    fakePlaywright.chromium.launch.return_value.close.assert_called_once()
+    fakePlaywright.stop.assert_called_once()
+
+def testRequestPolicyIsAppliedWhileThePageIsHeld(fakePlaywright):
+    """
+    Validates that the request policy is routed on the page and removed when it is returned.
+    """
+    pool = BrowserPool(MagicMock())
+    policy = MagicMock()
+
+    with pool.acquirePage(policy) as page:
+        page.route.assert_called_once_with("**/*", policy.handleRoute)
+
+    page.unroute.assert_called_once_with("**/*", policy.handleRoute)
+
+def testWorkerThreadPoolIsShutDownByItsThread(fakePlaywright):
+    """
+    Validates that a worker thread closes its own pool and the pool is no longer tracked for exit.
+    """
+    def work():
+        with BrowserPool.get(MagicMock()).acquirePage():
+            pass
+        BrowserPool.shutdownCurrent()
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+
+    fakePlaywright.chromium.launch.return_value.close.assert_called_once()
+    fakePlaywright.stop.assert_called_once()
+    assert not any(pool.ownerThread is worker for pool in BrowserPool._pools)
@@ -0,0 +1,109 @@
+import threading
+import pytest
+from unittest.mock import MagicMock
+from src.scrapers.core.browserpool import BrowserPool
+from src.scrapers.core.channelorchestrator import ChannelOrchestrator, runChannel
+
+def fakeRunner(channel, initialDate, daysRange, characterReplacements):
+    """
+    Runner used in the tests: fails for channels whose name starts with 'broken'.
+    """
+    if channel.startswith("broken"):
+        raise RuntimeError(f"{channel} exploded")
+
+def testRunChannelIsolatesFailures():
+    """
+    Validates that a failing runner is reported as 'failed' instead of raising.
+    """
+    result = runChannel(fakeRunner, "brokenscraper", "2025-02-28", 0, {})
+
+    assert result["channel"] == "brokenscraper"
+    assert result["status"] == "failed"
+    assert result["error"] == "RuntimeError: brokenscraper exploded"
+    assert result["elapsed"] >= 0
+
+def testRunKeepsChannelOrderAndOutcomes():
+    """
+    Validates that every channel is run, failures are isolated and results follow the input order.
+    """
+    logger = MagicMock()
+    orchestrator = ChannelOrchestrator(fakeRunner, workers=3, executor="thread", browserWorkers=1, logger=logger)
+    channels = ["betscraper", "brokenscraper", "hopetvscraper", "metvscraper"]
+
+    results = orchestrator.run(channels, {"hopetvscraper"}, "2025-02-28", 0, {})
+
+    assert [result["channel"] for result in results] == channels
+    assert [result["status"] for result in results] == ["ok", "failed", "ok", "ok"]
+    assert logger.logError.call_count == 1
+    assert logger.logInfo.call_count == 3
+
+def testBrowserChannelsRunOnTheirOwnPool():
+    """
+    Validates that browser channels never exceed the browser pool size.
+    """
+    lock = threading.Lock()
+    running = {"current": 0, "peak": 0}
+
+    def browserRunner(channel, *args):
+        with lock:
+            running["current"] += 1
+            running["peak"] = max(running["peak"], running["current"])
+        threading.Event().wait(0.05)
+        with lock:
+            running["current"] -= 1
+
+    channels = ["browser1", "browser2", "browser3"]
+    orchestrator = ChannelOrchestrator(browserRunner, workers=4, executor="thread", browserWorkers=1)
+    results = orchestrator.run(channels, set(channels))
+
+    assert all(result["status"] == "ok" for result in results)
+    assert running["peak"] == 1
+
+def testInvalidExecutorIsRejected():
+    """
+    Validates that an unknown executor type raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        ChannelOrchestrator(fakeRunner, executor="fiber")
+
+def testFormatSummary():
+    """
+    Validates the summary table lists each channel and the totals line.
+    """
+    results = [
+        {"channel": "betscraper", "status": "ok", "elapsed": 1.5, "error": ""},
+        {"channel": "brokenscraper", "status": "failed", "elapsed": 0.25, "error": "RuntimeError: boom"},
+    ]
+
+    summary = ChannelOrchestrator.formatSummary(results).splitlines()
+
+    assert summary[0].startswith("Channel")
+    assert summary[1].split() == ["betscraper", "ok", "1.50"]
+    assert summary[2].endswith("RuntimeError: boom")
+    assert summary[-1] == "2 channels, 1 ok, 1 failed"
+
+def testFormatSummaryCountsChangedOutputs():
+    """
+    Validates that the summary shows whether each channel rewrote its guide.
+    """
+    results = [
+        runChannel(lambda channel: "changed", "betscraper"),
+        runChannel(lambda channel: "unchanged", "metvscraper"),
+    ]
+
+    summary = ChannelOrchestrator.formatSummary(results).splitlines()
+
+    assert summary[1].split() == ["betscraper", "ok", f"{results[0]['elapsed']:.2f}", "changed"]
+    assert summary[2].split()[-1] == "unchanged"
+    assert summary[-1] == "2 channels, 2 ok, 0 failed, 1 changed, 1 unchanged"
+
+def testRunChannelShutsDownTheWorkerBrowserPool(monkeypatch):
+    """
+    Validates that the browser pool of the worker is closed when its channel finishes, even if it failed.
+    """
+    shutdownCurrent = MagicMock()
+    monkeypatch.setattr(BrowserPool, "shutdownCurrent", shutdownCurrent)
+
+    runChannel(fakeRunner, "brokenscraper", "2025-02-28", 0, {})
+
+    shutdownCurrent.assert_called_once_with()
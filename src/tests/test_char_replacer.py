@@ -0,0 +1,53 @@
+import pickle
+import re
+from src.scrapers.core.charreplacer import CharReplacer
+
+CHARACTER_REPLACEMENTS = {
+    '&': 'en',
+    "'": "’",
+    " \r\n": " ",
+    '\n': ' ',
+    '\x97': '-',
+    "|": "-",
+    "<": " ",
+}
+
+def cleanWithLoop(text: str) -> str:
+    """
+    Previous cleaning of FileWriter, replacing each dictionary entry in turn.
+    """
+    for oldChar, newChar in CHARACTER_REPLACEMENTS.items():
+        text = text.replace(oldChar, newChar)
+    return re.sub(r'-{2,}', '-', text).strip("-")
+
+def testCleanMatchesSequentialReplacements():
+    """
+    Validates that the compiled replacer produces the same text as the previous loop.
+    """
+    charReplacer = CharReplacer(CHARACTER_REPLACEMENTS)
+    texts = [
+        "Tom & Jerry's Show -- Special",
+        "Line one \r\nline two\nline three",
+        "-- Rated |\x97| <PG> --",
+        "Noticias de la mañana",
+        "",
+    ]
+
+    assert [charReplacer.clean(text) for text in texts] == [cleanWithLoop(text) for text in texts]
+
+def testFromReplacementsReusesCompiledReplacer():
+    """
+    Validates that a compiled replacer is passed through and that None replaces nothing.
+    """
+    charReplacer = CharReplacer(CHARACTER_REPLACEMENTS)
+
+    assert CharReplacer.fromReplacements(charReplacer) is charReplacer
+    assert CharReplacer.fromReplacements(None).clean("--A & B--") == "A & B"
+
+def testReplacerIsPicklable():
+    """
+    Validates that a replacer can be sent to worker processes.
+    """
+    charReplacer = pickle.loads(pickle.dumps(CharReplacer(CHARACTER_REPLACEMENTS)))
+
+    assert charReplacer.clean("A & B") == "A en B"
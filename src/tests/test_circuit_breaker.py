@@ -0,0 +1,42 @@
+from unittest.mock import patch
+from src.scrapers.core.circuitbreaker import CircuitBreaker
+
+def testCircuitOpensAfterThresholdAndRecovers():
+    """
+    Validates the closed -> open -> half-open -> closed cycle.
+    """
+    breaker = CircuitBreaker(failureThreshold=2, resetTimeout=30)
+
+    with patch("time.monotonic", return_value=100):
+        breaker.recordFailure()
+        assert breaker.allowRequest()
+        breaker.recordFailure()
+        assert not breaker.allowRequest()
+
+    with patch("time.monotonic", return_value=131):
+        assert breaker.allowRequest()  # Trial request
+        assert not breaker.allowRequest()  # Only one trial at a time
+        breaker.recordSuccess()
+        assert breaker.allowRequest()
+
+def testFailedTrialReopensTheCircuit():
+    """
+    Validates that a failing half-open trial opens the circuit again.
+    """
+    breaker = CircuitBreaker(failureThreshold=1, resetTimeout=10)
+
+    with patch("time.monotonic", return_value=0):
+        breaker.recordFailure()
+    with patch("time.monotonic", return_value=11):
+        assert breaker.allowRequest()
+        breaker.recordFailure()
+        assert not breaker.allowRequest()
+
+def testBreakersAreSharedPerHost():
+    """
+    Validates that the same host always gets the same breaker.
+    """
+    CircuitBreaker.resetAll()
+
+    assert CircuitBreaker.forHost("titantv.com") is CircuitBreaker.forHost("titantv.com")
+    assert CircuitBreaker.forHost("titantv.com") is not CircuitBreaker.forHost("npo.nl")
@@ -0,0 +1,60 @@
+from datetime import datetime
+import pytest
+from src.scrapers.core.duplicateremover import DuplicateRemover
+from src.scrapers.core.programevent import ProgramEvent
+
+DEFAULT_DESCRIPTION = "Programación habitual"
+
+def buildEvent(hour: int, minute: int, title: str, content: str) -> ProgramEvent:
+    return ProgramEvent.fromStart(datetime(2025, 2, 28, hour, minute), title, content)
+
+def testGroupKeyKeepsSubChannelsApart():
+    """
+    Validates that sub-channels airing at the same time keep their programs when 'group' is a key.
+    """
+    data = {
+        "channelA": [buildEvent(14, 0, "News", "")],
+        "channelB": [buildEvent(14, 0, "Cartoons", "")],
+    }
+
+    assert DuplicateRemover.removeDuplicates(data) == {"channelA": data["channelA"]}
+    assert DuplicateRemover(["date", "hour", "group"]).remove(data) == data
+
+def testRicherPolicyKeepsRealSynopsisInPlace():
+    """
+    Validates that a duplicate with a real synopsis replaces a default description at its position.
+    """
+    programs = iter([
+        buildEvent(14, 0, "Show", DEFAULT_DESCRIPTION),
+        buildEvent(15, 0, "Next", "Synopsis"),
+        {"date": "2025-02-28", "hour": " 14:00 ", "title": "Show", "content": "Episode synopsis"},
+        buildEvent(15, 0, "Next", DEFAULT_DESCRIPTION),
+    ])
+    remover = DuplicateRemover.fromConfig({"policy": "richer"}, [DEFAULT_DESCRIPTION, None])
+
+    uniquePrograms = remover.deduplicate(programs)
+
+    assert [program["content"] for program in uniquePrograms] == ["Episode synopsis", "Synopsis"]
+
+def testOverlappingProgramsAreResolved():
+    """
+    Validates that programs starting within the overlap window of the kept one collide with it.
+    """
+    programs = [
+        buildEvent(14, 0, "Show", DEFAULT_DESCRIPTION),
+        buildEvent(14, 2, "Show", "Episode synopsis"),
+        buildEvent(14, 30, "Next", ""),
+    ]
+    remover = DuplicateRemover(policy=DuplicateRemover.PREFER_RICHER, defaultDescriptions=[DEFAULT_DESCRIPTION], overlapMinutes=5)
+
+    assert remover.deduplicate(programs) == [programs[1], programs[2]]
+    assert DuplicateRemover(overlapMinutes=5).deduplicate(programs) == [programs[0], programs[2]]
+
+def testUnknownSettingsAreRejected():
+    """
+    Validates that a misspelled key or policy is reported instead of ignored.
+    """
+    with pytest.raises(ValueError):
+        DuplicateRemover(["date", "time"])
+    with pytest.raises(ValueError):
+        DuplicateRemover(policy="longest")
@@ -0,0 +1,46 @@
+import random
+from datetime import datetime, timedelta
+import pytz
+from src.scrapers.core.eventsorter import EventSorter
+from src.scrapers.core.programevent import ProgramEvent
+
+def buildEvents(numberOfEvents: int) -> list:
+    """
+    Builds events every 20 minutes from midnight, in Bogota time.
+    """
+    firstStart = pytz.timezone("America/Bogota").localize(datetime(2025, 2, 28))
+    return [ProgramEvent.fromStart(firstStart + timedelta(minutes=20 * index), f"Show {index}", "") for index in range(numberOfEvents)]
+
+def testSortEventsByStart():
+    """
+    Validates that shuffled events come back in chronological order, as with the previous strptime key.
+    """
+    events = buildEvents(200)
+    shuffled = random.sample(events, len(events))
+
+    assert EventSorter.sortEvents(shuffled) == events
+    assert EventSorter.sortEvents(shuffled) == sorted(
+        shuffled, key=lambda x: (datetime.strptime(x["date"], "%Y-%m-%d"), datetime.strptime(x["hour"], "%H:%M"))
+    )
+
+def testSortEventsFallsBackToDateAndHour():
+    """
+    Validates that dictionaries and events without start are sorted by their date and hour strings.
+    """
+    events = [
+        {"date": "2025-03-01", "hour": "00:10", "title": "C", "content": ""},
+        ProgramEvent(None, "2025-02-28", "23:50", "B", ""),
+        {"date": "2025-02-28", "hour": "09:00", "title": "A", "content": ""},
+    ]
+
+    assert [event["title"] for event in EventSorter.sortEvents(events)] == ["A", "B", "C"]
+
+def testMergeSortedChunks():
+    """
+    Validates that sorted chunks overlapping in time are merged in order.
+    """
+    events = buildEvents(150)
+    chunks = [events[0::3], events[1::3], events[2::3]]
+
+    assert EventSorter.mergeSorted(chunks) == events
+    assert EventSorter.mergeSorted([]) == []
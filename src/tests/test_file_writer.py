@@ -1,5 +1,8 @@
-import pytest
+import gzip
+import json
 import os
+import pandas as pd
+import pytest
 from unittest.mock import MagicMock
 from src.scrapers.core.filewriter import FileWriter
 
@@ -104,3 +107,89 @@ def testWriteProgramDataWritesNormalTitle(fileWriter, tmpPath):
     programLine = lines[1]
     parts = programLine.split("---")
     assert parts[1] == "Short Title"
+
+def testSaveDataToTxtAcceptsGenerators(fileWriter, tmp_path):
+    """
+    Validates that programs can be streamed from a generator and no temporary file is left behind.
+    """
+    programs = (
+        {"date": "2025-02-28", "hour": f"{hour:02}:00", "title": f"Show {hour}", "content": "Episode"}
+        for hour in range(3)
+    )
+
+    fileWriter.saveDataToTxt("channel", programs, None, str(tmp_path))
+
+    lines = (tmp_path / "channel.txt").read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "2025-02-28"
+    assert [line.split("---")[0] for line in lines[1:]] == ["00:00", "01:00", "02:00"]
+    assert os.listdir(tmp_path) == ["channel.txt"]
+
+def testSaveDataToTxtKeepsPreviousFileOnError(fileWriter, tmp_path):
+    """
+    Validates that a failure while writing leaves the previous guide intact.
+    """
+    guidePath = tmp_path / "channel.txt"
+    guidePath.write_text("previous guide\n", encoding="utf-8")
+
+    def brokenPrograms():
+        yield {"date": "2025-02-28", "hour": "00:00", "title": "Show", "content": "Episode"}
+        raise RuntimeError("scraper crashed")
+
+    fileWriter.saveDataToTxt("channel", brokenPrograms(), None, str(tmp_path))
+
+    assert guidePath.read_text(encoding="utf-8") == "previous guide\n"
+    assert os.listdir(tmp_path) == ["channel.txt"]
+    fileWriter.logger.logError.assert_called_once()
+
+def testSaveDataToTxtLeavesUnchangedFileUntouched(fileWriter, tmp_path):
+    """
+    Validates that saving the same guide again keeps the file and its mtime, and that new content replaces it.
+    """
+    programs = [{"date": "2025-02-28", "hour": "00:00", "title": "Show", "content": "Episode"}]
+    guidePath = tmp_path / "channel.txt"
+
+    assert fileWriter.saveDataToTxt("channel", programs, None, str(tmp_path)) == FileWriter.CHANGED
+    os.utime(guidePath, ns=(1_000_000_000, 1_000_000_000))
+
+    assert fileWriter.saveDataToTxt("channel", programs, None, str(tmp_path)) == FileWriter.UNCHANGED
+    assert guidePath.stat().st_mtime_ns == 1_000_000_000
+    assert os.listdir(tmp_path) == ["channel.txt"]
+
+    programs[0]["title"] = "Other show"
+    assert fileWriter.saveDataToTxt("channel", programs, None, str(tmp_path)) == FileWriter.CHANGED
+    assert "Other show" in guidePath.read_text(encoding="utf-8")
+
+def testSaveDataWritesEveryOutputFormat(fileWriter, tmp_path):
+    """
+    Validates that the same programs can be saved as TXT, JSON Lines, gzip JSON Lines and Parquet.
+    """
+    programs = (
+        {"date": "2025-02-28", "hour": f"{hour:02}:00", "title": f"Tom & Jerry {hour}", "content": "Episode"}
+        for hour in range(2)
+    )
+
+    statuses = fileWriter.saveData("channel", programs, {"&": "en"}, str(tmp_path), ["txt", "jsonl", "jsonl.gz", "parquet"])
+
+    assert statuses == {outputFormat: FileWriter.CHANGED for outputFormat in ["txt", "jsonl", "jsonl.gz", "parquet"]}
+    assert "Tom en Jerry 0" in (tmp_path / "channel.txt").read_text(encoding="utf-8")
+
+    records = [json.loads(line) for line in (tmp_path / "channel.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert records[1] == {"channel": "channel", "date": "2025-02-28", "hour": "01:00", "title": "Tom & Jerry 1", "content": "Episode"}
+
+    with gzip.open(tmp_path / "channel.jsonl.gz", "rt", encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == records
+
+    assert pd.read_parquet(tmp_path / "channel.parquet").to_dict("records") == records
+
+def testCompressedOutputIsDetectedAsUnchanged(fileWriter, tmp_path):
+    """
+    Validates that binary formats produce the same bytes for the same guide.
+    """
+    programs = [{"date": "2025-02-28", "hour": "00:00", "title": "Show", "content": "Episode"}]
+
+    fileWriter.saveData("channel", programs, None, str(tmp_path), ["jsonl.gz", "parquet"])
+
+    assert fileWriter.saveData("channel", programs, None, str(tmp_path), ["jsonl.gz", "parquet"]) == {
+        "jsonl.gz": FileWriter.UNCHANGED,
+        "parquet": FileWriter.UNCHANGED,
+    }
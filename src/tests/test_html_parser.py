@@ -0,0 +1,66 @@
+import re
+import pytest
+from bs4 import BeautifulSoup, SoupStrainer
+from src.scrapers.core.htmlparser import HtmlParser
+from src.scrapers.ewtn.ewtndataprocessor import EwtnDataProcessor
+
+PAGE = """
+<html><body>
+<nav><div class="schedule__title">Menu</div></nav>
+<div class="schedule__entry">
+    <div class="schedule__time" data-datetime="2025-03-01T15:00:00Z">15:00</div>
+    <div class="schedule__title">Holy Mass</div>
+    <h3 class="schedule__sub-title">Sunday</h3>
+    <p class="schedule__description">Live &amp; from the chapel</p>
+</div>
+</body></html>
+"""
+
+@pytest.fixture(autouse=True)
+def restoreBackend():
+    yield
+    HtmlParser.setBackend()
+
+def testStrainerKeepsOnlyScheduleContainers():
+    """
+    Validates that elements outside the strained containers are not built.
+    """
+    soup = HtmlParser.makeSoup(PAGE, SoupStrainer("div", class_="schedule__entry"))
+
+    assert [title.text for title in soup.find_all("div", class_="schedule__title")] == ["Holy Mass"]
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def testProcessorOutputDoesNotDependOnBackend(backend):
+    """
+    Validates that the processors read the same events with every installed backend.
+    """
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    HtmlParser.setBackend(backend)
+
+    events = EwtnDataProcessor("UTC").processData(PAGE, "Default", "2025-03-01")
+
+    assert [event.toDict() for event in events] == [{
+        "date": "2025-03-01", "hour": "10:00", "title": "Holy Mass", "content": "Sunday - Live & from the chapel",
+    }]
+
+def testUnknownBackendIsRejected():
+    """
+    Validates that forcing a backend that is not installed fails instead of falling back silently.
+    """
+    with pytest.raises(ValueError):
+        HtmlParser.setBackend("missing-parser")
+
+def testHtmlToTextMatchesSoupText():
+    """
+    Validates that synopses are cleaned like BeautifulSoup's stripped text with collapsed whitespace.
+    """
+    fragments = [
+        "<p>Praise &amp; worship</p>",
+        "<p>Line one<br/>line   two</p>\n<p> Third&nbsp;part </p>",
+        "<div><!-- note --><script>var a = '<b>';</script><em>Live</em> from <b>Nashville</b></div>",
+        "<p>5 &lt; 6 &#8211; caf&eacute;</p>",
+    ]
+    expected = [re.sub(r"\s+", " ", BeautifulSoup(fragment, "html.parser").get_text(strip=True)).strip() for fragment in fragments]
+
+    assert [HtmlParser.htmlToText(fragment) for fragment in fragments] == expected
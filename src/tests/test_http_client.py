@@ -1,6 +1,7 @@
 import pytest
 import requests
 from unittest.mock import MagicMock, patch
+from src.scrapers.core.circuitbreaker import CircuitBreaker
 from src.scrapers.core.httpclient import HttpClient
 
 @pytest.fixture
@@ -13,7 +14,28 @@ def mockLogger():
     logger.logError = MagicMock()
     return logger
 
-@patch("requests.get")
+@pytest.fixture(autouse=True)
+def resetCircuitBreakers():
+    """
+    Gives every test fresh per-host circuit breakers.
+    """
+    CircuitBreaker.resetAll()
+    yield
+    CircuitBreaker.resetAll()
+
+def buildResponse(statusCode, text="", headers=None):
+    """
+    Builds a mock response with the given status code, body and headers.
+    """
+    response = MagicMock()
+    response.status_code = statusCode
+    response.text = text
+    response.headers = headers or {"Content-Type": "text/plain"}
+    if statusCode >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{statusCode} Error")
+    return response
+
+@patch("requests.Session.get")
 def test_fetchData_json(mockGet, mockLogger):
     """
     Tests fetchData method when the response contains JSON data.
@@ -34,7 +56,7 @@ def test_fetchData_json(mockGet, mockLogger):
     assert result == expectedResponse
     mockLogger.logInfo.assert_called_with(f"Successfully retrieved data from {url}")
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetchData_text(mockGet, mockLogger):
     """
     Tests fetchData method when the response contains plain text data.
@@ -55,7 +77,7 @@ def test_fetchData_text(mockGet, mockLogger):
     assert result == expectedResponse
     mockLogger.logInfo.assert_called_with(f"Successfully retrieved data from {url}")
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetchData_requestError(mockGet, mockLogger):
     """
     Tests fetchData method when an HTTP request error occurs.
@@ -68,3 +90,111 @@ def test_fetchData_requestError(mockGet, mockLogger):
     
     assert result is None
     mockLogger.logError.assert_called_with(f"Error retrieving data from {url}: Request failed")
+
+def test_sessionIsSharedAcrossClients(mockLogger):
+    """
+    Tests that every HttpClient reuses the same pooled session.
+    """
+    firstClient = HttpClient(mockLogger)
+    secondClient = HttpClient(mockLogger)
+
+    assert firstClient.getSession() is secondClient.getSession()
+
+def test_configureSessionSetsPoolSize(mockLogger):
+    """
+    Tests that configureSession replaces the shared session with the requested pool size.
+    """
+    previousSession = HttpClient.getSession()
+    session = HttpClient.configureSession(poolConnections=4, poolMaxSize=32)
+
+    try:
+        assert HttpClient.getSession() is session
+        assert session is not previousSession
+        assert session.get_adapter("https://example.com")._pool_maxsize == 32
+        assert session.get_adapter("https://example.com")._pool_connections == 4
+    finally:
+        HttpClient.configureSession()
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_fetchData_retriesServerErrors(mockGet, mockSleep, mockLogger):
+    """
+    Tests that 5xx answers are retried and the 'Retry-After' delay is honoured.
+    """
+    mockGet.side_effect = [
+        buildResponse(503, headers={"Retry-After": "7"}),
+        buildResponse(502),
+        buildResponse(200, "guide"),
+    ]
+
+    result = HttpClient(mockLogger).fetchData("https://example.com/retry")
+
+    assert result == "guide"
+    assert mockGet.call_count == 3
+    assert mockSleep.call_args_list[0][0][0] == 7
+    assert mockGet.call_args.kwargs["timeout"] == (HttpClient.DEFAULT_CONNECT_TIMEOUT, HttpClient.DEFAULT_READ_TIMEOUT)
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_fetchData_givesUpAfterMaxRetries(mockGet, mockSleep, mockLogger):
+    """
+    Tests that connection errors are retried 'maxRetries' times before the usual error is logged.
+    """
+    url = "https://example.com/down"
+    mockGet.side_effect = requests.ConnectionError("Connection refused")
+    httpClient = HttpClient(mockLogger)
+    httpClient.configure({"http": {"maxRetries": 2}})
+
+    result = httpClient.fetchData(url)
+
+    assert result is None
+    assert mockGet.call_count == 3
+    mockLogger.logError.assert_called_with(f"Error retrieving data from {url}: Connection refused")
+
+@patch("time.sleep")
+@patch("requests.Session.get")
+def test_fetchData_failsFastWhenCircuitIsOpen(mockGet, mockSleep, mockLogger):
+    """
+    Tests that once a host keeps failing, later URLs of that host are skipped without a request.
+    """
+    mockGet.side_effect = requests.Timeout("Read timed out")
+    httpClient = HttpClient(mockLogger)
+    httpClient.configure({"http": {"maxRetries": 1, "failureThreshold": 2}})
+
+    httpClient.fetchData("https://dead.example.com/1")
+    httpClient.fetchData("https://dead.example.com/2")
+
+    assert mockGet.call_count == 2
+    assert "request skipped" in mockLogger.logError.call_args[0][0]
+
+@patch("requests.Session.get")
+def test_fetchData_unexpectedErrorDuringTrialReopensCircuit(mockGet, mockLogger):
+    """
+    Tests that a half-open trial failing with an unexpected error opens the circuit again
+    instead of leaving the host blocked for the rest of the process.
+    """
+    httpClient = HttpClient(mockLogger)
+    httpClient.configure({"http": {"maxRetries": 0, "failureThreshold": 1, "resetTimeout": 10}})
+    breaker = CircuitBreaker.forHost("flaky.example.com", 1, 10)
+
+    with patch("time.monotonic", return_value=0):
+        breaker.recordFailure()
+    with patch("time.monotonic", return_value=11):
+        mockGet.side_effect = requests.exceptions.ChunkedEncodingError("Connection broken")
+        assert httpClient.fetchData("https://flaky.example.com/1") is None
+    with patch("time.monotonic", return_value=22):
+        mockGet.side_effect = None
+        mockGet.return_value = buildResponse(200, "ok")
+        assert httpClient.fetchData("https://flaky.example.com/2") == "ok"
+
+@patch("requests.Session.get")
+def test_negativeMaxRetriesStillSendsOneRequest(mockGet, mockLogger):
+    """
+    Tests that a negative 'maxRetries' is clamped to a single attempt.
+    """
+    mockGet.return_value = buildResponse(200, "ok")
+    httpClient = HttpClient(mockLogger)
+    httpClient.configure({"http": {"maxRetries": -1}})
+
+    assert httpClient.fetchData("https://example.com/") == "ok"
+    assert mockGet.call_count == 1
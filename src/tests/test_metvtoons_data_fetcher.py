@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+from src.scrapers.metvtoons.metvtoonsdatafetcher import MeTvToonsDataFetcher
+
+SCHEDULE_HTML = """
+<section class="current-show-wrapper">
+    <h3 class="sched-show-title">On Now 6:00am ET</h3>
+    <div class="current-show-title">Tom and Jerry</div>
+    <div class="current-episode-title">Puss Gets the Boot</div>
+    <p>Jasper tries to catch Jinx.</p>
+</section>
+<div class="sched-item">
+    <span class="sched-show-time">6:30am ET</span>
+    <span class="sched-show-name">Popeye</span>
+    <p>Popeye meets Bluto.</p>
+</div>
+<div class="sched-item">
+    <span class="sched-show-time">1:00pm ET</span>
+    <span class="sched-show-name">Looney Tunes</span>
+    <span class="sched-episode-title">Rabbit Seasoning</span>
+</div>
+"""
+
+def testParseScheduleHtml():
+    """
+    Validates that the current show and every scheduled item are extracted from the container HTML.
+    """
+    fetcher = MeTvToonsDataFetcher(MagicMock())
+
+    events = fetcher.parseScheduleHtml(SCHEDULE_HTML, "2025-02-28")
+
+    assert events == [
+        ("2025-02-28", "06:00", "Tom and Jerry", "Puss Gets the Boot", "Jasper tries to catch Jinx."),
+        ("2025-02-28", "06:30", "Popeye", "n/a", "Popeye meets Bluto."),
+        ("2025-02-28", "13:00", "Looney Tunes", "Rabbit Seasoning", "n/a"),
+    ]
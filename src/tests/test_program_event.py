@@ -0,0 +1,42 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+from src.scrapers.core.duplicateremover import DuplicateRemover
+from src.scrapers.core.eventstore import EventStore
+from src.scrapers.core.programevent import ProgramEvent
+
+def testEventReadsLikeADictionary():
+    """
+    Validates that code written for event dictionaries keeps working with ProgramEvent.
+    """
+    event = ProgramEvent.fromStart(datetime(2025, 2, 28, 14, 5), " Show ", "Episode ")
+
+    assert event["date"] == "2025-02-28"
+    assert event.get("hour", "") == "14:05"
+    assert event.get("missing", "default") == "default"
+    assert "title" in event and "start" not in event
+    assert event == {"date": "2025-02-28", "hour": "14:05", "title": "Show", "content": "Episode"}
+
+def testDuplicateRemoverAcceptsEvents():
+    """
+    Validates that events sharing date and hour are removed, mixed with dictionaries.
+    """
+    start = datetime(2025, 2, 28, 14, 0)
+    data = {
+        "2025-02-28": [ProgramEvent.fromStart(start, "Show", ""), ProgramEvent.fromStart(start, "Repeat", "")],
+        "2025-03-01": [{"date": "2025-02-28", "hour": "14:00", "title": "Other", "content": ""}],
+    }
+
+    assert DuplicateRemover.removeDuplicates(data) == {"2025-02-28": [data["2025-02-28"][0]]}
+
+def testEventStoreRoundTrip(tmp_path):
+    """
+    Validates that stored events are read back as ProgramEvent with their start rebuilt.
+    """
+    eventStore = EventStore(str(tmp_path), "channel", MagicMock())
+    eventStore.save("2025-02-28", [ProgramEvent.fromStart(datetime(2025, 2, 28, 6, 30), "Show", "Episode")])
+
+    events = eventStore.load("2025-02-28")
+
+    assert isinstance(events[0], ProgramEvent)
+    assert events[0].start == datetime(2025, 2, 28, 6, 30)
+    assert events[0].toDict() == {"date": "2025-02-28", "hour": "06:30", "title": "Show", "content": "Episode"}
@@ -0,0 +1,37 @@
+from unittest.mock import patch
+from src.scrapers.core.ratelimiter import RateLimiter
+
+def testBurstThenSteadyRate():
+    """
+    Validates that 'burst' requests go immediately and the next ones are spaced at the configured rate.
+    """
+    with patch("time.monotonic", return_value=0):
+        limiter = RateLimiter(requestsPerSecond=2, burst=3)
+        delays = [limiter.reserve() for _ in range(5)]
+
+    assert delays == [0, 0, 0, 0.5, 1.0]
+
+def testTokensRefillOverTime():
+    """
+    Validates that an idle bucket refills up to its capacity and no further.
+    """
+    with patch("time.monotonic", return_value=0):
+        limiter = RateLimiter(requestsPerSecond=1, burst=2)
+        limiter.reserve()
+        limiter.reserve()
+
+    with patch("time.monotonic", return_value=60):
+        assert [limiter.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+def testLimiterIsSharedByEveryChannelOfAHost():
+    """
+    Validates that the first configured budget of a host is reused, even by channels without one.
+    """
+    RateLimiter.resetAll()
+
+    my9Limiter = RateLimiter.forUrl("https://titantv.com/api/schedule/a", {"requestsPerSecond": 5, "burst": 2})
+    fox19Limiter = RateLimiter.forUrl("https://titantv.com/api/schedule/b")
+
+    assert fox19Limiter is my9Limiter
+    assert RateLimiter.forUrl("https://other.example.com/") is None
+    RateLimiter.resetAll()
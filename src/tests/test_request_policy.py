@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+from src.scrapers.core.requestpolicy import RequestPolicy
+from src.scrapers.hopetv.hopetvasyncdatafetcher import HopeTvAsyncDataFetcher
+from src.scrapers.hopetv.hopetvdatafetcher import HopeTvDataFetcher
+
+PAGE_URL = "https://www.hopetv.org/schedule/"
+
+def buildRoute(resourceType, url, pageUrl=PAGE_URL):
+    route = MagicMock()
+    route.request.resource_type = resourceType
+    route.request.url = url
+    route.request.is_navigation_request.return_value = url == pageUrl
+    route.request.frame.parent_frame = None
+    route.request.frame.page.url = pageUrl
+    return route
+
+def testDefaultPolicyBlocksAssets():
+    """
+    Validates that the default policy keeps the page's documents and scripts but blocks images, fonts and styles.
+    """
+    policy = RequestPolicy()
+
+    assert policy.isAllowed("document", "https://example.com/", "https://example.com/")
+    assert policy.isAllowed("xhr", "https://example.com/api/schedule", "https://example.com/")
+    assert not policy.isAllowed("image", "https://example.com/logo.png")
+    assert not policy.isAllowed("font", "https://fonts.example.com/a.woff2")
+    assert not policy.isAllowed("stylesheet", "https://example.com/site.css")
+
+def testUrlPatternsAllowThirdPartyRequests():
+    """
+    Validates that configured URL patterns allow requests to other hosts and nothing else does.
+    """
+    policy = RequestPolicy.fromConfig({"allowedUrlPatterns": [r"/schedule"]})
+
+    assert policy.isAllowed("script", "https://www.hopetv.org/app.js", PAGE_URL)
+    assert policy.isAllowed("fetch", "https://api.example.com/schedule?day=2025-02-28", PAGE_URL)
+    assert not policy.isAllowed("script", "https://ads.example.com/tag.js", PAGE_URL)
+    assert not policy.isAllowed("xhr", "http://www.hopetv.org/app.js", PAGE_URL)
+
+def testDefaultPolicyAbortsThirdPartyScripts():
+    """
+    Validates that, without URL patterns, the page loads but a script from another host is aborted.
+    """
+    policy = RequestPolicy()
+    pageRoute = buildRoute("document", PAGE_URL)
+    ownScriptRoute = buildRoute("script", "https://www.hopetv.org/app.js")
+    trackerRoute = buildRoute("script", "https://tracker.example.com/tag.js")
+
+    for route in (pageRoute, ownScriptRoute, trackerRoute):
+        policy.handleRoute(route)
+
+    pageRoute.continue_.assert_called_once()
+    ownScriptRoute.continue_.assert_called_once()
+    trackerRoute.abort.assert_called_once()
+    trackerRoute.continue_.assert_not_called()
+
+def testHandleRouteAbortsBlockedRequests():
+    """
+    Validates that blocked requests are aborted and counted while allowed ones continue.
+    """
+    policy = RequestPolicy()
+    allowedRoute = buildRoute("document", PAGE_URL)
+    blockedRoute = buildRoute("image", "https://www.hopetv.org/logo.png")
+
+    policy.handleRoute(allowedRoute)
+    policy.handleRoute(blockedRoute)
+
+    allowedRoute.continue_.assert_called_once()
+    blockedRoute.abort.assert_called_once()
+    assert policy.blockedRequests == 1
+
+def testAwaitedResponseFromAnotherOriginIsDelivered():
+    """
+    Validates that the response a Hope TV fetcher waits for loads even from another host with no 'requestPolicy'.
+    """
+    scheduleUrl = "https://schedule-api.example.net/v1/schedule?date=2025-02-28"
+
+    for fetcher in (HopeTvDataFetcher(MagicMock()), HopeTvAsyncDataFetcher(MagicMock())):
+        fetcher.configure({})
+        scheduleRoute = buildRoute("fetch", scheduleUrl)
+        trackerRoute = buildRoute("script", "https://tracker.example.com/tag.js")
+
+        fetcher.requestPolicy.handleRoute(scheduleRoute)
+        fetcher.requestPolicy.handleRoute(trackerRoute)
+
+        scheduleRoute.continue_.assert_called_once()
+        scheduleRoute.abort.assert_not_called()
+        trackerRoute.abort.assert_called_once()
+        assert fetcher.requestPolicy.isAllowed("script", "https://cdn.hopetv.org/app.js", PAGE_URL)
@@ -0,0 +1,135 @@
+import json
+import os
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from src.scrapers.core.circuitbreaker import CircuitBreaker
+from src.scrapers.core.httpclient import HttpClient
+from src.scrapers.core.responsecache import ResponseCache
+
+@pytest.fixture
+def responseCache(tmp_path):
+    """
+    Creates a cache in a temporary folder with a mock logger.
+    """
+    return ResponseCache(MagicMock(), str(tmp_path / "cache"), ttl=60, maxBytes=10 * 1024 * 1024)
+
+def buildResponse(statusCode=200, text="", headers=None):
+    response = MagicMock()
+    response.status_code = statusCode
+    response.text = text
+    response.json.side_effect = lambda: json.loads(text)
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+    return response
+
+def testStoreAndLookup(responseCache):
+    """
+    Validates that a stored response is found again with its validators.
+    """
+    responseCache.store("https://example.com/a", None, "body a", "text/html", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    entry = responseCache.lookup("https://example.com/a")
+
+    assert entry["body"] == "body a"
+    assert responseCache.isFresh(entry)
+    assert ResponseCache.conditionalHeaders(entry) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+def testKeyDependsOnHeaders(responseCache):
+    """
+    Validates that the same URL with different headers is cached separately.
+    """
+    responseCache.store("https://example.com/a", {"Accept": "application/json"}, "json body", "application/json")
+
+    assert responseCache.lookup("https://example.com/a") is None
+    assert responseCache.lookup("https://example.com/a", {"accept": "application/json"})["body"] == "json body"
+
+def testIdenticalBodiesAreStoredOnce(responseCache):
+    """
+    Validates that bodies are content-addressed.
+    """
+    responseCache.store("https://example.com/a", None, "same body", "text/html")
+    responseCache.store("https://example.com/b", None, "same body", "text/html")
+
+    blobCount = sum(len(fileNames) for _, _, fileNames in os.walk(responseCache.blobsPath))
+    assert blobCount == 1
+
+def testEvictionRemovesLeastRecentlyUsed(tmp_path):
+    """
+    Validates that the oldest entries are evicted once the size cap is exceeded.
+    """
+    cache = ResponseCache(MagicMock(), str(tmp_path / "cache"), ttl=60, maxBytes=2500)
+    for index in range(3):
+        cache.store(f"https://example.com/{index}", None, os.urandom(600).hex(), "text/plain")
+        entryPath = cache.entryFilePath(cache.buildKey(f"https://example.com/{index}"))
+        os.utime(entryPath, (time.time() - 100 + index, time.time() - 100 + index))
+
+    cache.store("https://example.com/3", None, os.urandom(600).hex(), "text/plain")
+
+    assert cache.lookup("https://example.com/0") is None
+    assert cache.lookup("https://example.com/3") is not None
+    assert cache.computeStoredBytes() <= 2500
+
+@patch("requests.Session.get")
+def testHttpClientServesFreshEntriesWithoutRequest(mockGet, tmp_path):
+    """
+    Validates that a fresh cached response is returned without any request.
+    """
+    httpClient = HttpClient(MagicMock())
+    httpClient.configure({"cache": {"path": str(tmp_path / "cache"), "ttl": 60}})
+    mockGet.return_value = buildResponse(text='{"key": "value"}', headers={"Content-Type": "application/json"})
+
+    firstResult = httpClient.fetchData("https://example.com/data")
+    secondResult = httpClient.fetchData("https://example.com/data")
+
+    assert firstResult == secondResult == {"key": "value"}
+    assert mockGet.call_count == 1
+    assert httpClient.responseCache.hits == 1
+    assert httpClient.responseCache.misses == 1
+
+@patch("requests.Session.get")
+def testHttpClientRevalidatesStaleEntries(mockGet, tmp_path):
+    """
+    Validates that a stale entry is revalidated with a conditional GET and reused on 304.
+    """
+    httpClient = HttpClient(MagicMock())
+    httpClient.configure({"cache": {"path": str(tmp_path / "cache"), "ttl": 0}})
+    mockGet.return_value = buildResponse(text="guide", headers={"Content-Type": "text/html", "ETag": '"abc"'})
+    httpClient.fetchData("https://example.com/guide")
+
+    mockGet.return_value = buildResponse(statusCode=304)
+    result = httpClient.fetchData("https://example.com/guide")
+
+    assert result == "guide"
+    assert mockGet.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert httpClient.responseCache.revalidated == 1
+
+@patch("requests.Session.get")
+def testFailedDownloadsAreCountedAsMisses(mockGet, tmp_path, monkeypatch):
+    """
+    Validates that misses are counted even when the download fails or the entry cannot be revalidated.
+    """
+    monkeypatch.setattr(CircuitBreaker, "_breakers", {})
+    httpClient = HttpClient(MagicMock())
+    httpClient.configure({"cache": {"path": str(tmp_path / "cache"), "ttl": 0}, "http": {"maxRetries": 0}})
+    failedResponse = buildResponse(statusCode=404)
+    failedResponse.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+    mockGet.return_value = failedResponse
+
+    assert httpClient.fetchData("https://example.com/missing") is None
+    mockGet.side_effect = requests.ConnectionError("unreachable")
+    assert httpClient.fetchData("https://example.com/down") is None
+    assert httpClient.responseCache.misses == 2
+
+    # A stale entry without validators is downloaded again
+    mockGet.side_effect = None
+    mockGet.return_value = buildResponse(text="guide", headers={"Content-Type": "text/html"})
+    httpClient.fetchData("https://example.com/guide")
+    httpClient.fetchData("https://example.com/guide")
+
+    assert httpClient.responseCache.misses == 4
+    assert httpClient.responseCache.hits == httpClient.responseCache.revalidated == 0
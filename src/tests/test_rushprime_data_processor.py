@@ -1,3 +1,4 @@
+from datetime import datetime
 import pandas as pd
 from src.scrapers.rushprime.rushprimedataprocessor import RushPrimeDataProcessor
 
@@ -17,3 +18,27 @@ def test_process_data_valid():
     assert "date" in result[0]
     assert "hour" in result[0]
     assert "content" in result[0]
+
+def test_process_data_converts_columns_and_drops_invalid_rows():
+    raw = pd.DataFrame({
+        "Program Start Date": ["3/9/2025", "11/2/2025", "07/29/2025", "", "07/30/2025"],
+        "Program Start Time": ["2:30", "1:30", "25:00", "10:00", "9:05"],
+        "Program Title": ["Nonexistent", "Ambiguous", "Invalid", "No date", "Padded"],
+        "Program Description": ["Synopsis", None, "Synopsis", "Synopsis", " "],
+    })
+
+    processor = RushPrimeDataProcessor("America/New_York")
+    result = processor.processData(raw, "Default Desc", "")
+
+    # DST gaps and repeated hours are read as standard time, like pytz with is_dst=False
+    assert [event.toDict() for event in result] == [
+        {"date": "2025-03-09", "hour": "02:30", "title": "Nonexistent", "content": "Synopsis"},
+        {"date": "2025-11-02", "hour": "01:30", "title": "Ambiguous", "content": "Default Desc"},
+        {"date": "2025-07-30", "hour": "08:05", "title": "Padded", "content": "Default Desc"},
+    ]
+    assert result[0].start == processor.timezoneConverter.convert(datetime(2025, 3, 9, 2, 30))
+
+def test_process_data_without_rows():
+    raw = pd.DataFrame(columns=["Program Start Date", "Program Start Time", "Program Title"])
+
+    assert RushPrimeDataProcessor("UTC").processData(raw, "Default Desc", "") == []
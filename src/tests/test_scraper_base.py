@@ -0,0 +1,161 @@
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+from src.scrapers.core.programevent import ProgramEvent
+from src.scrapers.core.scraperbase import ScraperBase
+from src.scrapers.core.defaulturlformatter import DefaultUrlFormatter
+from src.scrapers.mlb.mlbscraper import MlbScraper
+
+class DummyScraper(ScraperBase):
+    """
+    Minimal concrete scraper used to exercise the ScraperBase helpers.
+    """
+
+    def scrapeProgramGuide(self, startDate, numberOfDays, charReplacements=None):
+        pass
+
+class RecordingFetcher:
+    """
+    Fetcher that echoes the URL back and records the peak number of parallel calls per host.
+    """
+
+    requiresBrowser = False
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+
+    def fetchData(self, url, headers=None):
+        host = url.split("/")[2]
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+        threading.Event().wait(0.01)
+        with self.lock:
+            self.running[host] -= 1
+        return f"data:{url}"
+
+def buildScraper(fetcher, **config):
+    channelConfig = {"url": "https://example.com/", **config}
+    return DummyScraper(channelConfig, DefaultUrlFormatter(), fetcher, MagicMock())
+
+def testFetchAllPreservesUrlOrder():
+    """
+    Validates that each result stays paired with its URL and in the original order.
+    """
+    urls = [f"https://example.com/{day:02}/" for day in range(1, 21)]
+    scraper = buildScraper(RecordingFetcher())
+
+    results = scraper.fetchAll(urls)
+
+    assert [url for url, _ in results] == urls
+    assert all(data == f"data:{url}" for url, data in results)
+
+def testFetchAllRespectsPerHostLimit():
+    """
+    Validates that no host receives more simultaneous requests than 'maxConcurrencyPerHost'.
+    """
+    fetcher = RecordingFetcher()
+    urls = [f"https://a.example.com/{i}/" for i in range(12)] + [f"https://b.example.com/{i}/" for i in range(12)]
+    scraper = buildScraper(fetcher, maxConcurrency=8, maxConcurrencyPerHost=2)
+
+    scraper.fetchAll(urls)
+
+    assert fetcher.peak["a.example.com"] <= 2
+    assert fetcher.peak["b.example.com"] <= 2
+
+def testFetchAllIsSerialForBrowserFetchers():
+    """
+    Validates that browser-based fetchers are never called from several threads at once.
+    """
+    fetcher = RecordingFetcher()
+    fetcher.requiresBrowser = True
+    urls = [f"https://example.com/{i}/" for i in range(5)]
+    scraper = buildScraper(fetcher)
+
+    results = scraper.fetchAll(urls)
+
+    assert len(results) == 5
+    assert fetcher.peak["example.com"] == 1
+
+def testIncrementalModeReusesStoredFinalDates(tmp_path):
+    """
+    Validates that final dates are stored after a run and skipped by the next one.
+    """
+    incremental = {"finalAfterDays": 2, "storePath": str(tmp_path)}
+    firstRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+
+    urls = firstRun.getIncrementalUrls("2020-01-02", 1)
+    for url in urls:
+        firstRun.recordEvents(url, [{"title": url}])
+    firstRun.withStoredEvents({})
+
+    secondRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+
+    assert len(urls) == 3
+    assert secondRun.getIncrementalUrls("2020-01-02", 1) == []
+    assert list(secondRun.withStoredEvents({})) == ["2020-01-01", "2020-01-02", "2020-01-03"]
+
+def testWithoutIncrementalConfigEveryUrlIsFetched():
+    """
+    Validates that the incremental helpers change nothing when the mode is disabled.
+    """
+    scraper = buildScraper(RecordingFetcher())
+
+    assert scraper.getIncrementalUrls("2020-01-02", 1) == scraper.urlGenerator.getDateUrls("2020-01-02", 1)
+    assert scraper.withStoredEvents({"2020-01-02": []}) == {"2020-01-02": []}
+
+def testFailedOrEmptyFinalDatesAreFetchedAgain(tmp_path):
+    """
+    Validates that a final date is only stored when it was fully fetched and has events.
+    """
+    incremental = {"finalAfterDays": 2, "storePath": str(tmp_path)}
+    firstRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+
+    urls = firstRun.getIncrementalUrls("2020-01-02", 1)
+    firstRun.recordEvents(urls[0], [{"title": "Show"}])
+    firstRun.recordEvents(urls[1], [])  # Empty page; urls[2] failed and was never recorded
+    firstRun.withStoredEvents({})
+
+    secondRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+
+    assert secondRun.getIncrementalUrls("2020-01-02", 1) == urls[1:]
+
+def testStoredAndFetchedDatesAreMergedInDateOrder(tmp_path):
+    """
+    Validates that a final date fetched again is placed among the stored dates by date.
+    """
+    incremental = {"finalAfterDays": 2, "storePath": str(tmp_path)}
+    firstRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+    urls = firstRun.getIncrementalUrls("2020-01-02", 1)
+    firstRun.recordEvents(urls[0], [{"title": "First"}])
+    firstRun.recordEvents(urls[2], [{"title": "Third"}])
+    firstRun.withStoredEvents({})
+
+    secondRun = buildScraper(RecordingFetcher(), fileName="dummy", incremental=incremental)
+    secondRun.getIncrementalUrls("2020-01-02", 1)
+
+    assert list(secondRun.withStoredEvents({"2020-01-02": [{"title": "Second"}]})) == ["2020-01-01", "2020-01-02", "2020-01-03"]
+
+def testSingleFileScraperAppliesDedupeSettings():
+    """
+    Validates that a scraper saving a single list of programs honours the channel's 'dedupe' section.
+    """
+    programs = [
+        ProgramEvent.fromStart(datetime(2025, 2, 28, 14, 0), "Game", "Default"),
+        ProgramEvent.fromStart(datetime(2025, 2, 28, 14, 0), "Game", "Yankees at Red Sox"),
+        ProgramEvent.fromStart(datetime(2025, 2, 28, 17, 0), "Recap", "Default"),
+    ]
+    channelConfig = {
+        "url": "https://example.com/", "fileName": "mlb", "outputPath": "out", "defaultDescription": "Default",
+        "dedupe": {"policy": "richer"},
+    }
+    dataProcessor = MagicMock()
+    dataProcessor.processData.return_value = programs
+    scraper = MlbScraper(channelConfig, DefaultUrlFormatter(), MagicMock(), dataProcessor)
+    scraper.saveData = MagicMock()
+
+    scraper.scrapeProgramGuide("2025-02-28", 0, {})
+
+    assert scraper.saveData.call_args.args[1] == [programs[1], programs[2]]
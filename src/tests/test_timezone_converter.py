@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+import pandas as pd
+import pytz
+from src.scrapers.core.timezoneconverter import TimezoneConverter
+
+def buildStarts():
+    """
+    Builds naive datetimes every 7 minutes around the spring and fall DST changes of 2025.
+    """
+    return [
+        firstStart + timedelta(minutes=7 * index)
+        for firstStart in (datetime(2025, 3, 8), datetime(2025, 10, 25), datetime(2025, 11, 1))
+        for index in range(3 * 24 * 60 // 7)
+    ]
+
+def testConvertMatchesPytz():
+    """
+    Validates that cached conversions give the same aware datetimes as localize + astimezone.
+    """
+    sourceZone, targetZone = pytz.timezone("America/New_York"), pytz.timezone("Europe/Amsterdam")
+    converter = TimezoneConverter("America/New_York", "Europe/Amsterdam")
+
+    for start in buildStarts():
+        expected = sourceZone.localize(start).astimezone(targetZone)
+        converted = converter.convert(start)
+        assert (converted, converted.tzname()) == (expected, expected.tzname())
+        assert converter.formatDateHour(converted) == (expected.strftime("%Y-%m-%d"), expected.strftime("%H:%M"))
+
+def testConvertManyAndSeriesMatchConvert():
+    """
+    Validates that the batch and pandas paths agree with single conversions.
+    """
+    converter = TimezoneConverter.forZones("America/New_York")
+    starts = buildStarts()
+
+    expected = [converter.convert(start) for start in starts]
+
+    assert converter.convertMany(starts) == expected
+    assert list(converter.convertSeries(pd.Series(starts))) == expected
+
+def testForZonesSharesConverters():
+    """
+    Validates that processors of the same zones reuse one converter and that Bogota is the default target.
+    """
+    converter = TimezoneConverter.forZones("UTC")
+
+    assert converter is TimezoneConverter.forZones("UTC", "America/Bogota")
+    assert converter.convert(datetime(2025, 2, 28, 5, 0)).strftime("%Y-%m-%d %H:%M") == "2025-02-28 00:00"
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from src.scrapers.core.titantvurlformatter import TitanTvUrlFormatter
+from src.scrapers.my9.my9dataprocessor import My9DataProcessor
+from src.scrapers.my9.my9scraper import My9Scraper
+
+BASE_URL = "https://titantv.example.com/api/schedule/user/lineup/202501010000/300/channel"
+
+class WindowFetcher:
+    """
+    Fetcher that answers each hourly URL with one show per hour over a six-hour window.
+    """
+
+    requiresBrowser = False
+
+    def __init__(self):
+        self.urls = []
+
+    def fetchData(self, url, headers=None):
+        self.urls.append(url)
+        windowStart = datetime.strptime(url.split("/")[7], "%Y%m%d%H%M")
+        shows = [
+            {"StartTime": (windowStart + timedelta(hours=offset)).isoformat(), "Title": [{"Text": f"Show {offset}"}]}
+            for offset in range(6)
+        ]
+        return {"Json": {"Channels": [{"Days": [{"Shows": shows}]}]}}
+
+def testFormatHourUrl():
+    """
+    Validates that the hour window replaces the date segment of the base URL.
+    """
+    url = TitanTvUrlFormatter().formatHourUrl(datetime(2025, 2, 28), 7, BASE_URL)
+
+    assert url == "https://titantv.example.com/api/schedule/user/lineup/202502280700/300/channel"
+
+def testOnlyUncoveredHoursAreRequested():
+    """
+    Validates that each request starts at the last show of the previous window.
+    """
+    fetcher = WindowFetcher()
+    channelConfig = {"url": BASE_URL, "defaultDescription": "", "fileName": "my9", "outputPath": ""}
+    scraper = My9Scraper(channelConfig, TitanTvUrlFormatter(), fetcher, My9DataProcessor("America/New_York"))
+    scraper.saveData = MagicMock()
+
+    scraper.scrapeProgramGuide("2025-02-28", 0, {})
+
+    assert [url.split("/")[7][-4:] for url in fetcher.urls] == ["0000", "0500", "1000", "1500", "2000"]
+    savedData = scraper.saveData.call_args[0][1]
+    assert len(savedData["2025-02-28"]) == 26  # One show per hour up to 01:00 of the next day, overlaps removed
+
+def testPartiallyFetchedDateIsNotStored(tmp_path):
+    """
+    Validates that a final date with a window that failed is fetched again on the next run.
+    """
+    class FailingWindowFetcher(WindowFetcher):
+        def fetchData(self, url, headers=None):
+            return None if url.split("/")[7].endswith("0500") else super().fetchData(url, headers)
+
+    incremental = {"finalAfterDays": 2, "storePath": str(tmp_path)}
+    channelConfig = {"url": BASE_URL, "defaultDescription": "", "fileName": "my9", "outputPath": "", "incremental": incremental}
+
+    def buildScraper(fetcher):
+        scraper = My9Scraper(channelConfig, TitanTvUrlFormatter(), fetcher, My9DataProcessor("America/New_York"))
+        scraper.saveData = MagicMock()
+        return scraper
+
+    buildScraper(FailingWindowFetcher()).scrapeProgramGuide("2020-02-28", 0, {})
+    retryFetcher = WindowFetcher()
+    buildScraper(retryFetcher).scrapeProgramGuide("2020-02-28", 0, {})
+    nextFetcher = WindowFetcher()
+    buildScraper(nextFetcher).scrapeProgramGuide("2020-02-28", 0, {})
+
+    assert retryFetcher.urls
+    assert nextFetcher.urls == []
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+from src.scrapers.core.waitstrategy import WaitStrategy
+
+def testFromConfigOverridesDefaults():
+    """
+    Validates that channel settings override the fetcher defaults and build the backoff.
+    """
+    strategy = WaitStrategy.fromConfig(
+        MagicMock(), {"maxAttempts": 5, "backoff": {"baseDelay": 0.5}},
+        responsePattern="schedule", maxAttempts=3
+    )
+
+    assert strategy.responsePattern.pattern == "schedule"
+    assert strategy.maxAttempts == 5
+    assert strategy.backoff.baseDelay == 0.5
+
+def testSelectorStrategyWaitsForTheSelector():
+    """
+    Validates that navigation only waits for commit and the selector is awaited afterwards.
+    """
+    logger = MagicMock()
+    page = MagicMock()
+    strategy = WaitStrategy(logger, selector="#schedule")
+
+    response = strategy.load(page, "https://example.com/")
+
+    assert response is None
+    page.goto.assert_called_once_with("https://example.com/", wait_until="commit", timeout=strategy.timeout)
+    page.wait_for_selector.assert_called_once_with("#schedule", state="attached", timeout=strategy.timeout)
+    assert "waited" in logger.logInfo.call_args[0][0]
+
+def testResponseStrategyReturnsTheMatchingResponse():
+    """
+    Validates that the awaited response is returned and matched by its URL pattern.
+    """
+    page = MagicMock()
+    expectedResponse = page.expect_response.return_value.__enter__.return_value.value
+    strategy = WaitStrategy(MagicMock(), responsePattern=r"/api/schedule")
+
+    assert strategy.load(page, "https://example.com/") is expectedResponse
+    assert strategy.matchesResponse(MagicMock(url="https://example.com/api/schedule?day=1"))
+    assert not strategy.matchesResponse(MagicMock(url="https://example.com/logo.png"))
+    page.wait_for_load_state.assert_not_called()